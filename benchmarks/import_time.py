@@ -0,0 +1,50 @@
+"""
+Measures the time and memory needed to import the OeREBKRMtrsfr classes in a fresh interpreter: the subset
+used by geolink2oereb compared to the complete generated model.
+
+.. code-block:: shell
+
+  PYTHONPATH=src python benchmarks/import_time.py
+"""
+
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    'geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.subset',
+    'geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes',
+    'geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.generators',
+]
+
+MEASURE = '''
+import resource, sys, time
+import lxml.etree, six
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+import {module}
+duration = time.perf_counter() - start
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+full = 'geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes' in sys.modules
+print(duration, after - before, full)
+'''
+
+
+def measure(module, repeat):
+    durations = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', MEASURE.format(module=module)], text=True)
+        duration, memory, full = output.split()
+        durations.append(float(duration))
+    return statistics.median(durations), int(memory), full == 'True'
+
+
+def main(repeat=5):
+    print('{:<62} {:>10} {:>12} {:>12}'.format('module', 'time [ms]', 'memory [KiB]', 'full model'))
+    for module in MODULES:
+        duration, memory, full = measure(module, repeat)
+        print('{:<62} {:>10.1f} {:>12} {:>12}'.format(module, duration * 1000, memory, str(full)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Measures the memory held by the translated Dokument/Amt pairs: the generated classes compared to the compact
+elements. The documents have a title, an official number and a link in three languages.
+
+.. code-block:: shell
+
+  PYTHONPATH=src python benchmarks/memory.py 20000
+"""
+
+import datetime
+import gc
+import sys
+import tracemalloc
+
+from pyramid_oereb.core.records.document_types import DocumentTypeRecord
+from pyramid_oereb.core.records.documents import DocumentRecord
+from pyramid_oereb.core.records.law_status import LawStatusRecord
+from pyramid_oereb.core.records.office import OfficeRecord
+
+from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.generators import (
+    document_record_to_compact,
+    document_record_to_oerebkrmtrsfr
+)
+
+LANGUAGES = ['de', 'it', 'rm']
+
+
+def document_records(count):
+    office = OfficeRecord(
+        {language: 'Gemeinde {}'.format(language) for language in LANGUAGES},
+        office_at_web={language: 'https://gemeinde.ch/{}'.format(language) for language in LANGUAGES}
+    )
+    document_type = DocumentTypeRecord('Rechtsvorschrift', {'de': 'Rechtsvorschrift'})
+    law_status = LawStatusRecord('inKraft', {'de': 'Rechtskräftig'})
+    for index in range(count):
+        yield DocumentRecord(
+            document_type,
+            index,
+            law_status,
+            {language: 'Zonenplan {} {}'.format(index, language) for language in LANGUAGES},
+            office,
+            datetime.date(2020, 1, 1),
+            official_number={language: '{}.{}'.format(index, language) for language in LANGUAGES},
+            text_at_web={language: 'https://oereblex.ch/{}.{}.pdf'.format(index, language)
+                         for language in LANGUAGES}
+        )
+
+
+def measure(translate, records):
+    gc.collect()
+    tracemalloc.start()
+    result = [translate(record) for record in records]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(count):
+    records = list(document_records(count))
+    print('{:<36} {:>12} {:>16}'.format('representation', 'total [MiB]', 'per pair [bytes]'))
+    for translate in (document_record_to_oerebkrmtrsfr, document_record_to_compact):
+        size = measure(translate, records)
+        print('{:<36} {:>12.1f} {:>16.0f}'.format(translate.__name__, size / 1024 / 1024, size / count))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,162 @@
+"""
+Splits the classes generated by generateDS for ``OeREBKRMtrsfr_V2_0`` into the support code shared by all
+classes (``_support.py``), the small subset used by geolink2oereb (``subset.py``) and the complete model
+(``classes.py``), which imports the subset classes instead of defining them again. Both modules import the
+support code, so there is only one ``GeneratedsSuper`` and one set of the generateDS globals.
+
+It has to be run on a freshly generated ``classes.py``:
+
+.. code-block:: shell
+
+  python scripts/extract_oerebkrmtrsfr_subset.py src/geolink2oereb/lib/interfaces/oerebkrmtrsfr/v2_0
+"""
+
+import ast
+import os
+import re
+import sys
+
+ROOTS = [
+    'HeaderSection',
+    'LocalisationCH_V1_LocalisedText',
+    'LocalisationCH_V1_MultilingualText',
+    'LocalisedTextType',
+    'LocalisedTextType86',
+    'Model',
+    'Models',
+    'OeREBKRM_V2_0_Amt_Amt',
+    'OeREBKRM_V2_0_DokumentTyp',
+    'OeREBKRM_V2_0_Dokumente_Dokument',
+    'OeREBKRM_V2_0_LocalisedUri',
+    'OeREBKRM_V2_0_MultilingualUri',
+    'TextImWebType',
+    'TitelType',
+    'ZustaendigeStelleType',
+]
+
+DATA_CLASSES_MARKER = '#\n# Data representation classes.\n#\n'
+
+SUPPORT_MODULE = 'geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0._support'
+
+SUPPORT_HEADER = '''"""
+The support code of the generated ``OeREBKRMtrsfr_V2_0`` classes: the ``GeneratedsSuper`` base class, the
+helper functions and the generateDS globals. It is imported by
+:mod:`geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.subset` and
+:mod:`geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes`, so all classes share it.
+
+Extracted from the generateDS output by ``scripts/extract_oerebkrmtrsfr_subset.py``, do not edit.
+"""
+'''
+
+SUBSET_HEADER = '''"""
+The subset of the generated ``OeREBKRMtrsfr_V2_0`` classes used by geolink2oereb: the Dokumente, Amt and
+Localisation classes and the transfer header. It is much cheaper to import than the complete model in
+:mod:`geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes`, which imports these classes from here.
+
+Extracted from the generateDS output by ``scripts/extract_oerebkrmtrsfr_subset.py``, do not edit.
+"""
+'''
+
+
+def split_classes(code):
+    preamble, data_classes = code.split(DATA_CLASSES_MARKER, 1)
+    blocks = {}
+    names = []
+    matches = list(re.finditer(r'^class (\w+)\(', data_classes, re.MULTILINE))
+    for index, match in enumerate(matches):
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(data_classes)
+        block = data_classes[match.start():end]
+        end_marker = '# end class {}\n'.format(match.group(1))
+        if end_marker in block:
+            block = block[:block.index(end_marker) + len(end_marker)]
+        blocks[match.group(1)] = block
+        names.append(match.group(1))
+    rest = data_classes[data_classes.index(blocks[names[-1]]) + len(blocks[names[-1]]):]
+    return preamble, names, blocks, rest
+
+
+def support_names(code):
+    """The names defined on the module level of the support code, including the optional imports."""
+    names = []
+    pending = list(ast.parse(code).body)
+    while pending:
+        node = pending.pop(0)
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            names.extend((alias.asname or alias.name).split('.')[0] for alias in node.names)
+        elif isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            names.append(node.name)
+        elif isinstance(node, ast.Assign):
+            names.extend(target.id for target in node.targets if isinstance(target, ast.Name))
+        elif isinstance(node, ast.Try):
+            pending.extend(node.body + node.orelse + node.finalbody)
+            for handler in node.handlers:
+                pending.extend(handler.body)
+        elif isinstance(node, ast.If):
+            pending.extend(node.body + node.orelse)
+    return sorted(set(names))
+
+
+def write_support_import(fh, names, code):
+    # only the used names, some are not defined if the optional generateDS modules are installed
+    used = [name for name in names if re.search(r'\b{}\b'.format(re.escape(name)), code)]
+    fh.write('from {} import (  # noqa: F401\n'.format(SUPPORT_MODULE))
+    for name in used:
+        fh.write('    {},\n'.format(name))
+    fh.write(')\n')
+
+
+def dependencies(names, blocks):
+    known = set(names)
+    selected = set()
+    pending = list(ROOTS)
+    while pending:
+        name = pending.pop()
+        if name in selected:
+            continue
+        selected.add(name)
+        pending.extend(word for word in re.findall(r'\b\w+\b', blocks[name]) if word in known)
+    return [name for name in names if name in selected]
+
+
+def main(directory):
+    path = os.path.join(directory, 'classes.py')
+    with open(path, encoding='utf-8') as fh:
+        code = fh.read()
+    preamble, names, blocks, rest = split_classes(code)
+    subset = dependencies(names, blocks)
+    # the generated module starts with a shebang and the generateDS comment
+    header = preamble[:preamble.index('import sys\n')]
+    support = preamble[len(header):]
+    shared = support_names(support)
+    with open(os.path.join(directory, '_support.py'), 'w', encoding='utf-8') as fh:
+        fh.write(SUPPORT_HEADER)
+        fh.write(support.rstrip('\n') + '\n')
+    with open(os.path.join(directory, 'subset.py'), 'w', encoding='utf-8') as fh:
+        fh.write(SUBSET_HEADER)
+        write_support_import(fh, shared, ''.join(blocks[name] for name in subset))
+        fh.write('\n')
+        fh.write(DATA_CLASSES_MARKER)
+        for name in subset:
+            fh.write('\n\n' + blocks[name].strip('\n') + '\n')
+        fh.write('\n\n__all__ = [\n')
+        for name in subset:
+            fh.write('    "{}",\n'.format(name))
+        fh.write(']\n')
+    with open(path, 'w', encoding='utf-8') as fh:
+        fh.write(header)
+        write_support_import(fh, shared, ''.join(blocks[name] for name in names if name not in subset) + rest)
+        fh.write('\n')
+        fh.write(DATA_CLASSES_MARKER)
+        fh.write('\n# The classes used by geolink2oereb are defined in the subset module.\n')
+        fh.write('from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.subset import (  # noqa: E402,F401\n')
+        for name in subset:
+            fh.write('    {},\n'.format(name))
+        fh.write(')\n')
+        for name in names:
+            if name not in subset:
+                fh.write('\n\n' + blocks[name].strip('\n') + '\n')
+        fh.write(rest)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1])
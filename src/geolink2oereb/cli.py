@@ -1,14 +1,63 @@
 import optparse
 import logging
+import shutil
+import sys
+import tempfile
 
-from io import StringIO
-from geolink2oereb.transform import run
+from geolink2oereb.lib.cache import DiskCache
+from geolink2oereb.lib.concurrency import AdaptiveLimiter
+from geolink2oereb.lib.http import create_recording_session, create_replay_session
+from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.transfer import write_transfer, write_transfer_file
+from geolink2oereb.lib.state import SyncState
+from geolink2oereb.transform import BatchError, Geolink2OerebSession, assign_uuids_iter, unify_gathered_iter
 
 logging.basicConfig(level="DEBUG", format="%(asctime)s [%(levelname)s] %(message)s")
 
 log = logging.getLogger(__name__)
 
 
+def read_geolink_ids(fh):
+    """
+    Reads geolink IDs from a file with one ID per line. Empty lines and lines starting with # are ignored.
+
+    Args:
+        fh (file): The opened file.
+
+    Returns:
+        list of int: The IDs.
+
+    Raises:
+        ValueError: If a line does not contain a valid ID.
+    """
+    geolink_ids = []
+    for line_number, line in enumerate(fh, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            geolink_ids.append(int(line))
+        except ValueError:
+            raise ValueError('Invalid geolink ID in line {}: {}'.format(line_number, line))
+    return geolink_ids
+
+
+def skip_failed(gathered, errors):
+    """
+    Passes the Dokument/Amt pairs through and collects the failed geolinks instead of raising.
+
+    Args:
+        gathered (iterable of tuple): The pairs, e.g. from ``run_batch_iter``.
+        errors (dict): The dict the exception per failed geolink ID is added to.
+
+    Yields:
+        (tuple): The pairs of the geolinks which were processed successfully.
+    """
+    try:
+        yield from gathered
+    except BatchError as e:
+        errors.update(e.errors)
+
+
 def geolink2oereb():
     parser = optparse.OptionParser(
         usage="usage: %prog [options]",
@@ -17,10 +66,73 @@ def geolink2oereb():
     parser.add_option(
         "-l",
         "--geolink_id",
-        dest="geolink_id",
+        dest="geolink_ids",
         metavar="GEOLINKID",
         type="int",
-        help="The the ID to load the documents for.",
+        action="append",
+        default=[],
+        help="The the ID to load the documents for. It can be passed multiple times.",
+    )
+    parser.add_option(
+        "-f",
+        "--geolink-ids-file",
+        dest="geolink_ids_file",
+        metavar="FILE",
+        default=None,
+        help="A file with one ID per line to load the documents for. Pass - to read the IDs from stdin.",
+    )
+    parser.add_option(
+        "-w",
+        "--workers",
+        dest="workers",
+        metavar="N",
+        type="int",
+        default=1,
+        help="The number of IDs which are processed concurrently (default is: 1).",
+    )
+    parser.add_option(
+        "--processes",
+        dest="processes",
+        metavar="N",
+        type="int",
+        default=1,
+        help="The number of worker processes the IDs are distributed to. --workers is the number of IDs "
+             "processed concurrently per process then (default is: 1).",
+    )
+    parser.add_option(
+        "--transform-workers",
+        dest="transform_workers",
+        metavar="N",
+        type="int",
+        default=None,
+        help="If set, fetching and transforming run as separate stages: --workers IDs are fetched while N "
+             "IDs are transformed at the same time.",
+    )
+    parser.add_option(
+        "--queue-size",
+        dest="queue_size",
+        metavar="N",
+        type="int",
+        default=8,
+        help="The number of IDs which can wait in front of each stage with --transform-workers "
+             "(default is: 8).",
+    )
+    parser.add_option(
+        "--adaptive-concurrency",
+        dest="adaptive_concurrency",
+        action="store_true",
+        default=False,
+        help="Adapt the number of concurrent ÖREBlex requests to the response times and overload responses "
+             "of the server. --workers is the upper bound then.",
+    )
+    parser.add_option(
+        "--target-latency",
+        dest="target_latency",
+        metavar="SECONDS",
+        type="float",
+        default=2.0,
+        help="The response time up to which --adaptive-concurrency raises the number of concurrent "
+             "requests (default is: 2).",
     )
     parser.add_option(
         "-t",
@@ -67,30 +179,153 @@ def geolink2oereb():
         "--outfile-path",
         dest="outfile_path",
         default=None,
-        help="The absolute path where the output will be written to."
-             "If omitted, the output will be printed as command output to the console.",
+        help="The absolute path where the output will be written to. It is replaced only once the transfer "
+             "is complete. If omitted, the output will be printed as command output to the console.",
+    )
+    parser.add_option(
+        "--skip-failed",
+        dest="skip_failed",
+        action="store_true",
+        default=False,
+        help="Write the transfer without the IDs which could not be processed. By default nothing is "
+             "written if an ID fails. In both cases the failed IDs are logged and the exit status is 1.",
+    )
+
+    parser.add_option(
+        "--cache-dir",
+        dest="cache_dir",
+        default=None,
+        help="The directory where the ÖREBlex responses are cached. Cached responses are revalidated "
+             "with conditional requests. If omitted, nothing is cached.",
+    )
+
+    parser.add_option(
+        "--record-dir",
+        dest="record_dir",
+        default=None,
+        help="The directory where every ÖREBlex exchange is recorded to replay it later with --replay-dir.",
+    )
+    parser.add_option(
+        "--replay-dir",
+        dest="replay_dir",
+        default=None,
+        help="The directory containing ÖREBlex exchanges recorded with --record-dir. They are served "
+             "instead of requesting ÖREBlex, so no network access is needed.",
+    )
+    parser.add_option(
+        "--replay-latency",
+        dest="replay_latency",
+        type="float",
+        default=0,
+        help="Seconds each replayed response is delayed to simulate the network (default is: 0).",
+    )
+    parser.add_option(
+        "--incremental",
+        dest="incremental",
+        action="store_true",
+        default=False,
+        help="Only transform IDs whose ÖREBlex responses changed since the last run with the same "
+             "--state-file. The elements of unchanged IDs are taken from the state file without parsing "
+             "the responses.",
+    )
+    parser.add_option(
+        "--state-file",
+        dest="state_file",
+        default=None,
+        help="The SQLite file which keeps the state of --incremental runs. It is created if it does not "
+             "exist.",
+    )
+    parser.add_option(
+        "--uuid-namespace",
+        dest="uuid_namespace",
+        default=None,
+        help="A UUID used as namespace to derive the TIDs from the content of the elements, so they are "
+             "stable across runs. If omitted, random TIDs are assigned.",
     )
 
     options, args = parser.parse_args()
-    oerebkrmtrsfr = run(
-        options.geolink_id,
-        options.theme_code,
+    if options.record_dir and options.replay_dir:
+        parser.error("--record-dir and --replay-dir can not be used together")
+    if options.incremental and not options.state_file:
+        parser.error("--incremental needs a --state-file")
+    if options.transform_workers and options.processes > 1:
+        parser.error("--transform-workers and --processes can not be used together")
+    geolink_ids = list(options.geolink_ids)
+    try:
+        if options.geolink_ids_file == '-':
+            geolink_ids.extend(read_geolink_ids(sys.stdin))
+        elif options.geolink_ids_file is not None:
+            with open(options.geolink_ids_file, encoding="utf-8") as fh:
+                geolink_ids.extend(read_geolink_ids(fh))
+    except ValueError as e:
+        parser.error(str(e))
+    if not geolink_ids:
+        parser.error("at least one ID has to be passed with --geolink_id or --geolink-ids-file")
+    # every ID is processed only once, the order of first occurrence is kept
+    geolink_ids = list(dict.fromkeys(geolink_ids))
+    http_session = None
+    if options.record_dir:
+        http_session = create_recording_session(options.record_dir)
+    elif options.replay_dir:
+        http_session = create_replay_session(options.replay_dir, latency=options.replay_latency)
+    limiter = None
+    if options.adaptive_concurrency:
+        # every worker reads all languages at the same time
+        limiter = AdaptiveLimiter(max_limit=options.workers * 5, target_latency=options.target_latency)
+    session = Geolink2OerebSession(
         options.pyramid_oereb_config_path,
         options.section,
         options.source_class_path,
         options.c2ctemplate_style,
+        http_session=http_session,
+        # one connection per worker and language
+        pool_size=max(10, options.workers * 5),
+        cache=DiskCache(options.cache_dir) if options.cache_dir else None,
+        compact=True,
+        limiter=limiter,
+        state=SyncState(options.state_file) if options.incremental else None,
     )
-    out_string_list = []
-
-    for lexlink_group in oerebkrmtrsfr:
-        for element in lexlink_group:
-            output = StringIO()
-            element.export(output, 0, namespacedef_=None)
-            out_string_list.append(output.getvalue())
-            output.close()
-    out_string = '\n'.join(out_string_list)
-    if options.outfile_path is None:
-        print(out_string)
+    if options.transform_workers:
+        gathered = session.run_pipeline(
+            geolink_ids,
+            options.theme_code,
+            fetch_workers=options.workers,
+            transform_workers=options.transform_workers,
+            queue_size=options.queue_size
+        )
     else:
-        with open(options.outfile_path, mode="w+") as fh:
-            fh.write(out_string)
+        gathered = session.run_batch_iter(
+            geolink_ids,
+            options.theme_code,
+            max_workers=options.workers,
+            processes=options.processes
+        )
+    errors = {}
+    if options.skip_failed:
+        gathered = skip_failed(gathered, errors)
+    assigned = assign_uuids_iter(unify_gathered_iter(gathered), namespace=options.uuid_namespace)
+    try:
+        if options.outfile_path is None:
+            # the transfer is printed only once it is complete
+            with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as fh:
+                write_transfer(fh, assigned)
+                fh.seek(0)
+                shutil.copyfileobj(fh, sys.stdout)
+        else:
+            write_transfer_file(options.outfile_path, assigned)
+    except BatchError as e:
+        log.error("No transfer was written, processing failed for geolink(s): %s",
+                  ", ".join(str(geolink_id) for geolink_id in e.errors))
+        sys.exit(1)
+    finally:
+        # the requests and geolinks of worker processes are counted there
+        if limiter is not None and options.processes <= 1:
+            log.info("ÖREBlex requests: %s", limiter.stats)
+        if session.state is not None:
+            if options.processes <= 1:
+                log.info("Incremental run: %s", session.state.stats)
+            session.state.close()
+    if errors:
+        log.error("The transfer was written without the failed geolink(s): %s",
+                  ", ".join(str(geolink_id) for geolink_id in errors))
+        sys.exit(1)
@@ -0,0 +1,245 @@
+"""
+Caches used while loading documents from ÖREBlex.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+CacheEntry = namedtuple('CacheEntry', ['content', 'etag', 'last_modified', 'stored_at'])
+"""A cached response: the raw body, its validators and the time it was stored or last revalidated."""
+
+
+class DiskCache(object):
+    """
+    A persistent cache for raw geoLink responses. Each entry stores the response body together with its
+    ``ETag`` and ``Last-Modified`` headers, so it can be revalidated with a conditional request.
+
+    Entries which were not stored or revalidated within ``ttl`` seconds are evicted. If the cache grows
+    beyond ``max_size`` bytes, the least recently used entries are evicted.
+
+    Args:
+        directory (str): The directory the entries are written to. It is created if it does not exist.
+        ttl (int or None): The time to live of an entry in seconds. If None, entries do not expire
+            (Default: 7 days).
+        max_size (int or None): The maximum size of all cached bodies in bytes. If None, the size is not
+            limited (Default: 256 MiB).
+    """
+
+    def __init__(self, directory, ttl=7 * 24 * 60 * 60, max_size=256 * 1024 * 1024):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._size = None
+        os.makedirs(directory, exist_ok=True)
+
+    def __getstate__(self):
+        # the lock can not be pickled, each process uses its own
+        return {'directory': self.directory, 'ttl': self.ttl, 'max_size': self.max_size}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._size = None
+
+    def _path(self, key):
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest)
+
+    def _remove(self, path):
+        for suffix in ('.json', '.xml'):
+            try:
+                os.remove(path + suffix)
+            except FileNotFoundError:
+                pass
+
+    def _write(self, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+
+    def _expired(self, stored_at):
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def get(self, key):
+        """
+        Returns the cached entry for the passed key.
+
+        Args:
+            key (list or tuple): The JSON serializable key of the entry.
+
+        Returns:
+            CacheEntry or None: The entry or None if there is no valid entry for the key.
+        """
+        path = self._path(key)
+        try:
+            with open(path + '.json', encoding='utf-8') as fh:
+                meta = json.load(fh)
+            with open(path + '.xml', 'rb') as fh:
+                content = fh.read()
+        except (FileNotFoundError, ValueError):
+            return None
+        if self._expired(meta['stored_at']):
+            self._remove(path)
+            return None
+        # the modification time of the body is used to find the least recently used entries
+        try:
+            os.utime(path + '.xml')
+        except FileNotFoundError:
+            pass
+        return CacheEntry(content, meta.get('etag'), meta.get('last_modified'), meta['stored_at'])
+
+    def set(self, key, content, etag=None, last_modified=None):
+        """
+        Stores a response for the passed key.
+
+        Args:
+            key (list or tuple): The JSON serializable key of the entry.
+            content (bytes): The response body.
+            etag (str or None): The ``ETag`` header of the response.
+            last_modified (str or None): The ``Last-Modified`` header of the response.
+        """
+        path = self._path(key)
+        meta = {'key': key, 'etag': etag, 'last_modified': last_modified, 'stored_at': time.time()}
+        try:
+            replaced_size = os.stat(path + '.xml').st_size
+        except FileNotFoundError:
+            replaced_size = 0
+        self._write(path + '.xml', content)
+        self._write(path + '.json', json.dumps(meta).encode('utf-8'))
+        if self.max_size is None:
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size += len(content) - replaced_size
+            exceeded = self._size is None or self._size > self.max_size
+        if exceeded:
+            self.evict()
+
+    def touch(self, key):
+        """
+        Marks the entry for the passed key as revalidated, which restarts its time to live.
+
+        Args:
+            key (list or tuple): The JSON serializable key of the entry.
+        """
+        path = self._path(key)
+        try:
+            with open(path + '.json', encoding='utf-8') as fh:
+                meta = json.load(fh)
+        except (FileNotFoundError, ValueError):
+            return
+        meta['stored_at'] = time.time()
+        self._write(path + '.json', json.dumps(meta).encode('utf-8'))
+
+    def evict(self):
+        """
+        Removes the expired entries and, if the cache is still too big, the least recently used ones until
+        the cache is filled to 90% of ``max_size``.
+        """
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.directory):
+                if not name.endswith('.json'):
+                    continue
+                path = os.path.join(self.directory, name[:-len('.json')])
+                try:
+                    with open(path + '.json', encoding='utf-8') as fh:
+                        stored_at = json.load(fh)['stored_at']
+                    body = os.stat(path + '.xml')
+                except (FileNotFoundError, ValueError, KeyError):
+                    continue
+                if self._expired(stored_at):
+                    self._remove(path)
+                else:
+                    entries.append((body.st_mtime, body.st_size, path))
+            size = sum(entry[1] for entry in entries)
+            if self.max_size is not None and size > self.max_size:
+                for mtime, entry_size, path in sorted(entries):
+                    if size <= self.max_size * 0.9:
+                        break
+                    logging.debug(f"Evicting {path} from the geoLink cache")
+                    self._remove(path)
+                    size -= entry_size
+            self._size = size
+
+
+class LRUCache(object):
+    """
+    A thread safe in-memory cache which keeps the ``maxsize`` most recently used entries. It counts hits,
+    misses and evictions.
+
+    Args:
+        maxsize (int): The maximum number of entries.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key):
+        """
+        Returns the cached value for the passed key.
+
+        Args:
+            key (hashable): The key of the entry.
+
+        Returns:
+            The cached value or None if there is no entry for the key.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key, value):
+        """
+        Stores a value and evicts the least recently used entry if the cache is full.
+
+        Args:
+            key (hashable): The key of the entry.
+            value: The value to cache.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """
+        Removes all entries. The counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self):
+        """
+        Returns:
+            dict: The number of ``hits``, ``misses`` and ``evictions`` and the current ``size``.
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'size': len(self._entries)
+            }
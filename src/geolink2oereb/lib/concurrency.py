@@ -0,0 +1,329 @@
+"""
+Helpers to coordinate concurrent requests to ÖREBlex.
+"""
+
+import asyncio
+import math
+import queue
+import threading
+import time
+from collections import deque
+
+_STOP = object()
+
+
+class _Call(object):
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Deduplicates concurrent calls with the same key: while a call for a key is in flight, further callers
+    for that key wait for it and receive its result (or its exception) instead of calling again.
+
+    The threaded (:meth:`do`) and the asynchronous (:meth:`do_async`) calls are tracked separately.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._futures = {}
+        self._shared = 0
+
+    @property
+    def shared(self):
+        """
+        Returns:
+            int: The number of calls which were served by an in-flight call instead of calling again.
+        """
+        return self._shared
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        Calls ``fn(*args, **kwargs)`` unless a call with the same key is in flight already.
+
+        Args:
+            key (hashable): The key identifying equal calls.
+            fn (callable): The function to call.
+
+        Returns:
+            The result of the call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self._shared += 1
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    async def do_async(self, key, fn, *args, **kwargs):
+        """
+        Asynchronous variant of :meth:`do`. It has to be used from one event loop only. A cancelled caller
+        does not cancel the call as long as other callers wait for it. The call is cancelled once all of
+        them are cancelled.
+
+        Args:
+            key (hashable): The key identifying equal calls.
+            fn (callable): The coroutine function to call.
+
+        Returns:
+            The result of the call.
+        """
+        flight = self._futures.get(key)
+        if flight is None:
+            flight = [asyncio.ensure_future(fn(*args, **kwargs)), 0]
+            self._futures[key] = flight
+        else:
+            self._shared += 1
+        future = flight[0]
+        flight[1] += 1
+        try:
+            return await asyncio.shield(future)
+        finally:
+            flight[1] -= 1
+            if flight[1] == 0:
+                if self._futures.get(key) is flight:
+                    del self._futures[key]
+                if not future.done():
+                    future.cancel()
+                    await asyncio.wait([future])
+
+
+class AdaptiveLimiter(object):
+    """
+    Limits the number of concurrent requests and adapts the limit to what the server sustains (additive
+    increase, multiplicative decrease). Each response within ``target_latency`` raises the limit by one per
+    ``limit`` responses. An overloaded response (e.g. ``429`` or ``5xx``) or one slower than
+    ``target_latency`` multiplies the limit with ``decrease``. Responses to requests which were started
+    before the last decrease do not decrease it again, so one overload does not cut the limit once per
+    request in flight.
+
+    Args:
+        initial_limit (int): The limit to start with (Default: 4).
+        min_limit (int): The lowest limit (Default: 1).
+        max_limit (int): The highest limit (Default: 64).
+        target_latency (float): The response time in seconds up to which the limit is raised (Default: 2).
+        decrease (float): The factor the limit is multiplied with on overload (Default: 0.5).
+        window (int): The number of recent response times the percentiles are calculated of
+            (Default: 200).
+    """
+
+    def __init__(self, initial_limit=4, min_limit=1, max_limit=64, target_latency=2.0, decrease=0.5,
+                 window=200):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.decrease = decrease
+        self.window = window
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._epoch = 0
+        self._latencies = deque(maxlen=window)
+        self._condition = threading.Condition()
+
+    def __getstate__(self):
+        # each process adapts its own limit
+        return {
+            'initial_limit': int(self._limit),
+            'min_limit': self.min_limit,
+            'max_limit': self.max_limit,
+            'target_latency': self.target_latency,
+            'decrease': self.decrease,
+            'window': self.window,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @property
+    def limit(self):
+        """
+        Returns:
+            int: The current number of requests which may run at the same time.
+        """
+        return int(self._limit)
+
+    @property
+    def stats(self):
+        """
+        Returns:
+            dict: The current ``limit``, the requests ``in_flight`` and the median (``p50``) and 95th
+                percentile (``p95``) of the recent response times in seconds, None if there were none yet.
+        """
+        with self._condition:
+            latencies = sorted(self._latencies)
+            in_flight = self._in_flight
+        return {
+            'limit': self.limit,
+            'in_flight': in_flight,
+            'p50': _percentile(latencies, 0.5),
+            'p95': _percentile(latencies, 0.95),
+        }
+
+    def acquire(self):
+        """
+        Waits until the number of requests in flight is below the limit.
+
+        Returns:
+            int: The token which has to be passed to :meth:`release`.
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+            return self._epoch
+
+    def release(self, token, latency, overloaded=False):
+        """
+        Ends a request and adapts the limit to its outcome.
+
+        Args:
+            token (int): The token returned by :meth:`acquire`.
+            latency (float): The response time in seconds.
+            overloaded (bool): True if the server signalled overload (Default: False).
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self._latencies.append(latency)
+            if overloaded or latency > self.target_latency:
+                if token == self._epoch:
+                    self._epoch += 1
+                    self._limit = max(self.min_limit, self._limit * self.decrease)
+            else:
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+    def call(self, fn, *args, is_overload=None, **kwargs):
+        """
+        Calls ``fn(*args, **kwargs)`` as one limited request.
+
+        Args:
+            fn (callable): The function sending the request.
+            is_overload (callable or None): Called with an exception raised by ``fn``, returns True if it
+                signals overload. If None, no exception counts as overload.
+
+        Returns:
+            The result of the call.
+        """
+        token = self.acquire()
+        start = time.monotonic()
+        overloaded = False
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            overloaded = is_overload is not None and is_overload(e)
+            raise
+        finally:
+            self.release(token, time.monotonic() - start, overloaded)
+
+
+def _percentile(ordered, fraction):
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(math.ceil(fraction * len(ordered))) - 1)]
+
+
+def _run_stage(fn, inbox, outbox, cancelled):
+    while True:
+        task = inbox.get()
+        if task is _STOP:
+            return
+        position, item, value, error = task
+        if error is None and not cancelled.is_set():
+            try:
+                value = fn(value)
+            except Exception as e:
+                value, error = None, e
+        outbox.put((position, item, value, error))
+
+
+def ordered_pipeline(items, stages, queue_size=8):
+    """
+    Passes each item through a chain of stages. Every stage runs in its own threads and the stages are
+    connected by bounded queues, so e.g. one stage waits for the network while the next one uses the CPU
+    for other items. The results are yielded in the order of the items.
+
+    Only a limited number of items is taken from ``items`` ahead of the consumer: the threads of all stages
+    plus ``queue_size`` per stage. A slow consumer or stage therefore holds back the stages before it.
+
+    An exception raised by a stage does not stop the pipeline, it is yielded with the item and the
+    following stages are skipped for that item.
+
+    Args:
+        items (iterable): The items to process.
+        stages (list of tuple): The function and the number of threads of each stage. The first function
+            is called with the item, each further function with the result of the previous one.
+        queue_size (int): The number of items which can wait in front of each stage (Default: 8).
+
+    Yields:
+        (tuple): tuple containing:
+            The item.
+            (tuple): The result of the last stage and None, or None and the exception of the failed stage.
+    """
+    inboxes = [queue.Queue(queue_size) for _ in stages]
+    # the consumer limits the items in flight, so the output queue is bounded as well
+    outbox = queue.Queue()
+    cancelled = threading.Event()
+    threads = []
+    for index, (fn, workers) in enumerate(stages):
+        target = inboxes[index + 1] if index + 1 < len(stages) else outbox
+        stage_threads = [
+            threading.Thread(target=_run_stage, args=(fn, inboxes[index], target, cancelled), daemon=True)
+            for _ in range(workers)
+        ]
+        for thread in stage_threads:
+            thread.start()
+        threads.append(stage_threads)
+    max_in_flight = sum(workers for fn, workers in stages) + queue_size * len(stages)
+    items = iter(items)
+    exhausted = False
+    submitted = 0
+    next_position = 0
+    done = {}
+    try:
+        while True:
+            while not exhausted and submitted - next_position < max_in_flight:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    exhausted = True
+                    break
+                inboxes[0].put((submitted, item, item, None))
+                submitted += 1
+            if next_position == submitted:
+                return
+            while next_position not in done:
+                position, item, value, error = outbox.get()
+                done[position] = (item, value, error)
+            item, value, error = done.pop(next_position)
+            next_position += 1
+            yield item, (value, None) if error is None else (None, error)
+    finally:
+        # items which are still in flight when the consumer stops early are passed through unprocessed
+        cancelled.set()
+        for inbox, stage_threads in zip(inboxes, threads):
+            for _ in stage_threads:
+                inbox.put(_STOP)
+            for thread in stage_threads:
+                thread.join()
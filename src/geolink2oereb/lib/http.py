@@ -0,0 +1,345 @@
+"""
+Helpers for the HTTP communication with ÖREBlex. The synchronous session is based on ``requests``, the
+asynchronous client is based on `aiohttp <https://docs.aiohttp.org>`_ which is imported only when it is used.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from functools import partial
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# the seconds after which a request to ÖREBlex fails if the server does not answer
+DEFAULT_TIMEOUT = 30
+
+
+class PooledSession(requests.Session):
+    """
+    A ``requests`` session which keeps the connections to the hosts alive and reuses them. One session is
+    meant to be shared by all threads reading from ÖREBlex.
+
+    Args:
+        pool_size (int): The maximum number of connections which are kept open per host. It should not be
+            lower than the number of threads using the session at the same time (Default: 10).
+        adapter (requests.adapters.BaseAdapter or None): The transport adapter used for all requests. If
+            None, a pooled ``HTTPAdapter`` is used (Default: None).
+    """
+
+    # the adapter is kept when the session is pickled to be passed to other processes
+    __attrs__ = requests.Session.__attrs__ + ['adapter']
+
+    def __init__(self, pool_size=10, adapter=None):
+        super(PooledSession, self).__init__()
+        if adapter is None:
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.adapter = adapter
+        self.mount('http://', self.adapter)
+        self.mount('https://', self.adapter)
+
+    @property
+    def stats(self):
+        """
+        Counters of the open connection pools. If ``connections`` stays below ``requests``, connections
+        were reused.
+
+        Returns:
+            dict: The number of ``requests`` sent and the number of ``connections`` opened.
+        """
+        stats = {'requests': 0, 'connections': 0}
+        poolmanager = getattr(self.adapter, 'poolmanager', None)
+        if poolmanager is None:
+            return stats
+        pools = poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                stats['requests'] += pool.num_requests
+                stats['connections'] += pool.num_connections
+        return stats
+
+
+def recording_key(url):
+    """
+    Returns the file name of a recorded exchange. The order of the query parameters is irrelevant.
+
+    Args:
+        url (str): The requested URL including the query string.
+
+    Returns:
+        str: The file name without suffix.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    normalized = urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    A transport adapter which sends the requests like the pooled ``HTTPAdapter`` and writes every exchange
+    to a directory, so it can be served by :class:`ReplayAdapter` later. Conditional request headers are
+    removed, so the complete bodies are recorded.
+
+    Args:
+        directory (str): The directory the exchanges are written to. It is created if it does not exist.
+        pool_size (int): The maximum number of connections which are kept open per host (Default: 10).
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ['directory']
+
+    def __init__(self, directory, pool_size=10):
+        super(RecordingAdapter, self).__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _write(self, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+
+    def send(self, request, **kwargs):
+        request.headers.pop('If-None-Match', None)
+        request.headers.pop('If-Modified-Since', None)
+        response = super(RecordingAdapter, self).send(request, **kwargs)
+        path = os.path.join(self.directory, recording_key(request.url))
+        meta = {
+            'url': request.url,
+            'status_code': response.status_code,
+            'reason': response.reason,
+            'headers': dict(response.headers)
+        }
+        self._write(path + '.body', response.content)
+        self._write(path + '.json', json.dumps(meta).encode('utf-8'))
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    A transport adapter which serves the exchanges recorded by :class:`RecordingAdapter` without any
+    network access. Requests which were not recorded are answered with ``404 Not Recorded``.
+
+    Args:
+        directory (str): The directory containing the recorded exchanges.
+        latency (float): Seconds each response is delayed to simulate the network (Default: 0).
+    """
+
+    def __init__(self, directory, latency=0):
+        super(ReplayAdapter, self).__init__()
+        self.directory = directory
+        self.latency = latency
+
+    def send(self, request, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        path = os.path.join(self.directory, recording_key(request.url))
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        try:
+            with open(path + '.json', encoding='utf-8') as fh:
+                meta = json.load(fh)
+            with open(path + '.body', 'rb') as fh:
+                response._content = fh.read()
+            response._content_consumed = True
+        except FileNotFoundError:
+            response.status_code = 404
+            response.reason = 'Not Recorded'
+            response._content = b''
+            return response
+        response.status_code = meta['status_code']
+        response.reason = meta['reason']
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def close(self):
+        pass
+
+
+def create_recording_session(directory, pool_size=10):
+    """
+    Creates a pooled session which records every exchange to the passed directory.
+
+    Args:
+        directory (str): The directory the exchanges are written to.
+        pool_size (int): The maximum number of connections which are kept open per host (Default: 10).
+
+    Returns:
+        PooledSession: The session.
+    """
+    return PooledSession(adapter=RecordingAdapter(directory, pool_size=pool_size))
+
+
+def create_replay_session(directory, latency=0):
+    """
+    Creates a session which serves the exchanges recorded in the passed directory.
+
+    Args:
+        directory (str): The directory containing the recorded exchanges.
+        latency (float): Seconds each response is delayed to simulate the network (Default: 0).
+
+    Returns:
+        PooledSession: The session.
+    """
+    return PooledSession(adapter=ReplayAdapter(directory, latency=latency))
+
+
+def conditional_headers(entry):
+    """
+    Builds the headers to revalidate a cached response.
+
+    Args:
+        entry (geolink2oereb.lib.cache.CacheEntry or None): The cached response.
+
+    Returns:
+        dict: The ``If-None-Match`` and ``If-Modified-Since`` headers as far as the validators are known.
+    """
+    headers = {}
+    if entry is not None:
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+    return headers
+
+
+def is_overload(error):
+    """
+    Tells whether a failed request signals that the server is overloaded: it answered with ``429 Too Many
+    Requests`` or a ``5xx`` status, or it did not answer in time.
+
+    Args:
+        error (Exception): The exception raised by the request.
+
+    Returns:
+        bool: True if the server is considered overloaded.
+    """
+    if isinstance(error, requests.Timeout):
+        return True
+    response = getattr(error, 'response', None)
+    if not isinstance(error, requests.HTTPError) or response is None:
+        return False
+    return response.status_code == 429 or response.status_code >= 500
+
+
+def fetch(session, url, params=None, proxies=None, auth=None, cache=None, cache_key=None, timeout=None):
+    """
+    Requests the passed URL and returns the raw response body. If a cache is passed, a cached response is
+    revalidated with a conditional request and reused if the server answers with ``304 Not Modified``.
+
+    Args:
+        session (requests.Session or None): The session to use. If None, a new connection is opened for
+            the request.
+        url (str): The URL to request.
+        params (dict or None): The query parameters.
+        proxies (dict or None): The proxy per URL scheme.
+        auth (requests.auth.HTTPBasicAuth or None): Optional credentials for basic authentication.
+        cache (geolink2oereb.lib.cache.DiskCache or None): The cache for the response.
+        cache_key (list or tuple or None): The key of the response in the cache.
+        timeout (float or None): The seconds to wait for the server. If None, the request waits forever.
+
+    Returns:
+        bytes: The response body.
+
+    Raises:
+        requests.HTTPError: Raised on failed HTTP request.
+        requests.Timeout: Raised if the server did not answer within the timeout.
+    """
+    entry = cache.get(cache_key) if cache is not None else None
+    get = requests.get if session is None else session.get
+    response = get(
+        url,
+        params=params,
+        proxies=proxies,
+        auth=auth,
+        headers=conditional_headers(entry),
+        timeout=timeout
+    )
+    if entry is not None and response.status_code == 304:
+        cache.touch(cache_key)
+        return entry.content
+    response.raise_for_status()
+    if cache is not None:
+        cache.set(
+            cache_key,
+            response.content,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+    return response.content
+
+
+def create_async_client(limit=10):
+    """
+    Creates a pooled asynchronous HTTP client. The client has to be created and closed within a running
+    event loop, ideally by using it as an async context manager.
+
+    Args:
+        limit (int): The maximum number of simultaneously open connections (Default: 10).
+
+    Returns:
+        aiohttp.ClientSession: The client.
+    """
+    import aiohttp
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=limit))
+
+
+async def fetch_async(client, url, params=None, proxies=None, auth=None, cache=None, cache_key=None,
+                      timeout=None):
+    """
+    Asynchronous variant of :func:`fetch`. The cache is read and written in the default executor of the
+    running event loop, so its file I/O does not block the loop.
+
+    Args:
+        client (aiohttp.ClientSession): The client to use.
+        url (str): The URL to request.
+        params (dict or None): The query parameters.
+        proxies (dict or None): The proxy per URL scheme as it is configured for ``requests``.
+        auth (requests.auth.HTTPBasicAuth or None): Optional credentials for basic authentication.
+        cache (geolink2oereb.lib.cache.DiskCache or None): The cache for the response.
+        cache_key (list or tuple or None): The key of the response in the cache.
+        timeout (float or None): The seconds to wait for the complete response. If None, the timeout of the
+            client applies.
+
+    Returns:
+        bytes: The response body.
+
+    Raises:
+        aiohttp.ClientResponseError: Raised on failed HTTP request.
+        asyncio.TimeoutError: Raised if the response was not received within the timeout.
+    """
+    import aiohttp
+    loop = asyncio.get_running_loop()
+    entry = await loop.run_in_executor(None, cache.get, cache_key) if cache is not None else None
+    kwargs = {'headers': conditional_headers(entry)}
+    if proxies:
+        proxy = proxies.get(urlsplit(url).scheme)
+        if proxy:
+            kwargs['proxy'] = proxy
+    if auth is not None:
+        kwargs['auth'] = aiohttp.BasicAuth(auth.username, auth.password)
+    if timeout is not None:
+        kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+    async with client.get(url, params=params, **kwargs) as response:
+        if entry is not None and response.status == 304:
+            await loop.run_in_executor(None, cache.touch, cache_key)
+            return entry.content
+        response.raise_for_status()
+        content = await response.read()
+        if cache is not None:
+            await loop.run_in_executor(None, partial(
+                cache.set,
+                cache_key,
+                content,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            ))
+        return content
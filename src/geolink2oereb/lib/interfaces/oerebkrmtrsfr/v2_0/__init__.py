@@ -0,0 +1,24 @@
+"""
+The classes of the ``OeREBKRMtrsfr_V2_0`` model. The classes used by geolink2oereb are imported right away
+from :mod:`geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.subset`, all other classes are loaded from the
+complete model in :mod:`geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes` on first access.
+"""
+
+import importlib
+
+from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.subset import *  # noqa: F401,F403
+from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.subset import __all__ as subset_names
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    classes = importlib.import_module('geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes')
+    try:
+        return getattr(classes, name)
+    except AttributeError:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(subset_names))
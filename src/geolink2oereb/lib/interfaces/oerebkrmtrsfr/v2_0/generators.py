@@ -3,8 +3,9 @@ This interface offers methods to access python classes matching the ``OeREBKRMtr
 is used mainly for translation and handling between ``pyramid_oereb`` and ``OeREBKRMtrsfr_V2_0``.
 """
 
+import hashlib
 import logging
-from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes import (
+from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.subset import (
     OeREBKRM_V2_0_Dokumente_Dokument,
     LocalisationCH_V1_MultilingualText,
     LocalisationCH_V1_LocalisedText,
@@ -39,6 +40,203 @@ def fix_url(url):
     return url
 
 
+class CompactElement(object):
+    """
+    Base of the compact elements. They hold the same content as the generated classes with the same
+    attribute names, but in slots and with multilingual values as tuples of ``(language, text)`` pairs. They
+    are converted to the generated classes only when they are exported.
+    """
+
+    __slots__ = ()
+
+    def set_TID(self, TID):
+        self.TID = TID
+
+    def to_oerebkrmtrsfr(self):
+        raise NotImplementedError
+
+    def export(self, outfile, level, *args, **kwargs):
+        """
+        Converts the element to the generated class and exports it. See the ``export`` method of the
+        generated classes for the arguments.
+        """
+        self.to_oerebkrmtrsfr().export(outfile, level, *args, **kwargs)
+
+
+class CompactZustaendigeStelle(CompactElement):
+    """
+    The compact reference of a Dokument to its Amt.
+    """
+
+    __slots__ = ('REF',)
+
+    def __init__(self, REF=None):
+        self.REF = REF
+
+    def set_REF(self, REF):
+        self.REF = REF
+
+    def to_oerebkrmtrsfr(self):
+        """
+        Returns:
+            geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.ZustaendigeStelleType
+        """
+        return ZustaendigeStelleType(REF=self.REF)
+
+
+class CompactAmt(CompactElement):
+    """
+    The compact equivalent of ``OeREBKRM_V2_0_Amt_Amt``.
+    """
+
+    __slots__ = ('TID', 'Name', 'AmtImWeb', 'UID', 'Zeile1', 'Zeile2', 'Strasse', 'Hausnr', 'PLZ', 'Ort')
+
+    def __init__(self, TID=None, Name=None, AmtImWeb=None, UID=None, Zeile1=None, Zeile2=None, Strasse=None,
+                 Hausnr=None, PLZ=None, Ort=None):
+        self.TID = TID
+        self.Name = Name
+        self.AmtImWeb = AmtImWeb
+        self.UID = UID
+        self.Zeile1 = Zeile1
+        self.Zeile2 = Zeile2
+        self.Strasse = Strasse
+        self.Hausnr = Hausnr
+        self.PLZ = PLZ
+        self.Ort = Ort
+
+    def to_oerebkrmtrsfr(self):
+        """
+        Returns:
+            geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Amt_Amt
+        """
+        return OeREBKRM_V2_0_Amt_Amt(
+            TID=self.TID,
+            Name=multilingual_text_from_dict(multilingual_dict(self.Name)),
+            AmtImWeb=multilingual_uri_from_dict(multilingual_dict(self.AmtImWeb)),
+            UID=self.UID,
+            Zeile1=self.Zeile1,
+            Zeile2=self.Zeile2,
+            Strasse=self.Strasse,
+            Hausnr=self.Hausnr,
+            PLZ=self.PLZ,
+            Ort=self.Ort,
+        )
+
+
+class CompactDokument(CompactElement):
+    """
+    The compact equivalent of ``OeREBKRM_V2_0_Dokumente_Dokument``.
+    """
+
+    __slots__ = ('TID', 'Typ', 'Titel', 'Abkuerzung', 'OffizielleNr', 'NurInGemeinde', 'TextImWeb',
+                 'AuszugIndex', 'Rechtsstatus', 'publiziertAb', 'publiziertBis', 'ZustaendigeStelle')
+
+    def __init__(self, TID=None, Typ=None, Titel=None, Abkuerzung=None, OffizielleNr=None, NurInGemeinde=None,
+                 TextImWeb=None, AuszugIndex=None, Rechtsstatus=None, publiziertAb=None, publiziertBis=None,
+                 ZustaendigeStelle=None):
+        self.TID = TID
+        self.Typ = Typ
+        self.Titel = Titel
+        self.Abkuerzung = Abkuerzung
+        self.OffizielleNr = OffizielleNr
+        self.NurInGemeinde = NurInGemeinde
+        self.TextImWeb = TextImWeb
+        self.AuszugIndex = AuszugIndex
+        self.Rechtsstatus = Rechtsstatus
+        self.publiziertAb = publiziertAb
+        self.publiziertBis = publiziertBis
+        self.ZustaendigeStelle = ZustaendigeStelle
+
+    def to_oerebkrmtrsfr(self):
+        """
+        Returns:
+            geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument
+        """
+        return OeREBKRM_V2_0_Dokumente_Dokument(
+            TID=self.TID,
+            Typ=self.Typ,
+            Titel=multilingual_text_from_dict(multilingual_dict(self.Titel)),
+            Abkuerzung=multilingual_text_from_dict(multilingual_dict(self.Abkuerzung)),
+            OffizielleNr=multilingual_text_from_dict(multilingual_dict(self.OffizielleNr)),
+            NurInGemeinde=self.NurInGemeinde,
+            TextImWeb=multilingual_uri_from_dict(multilingual_dict(self.TextImWeb)),
+            AuszugIndex=self.AuszugIndex,
+            Rechtsstatus=self.Rechtsstatus,
+            publiziertAb=self.publiziertAb,
+            publiziertBis=self.publiziertBis,
+            ZustaendigeStelle=self.ZustaendigeStelle.to_oerebkrmtrsfr()
+        )
+
+
+def multilingual_pairs(multilingual_dict):
+    """
+    Converts a multilingual dict to the tuple of ``(language, text)`` pairs used by the compact elements.
+
+    Args:
+        multilingual_dict (dict or None): The multilingual value.
+
+    Returns:
+        tuple or None: The pairs in the order of the dict.
+    """
+    if multilingual_dict is None:
+        return None
+    return tuple(multilingual_dict.items())
+
+
+def multilingual_dict(pairs):
+    """
+    Converts the ``(language, text)`` pairs of a compact element back to a dict.
+
+    Args:
+        pairs (tuple or None): The pairs.
+
+    Returns:
+        dict or None: The multilingual value.
+    """
+    if pairs is None:
+        return None
+    return dict(pairs)
+
+
+def canonical_key(element):
+    """
+    Builds a hashable key out of the content of a generated element and all its children. Two elements get
+    the same key if they are exported to the same XML, but the key is much cheaper to build than the XML.
+
+    Args:
+        element: The generated or compact element, a list of elements or a plain value.
+
+    Returns:
+        The hashable key.
+    """
+    if isinstance(element, list):
+        return tuple(canonical_key(item) for item in element)
+    if isinstance(element, CompactElement):
+        return (type(element).__name__,) + tuple(
+            canonical_key(getattr(element, name)) for name in element.__slots__
+        )
+    member_data_items = getattr(element, 'member_data_items_', None)
+    if member_data_items is None:
+        return element
+    return (type(element).__name__,) + tuple(
+        canonical_key(getattr(element, name, None)) for name in member_data_items
+    )
+
+
+def content_digest(element):
+    """
+    Builds a fixed-length identifier out of the content of a generated element. It is stable across runs
+    and is used as the preliminary TID of the generated elements.
+
+    Args:
+        element: The generated element.
+
+    Returns:
+        str: The hex encoded SHA-256 digest of the canonical key of the element.
+    """
+    return hashlib.sha256(repr(canonical_key(element)).encode('utf-8')).hexdigest()
+
+
 def multilingual_text_from_dict(multilingual_dict):
     """
     Produces a MultilingualText object out of a dict in the form:
@@ -94,18 +292,21 @@ def multilingual_uri_from_dict(multilingual_dict):
     return TextImWebType(OeREBKRM_V2_0_MultilingualUri(localized_texts))
 
 
-def office_record_to_oerebkrmtrsfr(office_record):
+def office_record_to_compact(office_record):
     """
-    Translates a ``pyramid_oereb`` office record object to an OeREBKRM_V2_0_Amt_Amt object.
+    Translates a ``pyramid_oereb`` office record object to a compact Amt.
 
     Args:
         office_record (pyramid_oereb.core.records.office.OfficeRecord): The office record to translate.
     Returns:
-        geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Amt_Amt
+        CompactAmt
     """
-    amt = OeREBKRM_V2_0_Amt_Amt(
-        Name=multilingual_text_from_dict(office_record.name),
-        AmtImWeb=multilingual_uri_from_dict(office_record.office_at_web),
+    office_at_web = office_record.office_at_web
+    if office_at_web is not None:
+        office_at_web = {language: fix_url(url) for language, url in office_at_web.items()}
+    return CompactAmt(
+        Name=multilingual_pairs(office_record.name),
+        AmtImWeb=multilingual_pairs(office_at_web),
         UID=office_record.uid,
         Zeile1=office_record.line1,
         Zeile2=office_record.line2,
@@ -114,12 +315,24 @@ def office_record_to_oerebkrmtrsfr(office_record):
         PLZ=office_record.postal_code,
         Ort=office_record.city,
     )
-    return amt
 
 
-def document_record_to_oerebkrmtrsfr(document_record):
+def office_record_to_oerebkrmtrsfr(office_record):
     """
-    Translates a ``pyramid_oereb`` document record object to an OeREBKRM_V2_0_Dokumente_Dokument object.
+    Translates a ``pyramid_oereb`` office record object to an OeREBKRM_V2_0_Amt_Amt object.
+
+    Args:
+        office_record (pyramid_oereb.core.records.office.OfficeRecord): The office record to translate.
+    Returns:
+        geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Amt_Amt
+    """
+    return office_record_to_compact(office_record).to_oerebkrmtrsfr()
+
+
+def document_record_to_compact(document_record):
+    """
+    Translates a ``pyramid_oereb`` document record object to a compact Dokument and Amt. Both get the
+    digest of their content as TID, the Dokument references the Amt by it.
 
     Args:
         document_record (pyramid_oereb.core.records.documents.DocumentRecord): The record to translate.
@@ -127,25 +340,45 @@ def document_record_to_oerebkrmtrsfr(document_record):
     Returns:
         (tuple): tuple containing:
 
-            geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Amt_Amt:
-                The office which belongs to the document (responsible office).
-            geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument:
-                The document.
+            CompactDokument: The document.
+            CompactAmt: The office which belongs to the document (responsible office).
     """
-    amt = office_record_to_oerebkrmtrsfr(document_record.responsible_office)
-    dokument = OeREBKRM_V2_0_Dokumente_Dokument(
+    amt = office_record_to_compact(document_record.responsible_office)
+    amt.set_TID(content_digest(amt))
+    text_at_web = document_record.text_at_web
+    if text_at_web is not None:
+        text_at_web = {language: fix_url(url) for language, url in text_at_web.items()}
+    dokument = CompactDokument(
         Typ=document_record.document_type.code,
-        Titel=multilingual_text_from_dict(document_record.title),
-        Abkuerzung=multilingual_text_from_dict(document_record.abbreviation),
-        OffizielleNr=multilingual_text_from_dict(document_record.official_number),
+        Titel=multilingual_pairs(document_record.title),
+        Abkuerzung=multilingual_pairs(document_record.abbreviation),
+        OffizielleNr=multilingual_pairs(document_record.official_number),
         NurInGemeinde=document_record.only_in_municipality,
-        TextImWeb=multilingual_uri_from_dict(document_record.text_at_web),
-        # Dokument=multilingual_text_from_dict(document_record.file),
+        TextImWeb=multilingual_pairs(text_at_web),
         AuszugIndex=document_record.index,
         Rechtsstatus=document_record.law_status.code,
         publiziertAb=document_record.published_from,
         publiziertBis=document_record.published_until,
-        ZustaendigeStelle=ZustaendigeStelleType(REF=str(amt))
+        ZustaendigeStelle=CompactZustaendigeStelle(REF=amt.TID)
     )
-    dokument.set_TID(str(dokument))
+    dokument.set_TID(content_digest(dokument))
     return dokument, amt
+
+
+def document_record_to_oerebkrmtrsfr(document_record):
+    """
+    Translates a ``pyramid_oereb`` document record object to an OeREBKRM_V2_0_Dokumente_Dokument object.
+
+    Args:
+        document_record (pyramid_oereb.core.records.documents.DocumentRecord): The record to translate.
+
+    Returns:
+        (tuple): tuple containing:
+
+            geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Amt_Amt:
+                The office which belongs to the document (responsible office).
+            geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument:
+                The document.
+    """
+    dokument, amt = document_record_to_compact(document_record)
+    return dokument.to_oerebkrmtrsfr(), amt.to_oerebkrmtrsfr()
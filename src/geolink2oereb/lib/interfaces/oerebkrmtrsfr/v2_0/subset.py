@@ -0,0 +1,6465 @@
+"""
+The subset of the generated ``OeREBKRMtrsfr_V2_0`` classes used by geolink2oereb: the Dokumente, Amt and
+Localisation classes and the transfer header. It is much cheaper to import than the complete model in
+:mod:`geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes`, which imports these classes from here.
+
+Extracted from the generateDS output by ``scripts/extract_oerebkrmtrsfr_subset.py``, do not edit.
+"""
+from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0._support import (  # noqa: F401
+    BaseStrType_,
+    CurrentSubclassModule_,
+    Enum,
+    GenerateDSNamespaceDefs_,
+    GeneratedsSuper,
+    MemberSpec_,
+    SaveElementTreeNode,
+    Tag_pattern_,
+    UseCapturedNS_,
+    Validate_simpletypes_,
+    _cast,
+    datetime_,
+    encode_str_2_3,
+    find_attr_value_,
+    getSubclassFromModule_,
+    get_all_text_,
+    quote_attrib,
+    quote_xml,
+    raise_parse_error,
+    showIndent,
+)
+
+#
+# Data representation classes.
+#
+
+
+class OeREBKRM_V2_0_DokumentTyp(str, Enum):
+    RECHTSVORSCHRIFT = "Rechtsvorschrift"
+    GESETZLICHE_GRUNDLAGE = "GesetzlicheGrundlage"
+    HINWEIS = "Hinweis"
+
+
+class Models(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "MODEL": MemberSpec_(
+            "MODEL",
+            "Model",
+            1,
+            1,
+            {
+                "maxOccurs": "unbounded",
+                "minOccurs": "0",
+                "name": "MODEL",
+                "type": "Model",
+            },
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, MODEL=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if MODEL is None:
+            self.MODEL = []
+        else:
+            self.MODEL = MODEL
+        self.MODEL_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, Models)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if Models.subclass:
+            return Models.subclass(*args_, **kwargs_)
+        else:
+            return Models(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_MODEL(self):
+        return self.MODEL
+
+    def set_MODEL(self, MODEL):
+        self.MODEL = MODEL
+
+    def add_MODEL(self, value):
+        self.MODEL.append(value)
+
+    def insert_MODEL_at(self, index, value):
+        self.MODEL.insert(index, value)
+
+    def replace_MODEL_at(self, index, value):
+        self.MODEL[index] = value
+
+    def _hasContent(self):
+        if self.MODEL:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="Models",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("Models")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "Models":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_="Models")
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="Models",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(self, outfile, level, already_processed, namespaceprefix_="", name_="Models"):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="Models",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        for MODEL_ in self.MODEL:
+            namespaceprefix_ = self.MODEL_nsprefix_ + ":" if (UseCapturedNS_ and self.MODEL_nsprefix_) else ""
+            MODEL_.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="MODEL",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "MODEL":
+            obj_ = Model.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.MODEL.append(obj_)
+            obj_.original_tagname_ = "MODEL"
+
+
+# end class Models
+
+
+class Model(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "NAME": MemberSpec_("NAME", "INTERLIS.NAME", 0, 0, {"use": "required", "name": "NAME"}),
+        "VERSION": MemberSpec_("VERSION", "xsd:string", 0, 0, {"use": "required", "name": "VERSION"}),
+        "URI": MemberSpec_("URI", "xsd:anyURI", 0, 0, {"use": "required", "name": "URI"}),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, NAME=None, VERSION=None, URI=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        self.NAME = _cast(None, NAME)
+        self.NAME_nsprefix_ = None
+        self.VERSION = _cast(None, VERSION)
+        self.VERSION_nsprefix_ = None
+        self.URI = _cast(None, URI)
+        self.URI_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, Model)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if Model.subclass:
+            return Model.subclass(*args_, **kwargs_)
+        else:
+            return Model(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_NAME(self):
+        return self.NAME
+
+    def set_NAME(self, NAME):
+        self.NAME = NAME
+
+    def get_VERSION(self):
+        return self.VERSION
+
+    def set_VERSION(self, VERSION):
+        self.VERSION = VERSION
+
+    def get_URI(self):
+        return self.URI
+
+    def set_URI(self, URI):
+        self.URI = URI
+
+    def validate_INTERLIS_NAME(self, value):
+        # Validate type INTERLIS.NAME, a restriction on xsd:normalizedString.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if len(value) > 255:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd maxLength restriction on INTERLIS.NAME'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+
+    def _hasContent(self):
+        if ():
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_="",
+        name_="Model",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("Model")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "Model":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_="Model")
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="Model",
+                pretty_print=pretty_print,
+            )
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(self, outfile, level, already_processed, namespaceprefix_="", name_="Model"):
+        if self.NAME is not None and "NAME" not in already_processed:
+            already_processed.add("NAME")
+            outfile.write(
+                " NAME=%s"
+                % (self.gds_encode(self.gds_format_string(quote_attrib(self.NAME), input_name="NAME")),)
+            )
+        if self.VERSION is not None and "VERSION" not in already_processed:
+            already_processed.add("VERSION")
+            outfile.write(
+                " VERSION=%s"
+                % (self.gds_encode(self.gds_format_string(quote_attrib(self.VERSION), input_name="VERSION")),)
+            )
+        if self.URI is not None and "URI" not in already_processed:
+            already_processed.add("URI")
+            outfile.write(
+                " URI=%s"
+                % (self.gds_encode(self.gds_format_string(quote_attrib(self.URI), input_name="URI")),)
+            )
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_="",
+        name_="Model",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        pass
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_("NAME", node)
+        if value is not None and "NAME" not in already_processed:
+            already_processed.add("NAME")
+            self.NAME = value
+            self.validate_INTERLIS_NAME(self.NAME)  # validate type INTERLIS.NAME
+        value = find_attr_value_("VERSION", node)
+        if value is not None and "VERSION" not in already_processed:
+            already_processed.add("VERSION")
+            self.VERSION = value
+        value = find_attr_value_("URI", node)
+        if value is not None and "URI" not in already_processed:
+            already_processed.add("URI")
+            self.URI = value
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        pass
+
+
+# end class Model
+
+
+class LocalisationCH_V1_LocalisedText(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "Language": MemberSpec_(
+            "Language",
+            ["InternationalCodes_V1.LanguageCode_ISO639_1", "xsd:string"],
+            0,
+            1,
+            {"minOccurs": "0", "name": "Language", "type": "xsd:string"},
+            None,
+        ),
+        "Text": MemberSpec_(
+            "Text",
+            ["TextType79", "xsd:normalizedString"],
+            0,
+            0,
+            {"name": "Text", "type": "xsd:normalizedString"},
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, Language=None, Text=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        self.Language = Language
+        self.validate_InternationalCodes_V1_LanguageCode_ISO639_1(self.Language)
+        self.Language_nsprefix_ = None
+        self.Text = Text
+        self.validate_TextType79(self.Text)
+        self.Text_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, LocalisationCH_V1_LocalisedText)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if LocalisationCH_V1_LocalisedText.subclass:
+            return LocalisationCH_V1_LocalisedText.subclass(*args_, **kwargs_)
+        else:
+            return LocalisationCH_V1_LocalisedText(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_Language(self):
+        return self.Language
+
+    def set_Language(self, Language):
+        self.Language = Language
+
+    def get_Text(self):
+        return self.Text
+
+    def set_Text(self, Text):
+        self.Text = Text
+
+    def validate_InternationalCodes_V1_LanguageCode_ISO639_1(self, value):
+        result = True
+        # Validate type InternationalCodes_V1.LanguageCode_ISO639_1, a restriction on xsd:string.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            value = value
+            enumerations = [
+                "de",
+                "fr",
+                "it",
+                "rm",
+                "en",
+                "aa",
+                "ab",
+                "af",
+                "am",
+                "ar",
+                "as",
+                "ay",
+                "az",
+                "ba",
+                "be",
+                "bg",
+                "bh",
+                "bi",
+                "bn",
+                "bo",
+                "br",
+                "ca",
+                "co",
+                "cs",
+                "cy",
+                "da",
+                "dz",
+                "el",
+                "eo",
+                "es",
+                "et",
+                "eu",
+                "fa",
+                "fi",
+                "fj",
+                "fo",
+                "fy",
+                "ga",
+                "gd",
+                "gl",
+                "gn",
+                "gu",
+                "ha",
+                "he",
+                "hi",
+                "hr",
+                "hu",
+                "hy",
+                "ia",
+                "id",
+                "ie",
+                "ik",
+                "is",
+                "iu",
+                "ja",
+                "jw",
+                "ka",
+                "kk",
+                "kl",
+                "km",
+                "kn",
+                "ko",
+                "ks",
+                "ku",
+                "ky",
+                "la",
+                "ln",
+                "lo",
+                "lt",
+                "lv",
+                "mg",
+                "mi",
+                "mk",
+                "ml",
+                "mn",
+                "mo",
+                "mr",
+                "ms",
+                "mt",
+                "my",
+                "na",
+                "ne",
+                "nl",
+                "no",
+                "oc",
+                "om",
+                "or",
+                "pa",
+                "pl",
+                "ps",
+                "pt",
+                "qu",
+                "rn",
+                "ro",
+                "ru",
+                "rw",
+                "sa",
+                "sd",
+                "sg",
+                "sh",
+                "si",
+                "sk",
+                "sl",
+                "sm",
+                "sn",
+                "so",
+                "sq",
+                "sr",
+                "ss",
+                "st",
+                "su",
+                "sv",
+                "sw",
+                "ta",
+                "te",
+                "tg",
+                "th",
+                "ti",
+                "tk",
+                "tl",
+                "tn",
+                "to",
+                "tr",
+                "ts",
+                "tt",
+                "tw",
+                "ug",
+                "uk",
+                "ur",
+                "uz",
+                "vi",
+                "vo",
+                "wo",
+                "xh",
+                "yi",
+                "yo",
+                "za",
+                "zh",
+                "zu",
+            ]
+            if value not in enumerations:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd enumeration restriction on InternationalCodes_V1.LanguageCode_ISO639_1'
+                    % {"value": encode_str_2_3(value), "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def validate_TextType79(self, value):
+        result = True
+        # Validate type TextType79, a restriction on xsd:normalizedString.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            pass
+        return result
+
+    def _hasContent(self):
+        if self.Language is not None or self.Text is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="LocalisationCH_V1.LocalisedText",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("LocalisationCH_V1.LocalisedText")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "LocalisationCH_V1.LocalisedText":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(
+            outfile,
+            level,
+            already_processed,
+            namespaceprefix_,
+            name_="LocalisationCH_V1.LocalisedText",
+        )
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="LocalisationCH_V1.LocalisedText",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="LocalisationCH_V1.LocalisedText",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="LocalisationCH_V1.LocalisedText",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.Language is not None:
+            namespaceprefix_ = (
+                self.Language_nsprefix_ + ":" if (UseCapturedNS_ and self.Language_nsprefix_) else ""
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sLanguage>%s</%sLanguage>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(self.gds_format_string(quote_xml(self.Language), input_name="Language")),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.Text is not None:
+            namespaceprefix_ = self.Text_nsprefix_ + ":" if (UseCapturedNS_ and self.Text_nsprefix_) else ""
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sText>%s</%sText>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(self.gds_format_string(quote_xml(self.Text), input_name="Text")),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "Language":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "Language")
+            value_ = self.gds_validate_string(value_, node, "Language")
+            self.Language = value_
+            self.Language_nsprefix_ = child_.prefix
+            # validate type InternationalCodes_V1.LanguageCode_ISO639_1
+            self.validate_InternationalCodes_V1_LanguageCode_ISO639_1(self.Language)
+        elif nodeName_ == "Text":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "Text")
+            value_ = self.gds_validate_string(value_, node, "Text")
+            self.Text = value_
+            self.Text_nsprefix_ = child_.prefix
+            # validate type TextType79
+            self.validate_TextType79(self.Text)
+
+
+# end class LocalisationCH_V1_LocalisedText
+
+
+class LocalisationCH_V1_MultilingualText(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "LocalisedText": MemberSpec_(
+            "LocalisedText",
+            "LocalisedTextType",
+            0,
+            0,
+            {"name": "LocalisedText", "type": "LocalisedTextType"},
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, LocalisedText=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if LocalisedText is None:
+            self.LocalisedText = globals()["LocalisedTextType"]()
+        else:
+            self.LocalisedText = LocalisedText
+        self.LocalisedText_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, LocalisationCH_V1_MultilingualText)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if LocalisationCH_V1_MultilingualText.subclass:
+            return LocalisationCH_V1_MultilingualText.subclass(*args_, **kwargs_)
+        else:
+            return LocalisationCH_V1_MultilingualText(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_LocalisedText(self):
+        return self.LocalisedText
+
+    def set_LocalisedText(self, LocalisedText):
+        self.LocalisedText = LocalisedText
+
+    def _hasContent(self):
+        if self.LocalisedText is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="LocalisationCH_V1.MultilingualText",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("LocalisationCH_V1.MultilingualText")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "LocalisationCH_V1.MultilingualText":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(
+            outfile,
+            level,
+            already_processed,
+            namespaceprefix_,
+            name_="LocalisationCH_V1.MultilingualText",
+        )
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="LocalisationCH_V1.MultilingualText",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="LocalisationCH_V1.MultilingualText",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="LocalisationCH_V1.MultilingualText",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.LocalisedText is not None:
+            namespaceprefix_ = (
+                self.LocalisedText_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.LocalisedText_nsprefix_)
+                else ""
+            )
+            self.LocalisedText.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="LocalisedText",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "LocalisedText":
+            obj_ = LocalisedTextType.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.LocalisedText = obj_
+            obj_.original_tagname_ = "LocalisedText"
+
+
+# end class LocalisationCH_V1_MultilingualText
+
+
+class OeREBKRM_V2_0_LocalisedBlob(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "Language": MemberSpec_(
+            "Language",
+            ["InternationalCodes_V1.LanguageCode_ISO639_1", "xsd:string"],
+            0,
+            1,
+            {"minOccurs": "0", "name": "Language", "type": "xsd:string"},
+            None,
+        ),
+        "Blob": MemberSpec_("Blob", "BlobType", 0, 0, {"name": "Blob", "type": "BlobType"}, None),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, Language=None, Blob=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        self.Language = Language
+        self.validate_InternationalCodes_V1_LanguageCode_ISO639_1(self.Language)
+        self.Language_nsprefix_ = None
+        if Blob is None:
+            self.Blob = globals()["BlobType"]()
+        else:
+            self.Blob = Blob
+        self.Blob_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, OeREBKRM_V2_0_LocalisedBlob)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if OeREBKRM_V2_0_LocalisedBlob.subclass:
+            return OeREBKRM_V2_0_LocalisedBlob.subclass(*args_, **kwargs_)
+        else:
+            return OeREBKRM_V2_0_LocalisedBlob(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_Language(self):
+        return self.Language
+
+    def set_Language(self, Language):
+        self.Language = Language
+
+    def get_Blob(self):
+        return self.Blob
+
+    def set_Blob(self, Blob):
+        self.Blob = Blob
+
+    def validate_InternationalCodes_V1_LanguageCode_ISO639_1(self, value):
+        result = True
+        # Validate type InternationalCodes_V1.LanguageCode_ISO639_1, a restriction on xsd:string.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            value = value
+            enumerations = [
+                "de",
+                "fr",
+                "it",
+                "rm",
+                "en",
+                "aa",
+                "ab",
+                "af",
+                "am",
+                "ar",
+                "as",
+                "ay",
+                "az",
+                "ba",
+                "be",
+                "bg",
+                "bh",
+                "bi",
+                "bn",
+                "bo",
+                "br",
+                "ca",
+                "co",
+                "cs",
+                "cy",
+                "da",
+                "dz",
+                "el",
+                "eo",
+                "es",
+                "et",
+                "eu",
+                "fa",
+                "fi",
+                "fj",
+                "fo",
+                "fy",
+                "ga",
+                "gd",
+                "gl",
+                "gn",
+                "gu",
+                "ha",
+                "he",
+                "hi",
+                "hr",
+                "hu",
+                "hy",
+                "ia",
+                "id",
+                "ie",
+                "ik",
+                "is",
+                "iu",
+                "ja",
+                "jw",
+                "ka",
+                "kk",
+                "kl",
+                "km",
+                "kn",
+                "ko",
+                "ks",
+                "ku",
+                "ky",
+                "la",
+                "ln",
+                "lo",
+                "lt",
+                "lv",
+                "mg",
+                "mi",
+                "mk",
+                "ml",
+                "mn",
+                "mo",
+                "mr",
+                "ms",
+                "mt",
+                "my",
+                "na",
+                "ne",
+                "nl",
+                "no",
+                "oc",
+                "om",
+                "or",
+                "pa",
+                "pl",
+                "ps",
+                "pt",
+                "qu",
+                "rn",
+                "ro",
+                "ru",
+                "rw",
+                "sa",
+                "sd",
+                "sg",
+                "sh",
+                "si",
+                "sk",
+                "sl",
+                "sm",
+                "sn",
+                "so",
+                "sq",
+                "sr",
+                "ss",
+                "st",
+                "su",
+                "sv",
+                "sw",
+                "ta",
+                "te",
+                "tg",
+                "th",
+                "ti",
+                "tk",
+                "tl",
+                "tn",
+                "to",
+                "tr",
+                "ts",
+                "tt",
+                "tw",
+                "ug",
+                "uk",
+                "ur",
+                "uz",
+                "vi",
+                "vo",
+                "wo",
+                "xh",
+                "yi",
+                "yo",
+                "za",
+                "zh",
+                "zu",
+            ]
+            if value not in enumerations:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd enumeration restriction on InternationalCodes_V1.LanguageCode_ISO639_1'
+                    % {"value": encode_str_2_3(value), "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def _hasContent(self):
+        if self.Language is not None or self.Blob is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OeREBKRM_V2_0.LocalisedBlob",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("OeREBKRM_V2_0.LocalisedBlob")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "OeREBKRM_V2_0.LocalisedBlob":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(
+            outfile,
+            level,
+            already_processed,
+            namespaceprefix_,
+            name_="OeREBKRM_V2_0.LocalisedBlob",
+        )
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="OeREBKRM_V2_0.LocalisedBlob",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="OeREBKRM_V2_0.LocalisedBlob",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OeREBKRM_V2_0.LocalisedBlob",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.Language is not None:
+            namespaceprefix_ = (
+                self.Language_nsprefix_ + ":" if (UseCapturedNS_ and self.Language_nsprefix_) else ""
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sLanguage>%s</%sLanguage>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(self.gds_format_string(quote_xml(self.Language), input_name="Language")),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.Blob is not None:
+            namespaceprefix_ = self.Blob_nsprefix_ + ":" if (UseCapturedNS_ and self.Blob_nsprefix_) else ""
+            self.Blob.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="Blob",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "Language":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "Language")
+            value_ = self.gds_validate_string(value_, node, "Language")
+            self.Language = value_
+            self.Language_nsprefix_ = child_.prefix
+            # validate type InternationalCodes_V1.LanguageCode_ISO639_1
+            self.validate_InternationalCodes_V1_LanguageCode_ISO639_1(self.Language)
+        elif nodeName_ == "Blob":
+            obj_ = BlobType.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.Blob = obj_
+            obj_.original_tagname_ = "Blob"
+
+
+# end class OeREBKRM_V2_0_LocalisedBlob
+
+
+class OeREBKRM_V2_0_LocalisedUri(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "Language": MemberSpec_(
+            "Language",
+            ["InternationalCodes_V1.LanguageCode_ISO639_1", "xsd:string"],
+            0,
+            1,
+            {"minOccurs": "0", "name": "Language", "type": "xsd:string"},
+            None,
+        ),
+        "Text": MemberSpec_(
+            "Text",
+            ["INTERLIS.URI", "xsd:normalizedString"],
+            0,
+            0,
+            {"name": "Text", "type": "xsd:normalizedString"},
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, Language=None, Text=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        self.Language = Language
+        self.validate_InternationalCodes_V1_LanguageCode_ISO639_1(self.Language)
+        self.Language_nsprefix_ = None
+        self.Text = Text
+        self.validate_INTERLIS_URI(self.Text)
+        self.Text_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, OeREBKRM_V2_0_LocalisedUri)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if OeREBKRM_V2_0_LocalisedUri.subclass:
+            return OeREBKRM_V2_0_LocalisedUri.subclass(*args_, **kwargs_)
+        else:
+            return OeREBKRM_V2_0_LocalisedUri(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_Language(self):
+        return self.Language
+
+    def set_Language(self, Language):
+        self.Language = Language
+
+    def get_Text(self):
+        return self.Text
+
+    def set_Text(self, Text):
+        self.Text = Text
+
+    def validate_InternationalCodes_V1_LanguageCode_ISO639_1(self, value):
+        result = True
+        # Validate type InternationalCodes_V1.LanguageCode_ISO639_1, a restriction on xsd:string.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            value = value
+            enumerations = [
+                "de",
+                "fr",
+                "it",
+                "rm",
+                "en",
+                "aa",
+                "ab",
+                "af",
+                "am",
+                "ar",
+                "as",
+                "ay",
+                "az",
+                "ba",
+                "be",
+                "bg",
+                "bh",
+                "bi",
+                "bn",
+                "bo",
+                "br",
+                "ca",
+                "co",
+                "cs",
+                "cy",
+                "da",
+                "dz",
+                "el",
+                "eo",
+                "es",
+                "et",
+                "eu",
+                "fa",
+                "fi",
+                "fj",
+                "fo",
+                "fy",
+                "ga",
+                "gd",
+                "gl",
+                "gn",
+                "gu",
+                "ha",
+                "he",
+                "hi",
+                "hr",
+                "hu",
+                "hy",
+                "ia",
+                "id",
+                "ie",
+                "ik",
+                "is",
+                "iu",
+                "ja",
+                "jw",
+                "ka",
+                "kk",
+                "kl",
+                "km",
+                "kn",
+                "ko",
+                "ks",
+                "ku",
+                "ky",
+                "la",
+                "ln",
+                "lo",
+                "lt",
+                "lv",
+                "mg",
+                "mi",
+                "mk",
+                "ml",
+                "mn",
+                "mo",
+                "mr",
+                "ms",
+                "mt",
+                "my",
+                "na",
+                "ne",
+                "nl",
+                "no",
+                "oc",
+                "om",
+                "or",
+                "pa",
+                "pl",
+                "ps",
+                "pt",
+                "qu",
+                "rn",
+                "ro",
+                "ru",
+                "rw",
+                "sa",
+                "sd",
+                "sg",
+                "sh",
+                "si",
+                "sk",
+                "sl",
+                "sm",
+                "sn",
+                "so",
+                "sq",
+                "sr",
+                "ss",
+                "st",
+                "su",
+                "sv",
+                "sw",
+                "ta",
+                "te",
+                "tg",
+                "th",
+                "ti",
+                "tk",
+                "tl",
+                "tn",
+                "to",
+                "tr",
+                "ts",
+                "tt",
+                "tw",
+                "ug",
+                "uk",
+                "ur",
+                "uz",
+                "vi",
+                "vo",
+                "wo",
+                "xh",
+                "yi",
+                "yo",
+                "za",
+                "zh",
+                "zu",
+            ]
+            if value not in enumerations:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd enumeration restriction on InternationalCodes_V1.LanguageCode_ISO639_1'
+                    % {"value": encode_str_2_3(value), "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def validate_INTERLIS_URI(self, value):
+        result = True
+        # Validate type INTERLIS.URI, a restriction on xsd:normalizedString.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if len(value) > 1023:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd maxLength restriction on INTERLIS.URI'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def _hasContent(self):
+        if self.Language is not None or self.Text is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OeREBKRM_V2_0.LocalisedUri",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("OeREBKRM_V2_0.LocalisedUri")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "OeREBKRM_V2_0.LocalisedUri":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(
+            outfile,
+            level,
+            already_processed,
+            namespaceprefix_,
+            name_="OeREBKRM_V2_0.LocalisedUri",
+        )
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="OeREBKRM_V2_0.LocalisedUri",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="OeREBKRM_V2_0.LocalisedUri",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OeREBKRM_V2_0.LocalisedUri",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.Language is not None:
+            namespaceprefix_ = (
+                self.Language_nsprefix_ + ":" if (UseCapturedNS_ and self.Language_nsprefix_) else ""
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sLanguage>%s</%sLanguage>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(self.gds_format_string(quote_xml(self.Language), input_name="Language")),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.Text is not None:
+            namespaceprefix_ = self.Text_nsprefix_ + ":" if (UseCapturedNS_ and self.Text_nsprefix_) else ""
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sText>%s</%sText>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(self.gds_format_string(quote_xml(self.Text), input_name="Text")),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "Language":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "Language")
+            value_ = self.gds_validate_string(value_, node, "Language")
+            self.Language = value_
+            self.Language_nsprefix_ = child_.prefix
+            # validate type InternationalCodes_V1.LanguageCode_ISO639_1
+            self.validate_InternationalCodes_V1_LanguageCode_ISO639_1(self.Language)
+        elif nodeName_ == "Text":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "Text")
+            value_ = self.gds_validate_string(value_, node, "Text")
+            self.Text = value_
+            self.Text_nsprefix_ = child_.prefix
+            # validate type INTERLIS.URI
+            self.validate_INTERLIS_URI(self.Text)
+
+
+# end class OeREBKRM_V2_0_LocalisedUri
+
+
+class OeREBKRM_V2_0_MultilingualBlob(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "LocalisedBlob": MemberSpec_(
+            "LocalisedBlob",
+            "LocalisedBlobType",
+            0,
+            0,
+            {"name": "LocalisedBlob", "type": "LocalisedBlobType"},
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, LocalisedBlob=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if LocalisedBlob is None:
+            self.LocalisedBlob = globals()["LocalisedBlobType"]()
+        else:
+            self.LocalisedBlob = LocalisedBlob
+        self.LocalisedBlob_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, OeREBKRM_V2_0_MultilingualBlob)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if OeREBKRM_V2_0_MultilingualBlob.subclass:
+            return OeREBKRM_V2_0_MultilingualBlob.subclass(*args_, **kwargs_)
+        else:
+            return OeREBKRM_V2_0_MultilingualBlob(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_LocalisedBlob(self):
+        return self.LocalisedBlob
+
+    def set_LocalisedBlob(self, LocalisedBlob):
+        self.LocalisedBlob = LocalisedBlob
+
+    def _hasContent(self):
+        if self.LocalisedBlob is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OeREBKRM_V2_0.MultilingualBlob",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("OeREBKRM_V2_0.MultilingualBlob")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "OeREBKRM_V2_0.MultilingualBlob":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(
+            outfile,
+            level,
+            already_processed,
+            namespaceprefix_,
+            name_="OeREBKRM_V2_0.MultilingualBlob",
+        )
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="OeREBKRM_V2_0.MultilingualBlob",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="OeREBKRM_V2_0.MultilingualBlob",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OeREBKRM_V2_0.MultilingualBlob",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.LocalisedBlob is not None:
+            namespaceprefix_ = (
+                self.LocalisedBlob_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.LocalisedBlob_nsprefix_)
+                else ""
+            )
+            self.LocalisedBlob.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="LocalisedBlob",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "LocalisedBlob":
+            obj_ = LocalisedBlobType.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.LocalisedBlob = obj_
+            obj_.original_tagname_ = "LocalisedBlob"
+
+
+# end class OeREBKRM_V2_0_MultilingualBlob
+
+
+class OeREBKRM_V2_0_MultilingualUri(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "LocalisedText": MemberSpec_(
+            "LocalisedText",
+            "LocalisedTextType86",
+            0,
+            0,
+            {"name": "LocalisedText", "type": "LocalisedTextType86"},
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, LocalisedText=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if LocalisedText is None:
+            self.LocalisedText = globals()["LocalisedTextType86"]()
+        else:
+            self.LocalisedText = LocalisedText
+        self.LocalisedText_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, OeREBKRM_V2_0_MultilingualUri)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if OeREBKRM_V2_0_MultilingualUri.subclass:
+            return OeREBKRM_V2_0_MultilingualUri.subclass(*args_, **kwargs_)
+        else:
+            return OeREBKRM_V2_0_MultilingualUri(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_LocalisedText(self):
+        return self.LocalisedText
+
+    def set_LocalisedText(self, LocalisedText):
+        self.LocalisedText = LocalisedText
+
+    def _hasContent(self):
+        if self.LocalisedText is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OeREBKRM_V2_0.MultilingualUri",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("OeREBKRM_V2_0.MultilingualUri")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "OeREBKRM_V2_0.MultilingualUri":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(
+            outfile,
+            level,
+            already_processed,
+            namespaceprefix_,
+            name_="OeREBKRM_V2_0.MultilingualUri",
+        )
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="OeREBKRM_V2_0.MultilingualUri",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="OeREBKRM_V2_0.MultilingualUri",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OeREBKRM_V2_0.MultilingualUri",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.LocalisedText is not None:
+            namespaceprefix_ = (
+                self.LocalisedText_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.LocalisedText_nsprefix_)
+                else ""
+            )
+            self.LocalisedText.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="LocalisedText",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "LocalisedText":
+            obj_ = LocalisedTextType86.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.LocalisedText = obj_
+            obj_.original_tagname_ = "LocalisedText"
+
+
+# end class OeREBKRM_V2_0_MultilingualUri
+
+
+class OeREBKRM_V2_0_Amt_Amt(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "TID": MemberSpec_("TID", "IliID", 0, 0, {"use": "required", "name": "TID"}),
+        "Name": MemberSpec_("Name", "NameType87", 0, 0, {"name": "Name", "type": "NameType87"}, None),
+        "AmtImWeb": MemberSpec_(
+            "AmtImWeb",
+            "AmtImWebType",
+            0,
+            1,
+            {"minOccurs": "0", "name": "AmtImWeb", "type": "AmtImWebType"},
+            None,
+        ),
+        "UID": MemberSpec_(
+            "UID",
+            ["OeREBKRM_V2_0.UID", "xsd:normalizedString"],
+            0,
+            1,
+            {"minOccurs": "0", "name": "UID", "type": "xsd:normalizedString"},
+            None,
+        ),
+        "Zeile1": MemberSpec_(
+            "Zeile1",
+            ["Zeile1Type", "xsd:normalizedString"],
+            0,
+            1,
+            {"minOccurs": "0", "name": "Zeile1", "type": "xsd:normalizedString"},
+            None,
+        ),
+        "Zeile2": MemberSpec_(
+            "Zeile2",
+            ["Zeile2Type", "xsd:normalizedString"],
+            0,
+            1,
+            {"minOccurs": "0", "name": "Zeile2", "type": "xsd:normalizedString"},
+            None,
+        ),
+        "Strasse": MemberSpec_(
+            "Strasse",
+            ["StrasseType", "xsd:normalizedString"],
+            0,
+            1,
+            {"minOccurs": "0", "name": "Strasse", "type": "xsd:normalizedString"},
+            None,
+        ),
+        "Hausnr": MemberSpec_(
+            "Hausnr",
+            ["HausnrType", "xsd:normalizedString"],
+            0,
+            1,
+            {"minOccurs": "0", "name": "Hausnr", "type": "xsd:normalizedString"},
+            None,
+        ),
+        "PLZ": MemberSpec_(
+            "PLZ",
+            ["PLZType", "xsd:normalizedString"],
+            0,
+            1,
+            {"minOccurs": "0", "name": "PLZ", "type": "xsd:normalizedString"},
+            None,
+        ),
+        "Ort": MemberSpec_(
+            "Ort",
+            ["OrtType", "xsd:normalizedString"],
+            0,
+            1,
+            {"minOccurs": "0", "name": "Ort", "type": "xsd:normalizedString"},
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(
+        self,
+        TID=None,
+        Name=None,
+        AmtImWeb=None,
+        UID=None,
+        Zeile1=None,
+        Zeile2=None,
+        Strasse=None,
+        Hausnr=None,
+        PLZ=None,
+        Ort=None,
+        gds_collector_=None,
+        **kwargs_
+    ):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        self.TID = _cast(None, TID)
+        self.TID_nsprefix_ = None
+        if Name is None:
+            self.Name = globals()["NameType87"]()
+        else:
+            self.Name = Name
+        self.Name_nsprefix_ = None
+        self.AmtImWeb = AmtImWeb
+        self.AmtImWeb_nsprefix_ = None
+        self.UID = UID
+        self.validate_OeREBKRM_V2_0_UID(self.UID)
+        self.UID_nsprefix_ = None
+        self.Zeile1 = Zeile1
+        self.validate_Zeile1Type(self.Zeile1)
+        self.Zeile1_nsprefix_ = None
+        self.Zeile2 = Zeile2
+        self.validate_Zeile2Type(self.Zeile2)
+        self.Zeile2_nsprefix_ = None
+        self.Strasse = Strasse
+        self.validate_StrasseType(self.Strasse)
+        self.Strasse_nsprefix_ = None
+        self.Hausnr = Hausnr
+        self.validate_HausnrType(self.Hausnr)
+        self.Hausnr_nsprefix_ = None
+        self.PLZ = PLZ
+        self.validate_PLZType(self.PLZ)
+        self.PLZ_nsprefix_ = None
+        self.Ort = Ort
+        self.validate_OrtType(self.Ort)
+        self.Ort_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, OeREBKRM_V2_0_Amt_Amt)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if OeREBKRM_V2_0_Amt_Amt.subclass:
+            return OeREBKRM_V2_0_Amt_Amt.subclass(*args_, **kwargs_)
+        else:
+            return OeREBKRM_V2_0_Amt_Amt(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_Name(self):
+        return self.Name
+
+    def set_Name(self, Name):
+        self.Name = Name
+
+    def get_AmtImWeb(self):
+        return self.AmtImWeb
+
+    def set_AmtImWeb(self, AmtImWeb):
+        self.AmtImWeb = AmtImWeb
+
+    def get_UID(self):
+        return self.UID
+
+    def set_UID(self, UID):
+        self.UID = UID
+
+    def get_Zeile1(self):
+        return self.Zeile1
+
+    def set_Zeile1(self, Zeile1):
+        self.Zeile1 = Zeile1
+
+    def get_Zeile2(self):
+        return self.Zeile2
+
+    def set_Zeile2(self, Zeile2):
+        self.Zeile2 = Zeile2
+
+    def get_Strasse(self):
+        return self.Strasse
+
+    def set_Strasse(self, Strasse):
+        self.Strasse = Strasse
+
+    def get_Hausnr(self):
+        return self.Hausnr
+
+    def set_Hausnr(self, Hausnr):
+        self.Hausnr = Hausnr
+
+    def get_PLZ(self):
+        return self.PLZ
+
+    def set_PLZ(self, PLZ):
+        self.PLZ = PLZ
+
+    def get_Ort(self):
+        return self.Ort
+
+    def set_Ort(self, Ort):
+        self.Ort = Ort
+
+    def get_TID(self):
+        return self.TID
+
+    def set_TID(self, TID):
+        self.TID = TID
+
+    def validate_OeREBKRM_V2_0_UID(self, value):
+        result = True
+        # Validate type OeREBKRM_V2_0.UID, a restriction on xsd:normalizedString.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if len(value) > 12:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd maxLength restriction on OeREBKRM_V2_0.UID'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def validate_Zeile1Type(self, value):
+        result = True
+        # Validate type Zeile1Type, a restriction on xsd:normalizedString.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if len(value) > 80:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd maxLength restriction on Zeile1Type'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def validate_Zeile2Type(self, value):
+        result = True
+        # Validate type Zeile2Type, a restriction on xsd:normalizedString.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if len(value) > 80:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd maxLength restriction on Zeile2Type'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def validate_StrasseType(self, value):
+        result = True
+        # Validate type StrasseType, a restriction on xsd:normalizedString.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if len(value) > 100:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd maxLength restriction on StrasseType'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def validate_HausnrType(self, value):
+        result = True
+        # Validate type HausnrType, a restriction on xsd:normalizedString.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if len(value) > 7:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd maxLength restriction on HausnrType'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def validate_PLZType(self, value):
+        result = True
+        # Validate type PLZType, a restriction on xsd:normalizedString.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if len(value) > 4:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd maxLength restriction on PLZType'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def validate_OrtType(self, value):
+        result = True
+        # Validate type OrtType, a restriction on xsd:normalizedString.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if len(value) > 40:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd maxLength restriction on OrtType'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def validate_IliID(self, value):
+        # Validate type IliID, a restriction on xsd:string.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if not self.gds_validate_simple_patterns(self.validate_IliID_patterns_, value):
+                self.gds_collector_.add_message(
+                    'Value "%s" does not match xsd pattern restrictions: %s'
+                    % (
+                        encode_str_2_3(value),
+                        self.validate_IliID_patterns_,
+                    )
+                )
+
+    validate_IliID_patterns_ = [["^(([a-zA-Z_][0-9a-zA-Z_\\-\\.]*:)?[0-9a-zA-Z_][0-9a-zA-Z_\\-\\.]*)$"]]
+
+    def _hasContent(self):
+        if (
+            self.Name is not None
+            or self.AmtImWeb is not None
+            or self.UID is not None
+            or self.Zeile1 is not None
+            or self.Zeile2 is not None
+            or self.Strasse is not None
+            or self.Hausnr is not None
+            or self.PLZ is not None
+            or self.Ort is not None
+        ):
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OeREBKRM_V2_0.Amt.Amt",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("OeREBKRM_V2_0.Amt.Amt")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "OeREBKRM_V2_0.Amt.Amt":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(
+            outfile,
+            level,
+            already_processed,
+            namespaceprefix_,
+            name_="OeREBKRM_V2_0.Amt.Amt",
+        )
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="OeREBKRM_V2_0.Amt.Amt",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="OeREBKRM_V2_0.Amt.Amt",
+    ):
+        if self.TID is not None and "TID" not in already_processed:
+            already_processed.add("TID")
+            outfile.write(
+                " TID=%s"
+                % (self.gds_encode(self.gds_format_string(quote_attrib(self.TID), input_name="TID")),)
+            )
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OeREBKRM_V2_0.Amt.Amt",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.Name is not None:
+            namespaceprefix_ = self.Name_nsprefix_ + ":" if (UseCapturedNS_ and self.Name_nsprefix_) else ""
+            self.Name.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="Name",
+                pretty_print=pretty_print,
+            )
+        if self.AmtImWeb is not None:
+            namespaceprefix_ = (
+                self.AmtImWeb_nsprefix_ + ":" if (UseCapturedNS_ and self.AmtImWeb_nsprefix_) else ""
+            )
+            self.AmtImWeb.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="AmtImWeb",
+                pretty_print=pretty_print,
+            )
+        if self.UID is not None:
+            namespaceprefix_ = self.UID_nsprefix_ + ":" if (UseCapturedNS_ and self.UID_nsprefix_) else ""
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sUID>%s</%sUID>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(self.gds_format_string(quote_xml(self.UID), input_name="UID")),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.Zeile1 is not None:
+            namespaceprefix_ = (
+                self.Zeile1_nsprefix_ + ":" if (UseCapturedNS_ and self.Zeile1_nsprefix_) else ""
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sZeile1>%s</%sZeile1>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(self.gds_format_string(quote_xml(self.Zeile1), input_name="Zeile1")),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.Zeile2 is not None:
+            namespaceprefix_ = (
+                self.Zeile2_nsprefix_ + ":" if (UseCapturedNS_ and self.Zeile2_nsprefix_) else ""
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sZeile2>%s</%sZeile2>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(self.gds_format_string(quote_xml(self.Zeile2), input_name="Zeile2")),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.Strasse is not None:
+            namespaceprefix_ = (
+                self.Strasse_nsprefix_ + ":" if (UseCapturedNS_ and self.Strasse_nsprefix_) else ""
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sStrasse>%s</%sStrasse>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(self.gds_format_string(quote_xml(self.Strasse), input_name="Strasse")),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.Hausnr is not None:
+            namespaceprefix_ = (
+                self.Hausnr_nsprefix_ + ":" if (UseCapturedNS_ and self.Hausnr_nsprefix_) else ""
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sHausnr>%s</%sHausnr>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(self.gds_format_string(quote_xml(self.Hausnr), input_name="Hausnr")),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.PLZ is not None:
+            namespaceprefix_ = self.PLZ_nsprefix_ + ":" if (UseCapturedNS_ and self.PLZ_nsprefix_) else ""
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sPLZ>%s</%sPLZ>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(self.gds_format_string(quote_xml(self.PLZ), input_name="PLZ")),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.Ort is not None:
+            namespaceprefix_ = self.Ort_nsprefix_ + ":" if (UseCapturedNS_ and self.Ort_nsprefix_) else ""
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sOrt>%s</%sOrt>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(self.gds_format_string(quote_xml(self.Ort), input_name="Ort")),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_("TID", node)
+        if value is not None and "TID" not in already_processed:
+            already_processed.add("TID")
+            self.TID = value
+            self.validate_IliID(self.TID)  # validate type IliID
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "Name":
+            obj_ = NameType87.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.Name = obj_
+            obj_.original_tagname_ = "Name"
+        elif nodeName_ == "AmtImWeb":
+            obj_ = AmtImWebType.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.AmtImWeb = obj_
+            obj_.original_tagname_ = "AmtImWeb"
+        elif nodeName_ == "UID":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "UID")
+            value_ = self.gds_validate_string(value_, node, "UID")
+            self.UID = value_
+            self.UID_nsprefix_ = child_.prefix
+            # validate type OeREBKRM_V2_0.UID
+            self.validate_OeREBKRM_V2_0_UID(self.UID)
+        elif nodeName_ == "Zeile1":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "Zeile1")
+            value_ = self.gds_validate_string(value_, node, "Zeile1")
+            self.Zeile1 = value_
+            self.Zeile1_nsprefix_ = child_.prefix
+            # validate type Zeile1Type
+            self.validate_Zeile1Type(self.Zeile1)
+        elif nodeName_ == "Zeile2":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "Zeile2")
+            value_ = self.gds_validate_string(value_, node, "Zeile2")
+            self.Zeile2 = value_
+            self.Zeile2_nsprefix_ = child_.prefix
+            # validate type Zeile2Type
+            self.validate_Zeile2Type(self.Zeile2)
+        elif nodeName_ == "Strasse":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "Strasse")
+            value_ = self.gds_validate_string(value_, node, "Strasse")
+            self.Strasse = value_
+            self.Strasse_nsprefix_ = child_.prefix
+            # validate type StrasseType
+            self.validate_StrasseType(self.Strasse)
+        elif nodeName_ == "Hausnr":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "Hausnr")
+            value_ = self.gds_validate_string(value_, node, "Hausnr")
+            self.Hausnr = value_
+            self.Hausnr_nsprefix_ = child_.prefix
+            # validate type HausnrType
+            self.validate_HausnrType(self.Hausnr)
+        elif nodeName_ == "PLZ":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "PLZ")
+            value_ = self.gds_validate_string(value_, node, "PLZ")
+            self.PLZ = value_
+            self.PLZ_nsprefix_ = child_.prefix
+            # validate type PLZType
+            self.validate_PLZType(self.PLZ)
+        elif nodeName_ == "Ort":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "Ort")
+            value_ = self.gds_validate_string(value_, node, "Ort")
+            self.Ort = value_
+            self.Ort_nsprefix_ = child_.prefix
+            # validate type OrtType
+            self.validate_OrtType(self.Ort)
+
+
+# end class OeREBKRM_V2_0_Amt_Amt
+
+
+class OeREBKRM_V2_0_Dokumente_Dokument(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "TID": MemberSpec_("TID", "IliID", 0, 0, {"use": "required", "name": "TID"}),
+        "Typ": MemberSpec_(
+            "Typ",
+            ["OeREBKRM_V2_0.DokumentTyp", "xsd:string"],
+            0,
+            0,
+            {"name": "Typ", "type": "xsd:string"},
+            None,
+        ),
+        "Titel": MemberSpec_("Titel", "TitelType", 0, 0, {"name": "Titel", "type": "TitelType"}, None),
+        "Abkuerzung": MemberSpec_(
+            "Abkuerzung",
+            "AbkuerzungType",
+            0,
+            1,
+            {"minOccurs": "0", "name": "Abkuerzung", "type": "AbkuerzungType"},
+            None,
+        ),
+        "OffizielleNr": MemberSpec_(
+            "OffizielleNr",
+            "OffizielleNrType",
+            0,
+            1,
+            {"minOccurs": "0", "name": "OffizielleNr", "type": "OffizielleNrType"},
+            None,
+        ),
+        "NurInGemeinde": MemberSpec_(
+            "NurInGemeinde",
+            ["CHAdminCodes_V1.CHMunicipalityCode", "xsd:integer"],
+            0,
+            1,
+            {"minOccurs": "0", "name": "NurInGemeinde", "type": "xsd:integer"},
+            None,
+        ),
+        "TextImWeb": MemberSpec_(
+            "TextImWeb",
+            "TextImWebType",
+            0,
+            1,
+            {"minOccurs": "0", "name": "TextImWeb", "type": "TextImWebType"},
+            None,
+        ),
+        "Dokument": MemberSpec_(
+            "Dokument",
+            "DokumentType",
+            0,
+            1,
+            {"minOccurs": "0", "name": "Dokument", "type": "DokumentType"},
+            None,
+        ),
+        "AuszugIndex": MemberSpec_(
+            "AuszugIndex",
+            ["AuszugIndexType", "xsd:integer"],
+            0,
+            0,
+            {"name": "AuszugIndex", "type": "xsd:integer"},
+            None,
+        ),
+        "Rechtsstatus": MemberSpec_(
+            "Rechtsstatus",
+            ["OeREBKRM_V2_0.RechtsStatus", "xsd:string"],
+            0,
+            0,
+            {"name": "Rechtsstatus", "type": "xsd:string"},
+            None,
+        ),
+        "publiziertAb": MemberSpec_(
+            "publiziertAb",
+            ["OeREBKRM_V2_0.Datum", "xsd:date"],
+            0,
+            0,
+            {"name": "publiziertAb", "type": "xsd:date"},
+            None,
+        ),
+        "publiziertBis": MemberSpec_(
+            "publiziertBis",
+            ["OeREBKRM_V2_0.Datum", "xsd:date"],
+            0,
+            1,
+            {"minOccurs": "0", "name": "publiziertBis", "type": "xsd:date"},
+            None,
+        ),
+        "ZustaendigeStelle": MemberSpec_(
+            "ZustaendigeStelle",
+            "ZustaendigeStelleType",
+            0,
+            0,
+            {"name": "ZustaendigeStelle", "type": "ZustaendigeStelleType"},
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(
+        self,
+        TID=None,
+        Typ=None,
+        Titel=None,
+        Abkuerzung=None,
+        OffizielleNr=None,
+        NurInGemeinde=None,
+        TextImWeb=None,
+        Dokument=None,
+        AuszugIndex=None,
+        Rechtsstatus=None,
+        publiziertAb=None,
+        publiziertBis=None,
+        ZustaendigeStelle=None,
+        gds_collector_=None,
+        **kwargs_
+    ):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        self.TID = _cast(None, TID)
+        self.TID_nsprefix_ = None
+        self.Typ = Typ
+        self.validate_OeREBKRM_V2_0_DokumentTyp(self.Typ)
+        self.Typ_nsprefix_ = None
+        if Titel is None:
+            self.Titel = globals()["TitelType"]()
+        else:
+            self.Titel = Titel
+        self.Titel_nsprefix_ = None
+        self.Abkuerzung = Abkuerzung
+        self.Abkuerzung_nsprefix_ = None
+        self.OffizielleNr = OffizielleNr
+        self.OffizielleNr_nsprefix_ = None
+        self.NurInGemeinde = NurInGemeinde
+        self.validate_CHAdminCodes_V1_CHMunicipalityCode(self.NurInGemeinde)
+        self.NurInGemeinde_nsprefix_ = None
+        self.TextImWeb = TextImWeb
+        self.TextImWeb_nsprefix_ = None
+        self.Dokument = Dokument
+        self.Dokument_nsprefix_ = None
+        self.AuszugIndex = AuszugIndex
+        self.validate_AuszugIndexType(self.AuszugIndex)
+        self.AuszugIndex_nsprefix_ = None
+        self.Rechtsstatus = Rechtsstatus
+        self.validate_OeREBKRM_V2_0_RechtsStatus(self.Rechtsstatus)
+        self.Rechtsstatus_nsprefix_ = None
+        if isinstance(publiziertAb, BaseStrType_):
+            initvalue_ = datetime_.datetime.strptime(publiziertAb, "%Y-%m-%d").date()
+        else:
+            initvalue_ = publiziertAb
+        self.publiziertAb = initvalue_
+        self.publiziertAb_nsprefix_ = None
+        if isinstance(publiziertBis, BaseStrType_):
+            initvalue_ = datetime_.datetime.strptime(publiziertBis, "%Y-%m-%d").date()
+        else:
+            initvalue_ = publiziertBis
+        self.publiziertBis = initvalue_
+        self.publiziertBis_nsprefix_ = None
+        if ZustaendigeStelle is None:
+            self.ZustaendigeStelle = globals()["ZustaendigeStelleType"]()
+        else:
+            self.ZustaendigeStelle = ZustaendigeStelle
+        self.ZustaendigeStelle_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, OeREBKRM_V2_0_Dokumente_Dokument)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if OeREBKRM_V2_0_Dokumente_Dokument.subclass:
+            return OeREBKRM_V2_0_Dokumente_Dokument.subclass(*args_, **kwargs_)
+        else:
+            return OeREBKRM_V2_0_Dokumente_Dokument(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_Typ(self):
+        return self.Typ
+
+    def set_Typ(self, Typ):
+        self.Typ = Typ
+
+    def get_Titel(self):
+        return self.Titel
+
+    def set_Titel(self, Titel):
+        self.Titel = Titel
+
+    def get_Abkuerzung(self):
+        return self.Abkuerzung
+
+    def set_Abkuerzung(self, Abkuerzung):
+        self.Abkuerzung = Abkuerzung
+
+    def get_OffizielleNr(self):
+        return self.OffizielleNr
+
+    def set_OffizielleNr(self, OffizielleNr):
+        self.OffizielleNr = OffizielleNr
+
+    def get_NurInGemeinde(self):
+        return self.NurInGemeinde
+
+    def set_NurInGemeinde(self, NurInGemeinde):
+        self.NurInGemeinde = NurInGemeinde
+
+    def get_TextImWeb(self):
+        return self.TextImWeb
+
+    def set_TextImWeb(self, TextImWeb):
+        self.TextImWeb = TextImWeb
+
+    def get_Dokument(self):
+        return self.Dokument
+
+    def set_Dokument(self, Dokument):
+        self.Dokument = Dokument
+
+    def get_AuszugIndex(self):
+        return self.AuszugIndex
+
+    def set_AuszugIndex(self, AuszugIndex):
+        self.AuszugIndex = AuszugIndex
+
+    def get_Rechtsstatus(self):
+        return self.Rechtsstatus
+
+    def set_Rechtsstatus(self, Rechtsstatus):
+        self.Rechtsstatus = Rechtsstatus
+
+    def get_publiziertAb(self):
+        return self.publiziertAb
+
+    def set_publiziertAb(self, publiziertAb):
+        self.publiziertAb = publiziertAb
+
+    def get_publiziertBis(self):
+        return self.publiziertBis
+
+    def set_publiziertBis(self, publiziertBis):
+        self.publiziertBis = publiziertBis
+
+    def get_ZustaendigeStelle(self):
+        return self.ZustaendigeStelle
+
+    def set_ZustaendigeStelle(self, ZustaendigeStelle):
+        self.ZustaendigeStelle = ZustaendigeStelle
+
+    def get_TID(self):
+        return self.TID
+
+    def set_TID(self, TID):
+        self.TID = TID
+
+    def validate_OeREBKRM_V2_0_DokumentTyp(self, value):
+        result = True
+        # Validate type OeREBKRM_V2_0.DokumentTyp, a restriction on xsd:string.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            value = value
+            enumerations = ["Rechtsvorschrift", "GesetzlicheGrundlage", "Hinweis"]
+            if value not in enumerations:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd enumeration restriction on OeREBKRM_V2_0.DokumentTyp'
+                    % {"value": encode_str_2_3(value), "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def validate_CHAdminCodes_V1_CHMunicipalityCode(self, value):
+        result = True
+        # Validate type CHAdminCodes_V1.CHMunicipalityCode, a restriction on xsd:integer.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, int):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (int)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if value < 1:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd minInclusive restriction on CHAdminCodes_V1.CHMunicipalityCode'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+            if value > 9999:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd maxInclusive restriction on CHAdminCodes_V1.CHMunicipalityCode'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def validate_AuszugIndexType(self, value):
+        result = True
+        # Validate type AuszugIndexType, a restriction on xsd:integer.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, int):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (int)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if value < -1000:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd minInclusive restriction on AuszugIndexType'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+            if value > 1000:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd maxInclusive restriction on AuszugIndexType'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def validate_OeREBKRM_V2_0_RechtsStatus(self, value):
+        result = True
+        # Validate type OeREBKRM_V2_0.RechtsStatus, a restriction on xsd:string.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            value = value
+            enumerations = [
+                "inKraft",
+                "AenderungMitVorwirkung",
+                "AenderungOhneVorwirkung",
+            ]
+            if value not in enumerations:
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd enumeration restriction on OeREBKRM_V2_0.RechtsStatus'
+                    % {"value": encode_str_2_3(value), "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def validate_OeREBKRM_V2_0_Datum(self, value):
+        result = True
+        # Validate type OeREBKRM_V2_0.Datum, a restriction on xsd:date.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, datetime_.date):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (datetime_.date)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if value < self.gds_parse_date("1848-01-01"):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd minInclusive restriction on OeREBKRM_V2_0.Datum'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+            if value > self.gds_parse_date("2100-12-31"):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s does not match xsd maxInclusive restriction on OeREBKRM_V2_0.Datum'
+                    % {"value": value, "lineno": lineno}
+                )
+                result = False
+        return result
+
+    def validate_IliID(self, value):
+        # Validate type IliID, a restriction on xsd:string.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if not self.gds_validate_simple_patterns(self.validate_IliID_patterns_, value):
+                self.gds_collector_.add_message(
+                    'Value "%s" does not match xsd pattern restrictions: %s'
+                    % (
+                        encode_str_2_3(value),
+                        self.validate_IliID_patterns_,
+                    )
+                )
+
+    validate_IliID_patterns_ = [["^(([a-zA-Z_][0-9a-zA-Z_\\-\\.]*:)?[0-9a-zA-Z_][0-9a-zA-Z_\\-\\.]*)$"]]
+
+    def _hasContent(self):
+        if (
+            self.Typ is not None
+            or self.Titel is not None
+            or self.Abkuerzung is not None
+            or self.OffizielleNr is not None
+            or self.NurInGemeinde is not None
+            or self.TextImWeb is not None
+            or self.Dokument is not None
+            or self.AuszugIndex is not None
+            or self.Rechtsstatus is not None
+            or self.publiziertAb is not None
+            or self.publiziertBis is not None
+            or self.ZustaendigeStelle is not None
+        ):
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OeREBKRM_V2_0.Dokumente.Dokument",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("OeREBKRM_V2_0.Dokumente.Dokument")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "OeREBKRM_V2_0.Dokumente.Dokument":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(
+            outfile,
+            level,
+            already_processed,
+            namespaceprefix_,
+            name_="OeREBKRM_V2_0.Dokumente.Dokument",
+        )
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="OeREBKRM_V2_0.Dokumente.Dokument",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="OeREBKRM_V2_0.Dokumente.Dokument",
+    ):
+        if self.TID is not None and "TID" not in already_processed:
+            already_processed.add("TID")
+            outfile.write(
+                " TID=%s"
+                % (self.gds_encode(self.gds_format_string(quote_attrib(self.TID), input_name="TID")),)
+            )
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OeREBKRM_V2_0.Dokumente.Dokument",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.Typ is not None:
+            namespaceprefix_ = self.Typ_nsprefix_ + ":" if (UseCapturedNS_ and self.Typ_nsprefix_) else ""
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sTyp>%s</%sTyp>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(self.gds_format_string(quote_xml(self.Typ), input_name="Typ")),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.Titel is not None:
+            namespaceprefix_ = self.Titel_nsprefix_ + ":" if (UseCapturedNS_ and self.Titel_nsprefix_) else ""
+            self.Titel.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="Titel",
+                pretty_print=pretty_print,
+            )
+        if self.Abkuerzung is not None:
+            namespaceprefix_ = (
+                self.Abkuerzung_nsprefix_ + ":" if (UseCapturedNS_ and self.Abkuerzung_nsprefix_) else ""
+            )
+            self.Abkuerzung.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="Abkuerzung",
+                pretty_print=pretty_print,
+            )
+        if self.OffizielleNr is not None:
+            namespaceprefix_ = (
+                self.OffizielleNr_nsprefix_ + ":" if (UseCapturedNS_ and self.OffizielleNr_nsprefix_) else ""
+            )
+            self.OffizielleNr.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="OffizielleNr",
+                pretty_print=pretty_print,
+            )
+        if self.NurInGemeinde is not None:
+            namespaceprefix_ = (
+                self.NurInGemeinde_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.NurInGemeinde_nsprefix_)
+                else ""
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sNurInGemeinde>%s</%sNurInGemeinde>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_format_integer(self.NurInGemeinde, input_name="NurInGemeinde"),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.TextImWeb is not None:
+            namespaceprefix_ = (
+                self.TextImWeb_nsprefix_ + ":" if (UseCapturedNS_ and self.TextImWeb_nsprefix_) else ""
+            )
+            self.TextImWeb.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="TextImWeb",
+                pretty_print=pretty_print,
+            )
+        if self.Dokument is not None:
+            namespaceprefix_ = (
+                self.Dokument_nsprefix_ + ":" if (UseCapturedNS_ and self.Dokument_nsprefix_) else ""
+            )
+            self.Dokument.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="Dokument",
+                pretty_print=pretty_print,
+            )
+        if self.AuszugIndex is not None:
+            namespaceprefix_ = (
+                self.AuszugIndex_nsprefix_ + ":" if (UseCapturedNS_ and self.AuszugIndex_nsprefix_) else ""
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sAuszugIndex>%s</%sAuszugIndex>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_format_integer(self.AuszugIndex, input_name="AuszugIndex"),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.Rechtsstatus is not None:
+            namespaceprefix_ = (
+                self.Rechtsstatus_nsprefix_ + ":" if (UseCapturedNS_ and self.Rechtsstatus_nsprefix_) else ""
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sRechtsstatus>%s</%sRechtsstatus>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(
+                        self.gds_format_string(quote_xml(self.Rechtsstatus), input_name="Rechtsstatus")
+                    ),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.publiziertAb is not None:
+            namespaceprefix_ = (
+                self.publiziertAb_nsprefix_ + ":" if (UseCapturedNS_ and self.publiziertAb_nsprefix_) else ""
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%spubliziertAb>%s</%spubliziertAb>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_format_date(self.publiziertAb, input_name="publiziertAb"),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.publiziertBis is not None:
+            namespaceprefix_ = (
+                self.publiziertBis_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.publiziertBis_nsprefix_)
+                else ""
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%spubliziertBis>%s</%spubliziertBis>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_format_date(self.publiziertBis, input_name="publiziertBis"),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+        if self.ZustaendigeStelle is not None:
+            namespaceprefix_ = (
+                self.ZustaendigeStelle_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.ZustaendigeStelle_nsprefix_)
+                else ""
+            )
+            self.ZustaendigeStelle.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="ZustaendigeStelle",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_("TID", node)
+        if value is not None and "TID" not in already_processed:
+            already_processed.add("TID")
+            self.TID = value
+            self.validate_IliID(self.TID)  # validate type IliID
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "Typ":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "Typ")
+            value_ = self.gds_validate_string(value_, node, "Typ")
+            self.Typ = value_
+            self.Typ_nsprefix_ = child_.prefix
+            # validate type OeREBKRM_V2_0.DokumentTyp
+            self.validate_OeREBKRM_V2_0_DokumentTyp(self.Typ)
+        elif nodeName_ == "Titel":
+            obj_ = TitelType.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.Titel = obj_
+            obj_.original_tagname_ = "Titel"
+        elif nodeName_ == "Abkuerzung":
+            obj_ = AbkuerzungType.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.Abkuerzung = obj_
+            obj_.original_tagname_ = "Abkuerzung"
+        elif nodeName_ == "OffizielleNr":
+            obj_ = OffizielleNrType.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.OffizielleNr = obj_
+            obj_.original_tagname_ = "OffizielleNr"
+        elif nodeName_ == "NurInGemeinde" and child_.text:
+            sval_ = child_.text
+            ival_ = self.gds_parse_integer(sval_, node, "NurInGemeinde")
+            ival_ = self.gds_validate_integer(ival_, node, "NurInGemeinde")
+            self.NurInGemeinde = ival_
+            self.NurInGemeinde_nsprefix_ = child_.prefix
+            # validate type CHAdminCodes_V1.CHMunicipalityCode
+            self.validate_CHAdminCodes_V1_CHMunicipalityCode(self.NurInGemeinde)
+        elif nodeName_ == "TextImWeb":
+            obj_ = TextImWebType.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.TextImWeb = obj_
+            obj_.original_tagname_ = "TextImWeb"
+        elif nodeName_ == "Dokument":
+            obj_ = DokumentType.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.Dokument = obj_
+            obj_.original_tagname_ = "Dokument"
+        elif nodeName_ == "AuszugIndex" and child_.text:
+            sval_ = child_.text
+            ival_ = self.gds_parse_integer(sval_, node, "AuszugIndex")
+            ival_ = self.gds_validate_integer(ival_, node, "AuszugIndex")
+            self.AuszugIndex = ival_
+            self.AuszugIndex_nsprefix_ = child_.prefix
+            # validate type AuszugIndexType
+            self.validate_AuszugIndexType(self.AuszugIndex)
+        elif nodeName_ == "Rechtsstatus":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "Rechtsstatus")
+            value_ = self.gds_validate_string(value_, node, "Rechtsstatus")
+            self.Rechtsstatus = value_
+            self.Rechtsstatus_nsprefix_ = child_.prefix
+            # validate type OeREBKRM_V2_0.RechtsStatus
+            self.validate_OeREBKRM_V2_0_RechtsStatus(self.Rechtsstatus)
+        elif nodeName_ == "publiziertAb":
+            sval_ = child_.text
+            dval_ = self.gds_parse_date(sval_)
+            self.publiziertAb = dval_
+            self.publiziertAb_nsprefix_ = child_.prefix
+            # validate type OeREBKRM_V2_0.Datum
+            self.validate_OeREBKRM_V2_0_Datum(self.publiziertAb)
+        elif nodeName_ == "publiziertBis":
+            sval_ = child_.text
+            dval_ = self.gds_parse_date(sval_)
+            self.publiziertBis = dval_
+            self.publiziertBis_nsprefix_ = child_.prefix
+            # validate type OeREBKRM_V2_0.Datum
+            self.validate_OeREBKRM_V2_0_Datum(self.publiziertBis)
+        elif nodeName_ == "ZustaendigeStelle":
+            obj_ = ZustaendigeStelleType.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.ZustaendigeStelle = obj_
+            obj_.original_tagname_ = "ZustaendigeStelle"
+
+
+# end class OeREBKRM_V2_0_Dokumente_Dokument
+
+
+class HeaderSection(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "VERSION": MemberSpec_("VERSION", "xsd:decimal", 0, 0, {"use": "required", "name": "VERSION"}),
+        "SENDER": MemberSpec_("SENDER", "xsd:string", 0, 0, {"use": "required", "name": "SENDER"}),
+        "MODELS": MemberSpec_("MODELS", "Models", 0, 0, {"name": "MODELS", "type": "Models"}, None),
+        "OIDSPACES": MemberSpec_(
+            "OIDSPACES",
+            "OidSpaces",
+            0,
+            1,
+            {"minOccurs": "0", "name": "OIDSPACES", "type": "OidSpaces"},
+            None,
+        ),
+        "COMMENT": MemberSpec_(
+            "COMMENT",
+            "xsd:string",
+            0,
+            1,
+            {"minOccurs": "0", "name": "COMMENT", "type": "xsd:string"},
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(
+        self,
+        VERSION=2.3,
+        SENDER=None,
+        MODELS=None,
+        OIDSPACES=None,
+        COMMENT=None,
+        gds_collector_=None,
+        **kwargs_
+    ):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        self.VERSION = _cast(float, VERSION)
+        self.VERSION_nsprefix_ = None
+        self.SENDER = _cast(None, SENDER)
+        self.SENDER_nsprefix_ = None
+        if MODELS is None:
+            self.MODELS = globals()["Models"]()
+        else:
+            self.MODELS = MODELS
+        self.MODELS_nsprefix_ = None
+        self.OIDSPACES = OIDSPACES
+        self.OIDSPACES_nsprefix_ = None
+        self.COMMENT = COMMENT
+        self.COMMENT_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, HeaderSection)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if HeaderSection.subclass:
+            return HeaderSection.subclass(*args_, **kwargs_)
+        else:
+            return HeaderSection(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_MODELS(self):
+        return self.MODELS
+
+    def set_MODELS(self, MODELS):
+        self.MODELS = MODELS
+
+    def get_OIDSPACES(self):
+        return self.OIDSPACES
+
+    def set_OIDSPACES(self, OIDSPACES):
+        self.OIDSPACES = OIDSPACES
+
+    def get_COMMENT(self):
+        return self.COMMENT
+
+    def set_COMMENT(self, COMMENT):
+        self.COMMENT = COMMENT
+
+    def get_VERSION(self):
+        return self.VERSION
+
+    def set_VERSION(self, VERSION):
+        self.VERSION = VERSION
+
+    def get_SENDER(self):
+        return self.SENDER
+
+    def set_SENDER(self, SENDER):
+        self.SENDER = SENDER
+
+    def _hasContent(self):
+        if self.MODELS is not None or self.OIDSPACES is not None or self.COMMENT is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="HeaderSection",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("HeaderSection")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "HeaderSection":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_="HeaderSection")
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="HeaderSection",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="HeaderSection",
+    ):
+        if self.VERSION is not None and "VERSION" not in already_processed:
+            already_processed.add("VERSION")
+            outfile.write(' VERSION="%s"' % self.gds_format_decimal(self.VERSION, input_name="VERSION"))
+        if self.SENDER is not None and "SENDER" not in already_processed:
+            already_processed.add("SENDER")
+            outfile.write(
+                " SENDER=%s"
+                % (self.gds_encode(self.gds_format_string(quote_attrib(self.SENDER), input_name="SENDER")),)
+            )
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="HeaderSection",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.MODELS is not None:
+            namespaceprefix_ = (
+                self.MODELS_nsprefix_ + ":" if (UseCapturedNS_ and self.MODELS_nsprefix_) else ""
+            )
+            self.MODELS.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="MODELS",
+                pretty_print=pretty_print,
+            )
+        if self.OIDSPACES is not None:
+            namespaceprefix_ = (
+                self.OIDSPACES_nsprefix_ + ":" if (UseCapturedNS_ and self.OIDSPACES_nsprefix_) else ""
+            )
+            self.OIDSPACES.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="OIDSPACES",
+                pretty_print=pretty_print,
+            )
+        if self.COMMENT is not None:
+            namespaceprefix_ = (
+                self.COMMENT_nsprefix_ + ":" if (UseCapturedNS_ and self.COMMENT_nsprefix_) else ""
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write(
+                "<%sCOMMENT>%s</%sCOMMENT>%s"
+                % (
+                    namespaceprefix_,
+                    self.gds_encode(self.gds_format_string(quote_xml(self.COMMENT), input_name="COMMENT")),
+                    namespaceprefix_,
+                    eol_,
+                )
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_("VERSION", node)
+        if value is not None and "VERSION" not in already_processed:
+            already_processed.add("VERSION")
+            value = self.gds_parse_decimal(value, node, "VERSION")
+            self.VERSION = value
+        value = find_attr_value_("SENDER", node)
+        if value is not None and "SENDER" not in already_processed:
+            already_processed.add("SENDER")
+            self.SENDER = value
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "MODELS":
+            obj_ = Models.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.MODELS = obj_
+            obj_.original_tagname_ = "MODELS"
+        elif nodeName_ == "OIDSPACES":
+            obj_ = OidSpaces.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.OIDSPACES = obj_
+            obj_.original_tagname_ = "OIDSPACES"
+        elif nodeName_ == "COMMENT":
+            value_ = child_.text
+            value_ = self.gds_parse_string(value_, node, "COMMENT")
+            value_ = self.gds_validate_string(value_, node, "COMMENT")
+            self.COMMENT = value_
+            self.COMMENT_nsprefix_ = child_.prefix
+
+
+# end class HeaderSection
+
+
+class OidSpaces(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "OIDSPACE": MemberSpec_(
+            "OIDSPACE",
+            "OidSpace",
+            1,
+            1,
+            {
+                "maxOccurs": "unbounded",
+                "minOccurs": "0",
+                "name": "OIDSPACE",
+                "type": "OidSpace",
+            },
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, OIDSPACE=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if OIDSPACE is None:
+            self.OIDSPACE = []
+        else:
+            self.OIDSPACE = OIDSPACE
+        self.OIDSPACE_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, OidSpaces)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if OidSpaces.subclass:
+            return OidSpaces.subclass(*args_, **kwargs_)
+        else:
+            return OidSpaces(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_OIDSPACE(self):
+        return self.OIDSPACE
+
+    def set_OIDSPACE(self, OIDSPACE):
+        self.OIDSPACE = OIDSPACE
+
+    def add_OIDSPACE(self, value):
+        self.OIDSPACE.append(value)
+
+    def insert_OIDSPACE_at(self, index, value):
+        self.OIDSPACE.insert(index, value)
+
+    def replace_OIDSPACE_at(self, index, value):
+        self.OIDSPACE[index] = value
+
+    def _hasContent(self):
+        if self.OIDSPACE:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OidSpaces",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("OidSpaces")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "OidSpaces":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_="OidSpaces")
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="OidSpaces",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(self, outfile, level, already_processed, namespaceprefix_="", name_="OidSpaces"):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OidSpaces",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        for OIDSPACE_ in self.OIDSPACE:
+            namespaceprefix_ = (
+                self.OIDSPACE_nsprefix_ + ":" if (UseCapturedNS_ and self.OIDSPACE_nsprefix_) else ""
+            )
+            OIDSPACE_.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="OIDSPACE",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "OIDSPACE":
+            obj_ = OidSpace.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.OIDSPACE.append(obj_)
+            obj_.original_tagname_ = "OIDSPACE"
+
+
+# end class OidSpaces
+
+
+class OidSpace(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "NAME": MemberSpec_("NAME", "xsd:string", 0, 0, {"use": "required", "name": "NAME"}),
+        "OIDDOMAIN": MemberSpec_("OIDDOMAIN", "xsd:string", 0, 0, {"use": "required", "name": "OIDDOMAIN"}),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, NAME=None, OIDDOMAIN=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        self.NAME = _cast(None, NAME)
+        self.NAME_nsprefix_ = None
+        self.OIDDOMAIN = _cast(None, OIDDOMAIN)
+        self.OIDDOMAIN_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, OidSpace)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if OidSpace.subclass:
+            return OidSpace.subclass(*args_, **kwargs_)
+        else:
+            return OidSpace(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_NAME(self):
+        return self.NAME
+
+    def set_NAME(self, NAME):
+        self.NAME = NAME
+
+    def get_OIDDOMAIN(self):
+        return self.OIDDOMAIN
+
+    def set_OIDDOMAIN(self, OIDDOMAIN):
+        self.OIDDOMAIN = OIDDOMAIN
+
+    def _hasContent(self):
+        if ():
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_="",
+        name_="OidSpace",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("OidSpace")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "OidSpace":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_="OidSpace")
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="OidSpace",
+                pretty_print=pretty_print,
+            )
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(self, outfile, level, already_processed, namespaceprefix_="", name_="OidSpace"):
+        if self.NAME is not None and "NAME" not in already_processed:
+            already_processed.add("NAME")
+            outfile.write(
+                " NAME=%s"
+                % (self.gds_encode(self.gds_format_string(quote_attrib(self.NAME), input_name="NAME")),)
+            )
+        if self.OIDDOMAIN is not None and "OIDDOMAIN" not in already_processed:
+            already_processed.add("OIDDOMAIN")
+            outfile.write(
+                " OIDDOMAIN=%s"
+                % (
+                    self.gds_encode(
+                        self.gds_format_string(quote_attrib(self.OIDDOMAIN), input_name="OIDDOMAIN")
+                    ),
+                )
+            )
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_="",
+        name_="OidSpace",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        pass
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_("NAME", node)
+        if value is not None and "NAME" not in already_processed:
+            already_processed.add("NAME")
+            self.NAME = value
+        value = find_attr_value_("OIDDOMAIN", node)
+        if value is not None and "OIDDOMAIN" not in already_processed:
+            already_processed.add("OIDDOMAIN")
+            self.OIDDOMAIN = value
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        pass
+
+
+# end class OidSpace
+
+
+class LocalisedTextType(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "LocalisationCH_V1_LocalisedText": MemberSpec_(
+            "LocalisationCH_V1_LocalisedText",
+            "LocalisationCH_V1.LocalisedText",
+            1,
+            0,
+            {
+                "maxOccurs": "unbounded",
+                "name": "LocalisationCH_V1.LocalisedText",
+                "type": "LocalisationCH_V1.LocalisedText",
+            },
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, LocalisationCH_V1_LocalisedText=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if LocalisationCH_V1_LocalisedText is None:
+            self.LocalisationCH_V1_LocalisedText = []
+        else:
+            self.LocalisationCH_V1_LocalisedText = LocalisationCH_V1_LocalisedText
+        self.LocalisationCH_V1_LocalisedText_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, LocalisedTextType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if LocalisedTextType.subclass:
+            return LocalisedTextType.subclass(*args_, **kwargs_)
+        else:
+            return LocalisedTextType(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_LocalisationCH_V1_LocalisedText(self):
+        return self.LocalisationCH_V1_LocalisedText
+
+    def set_LocalisationCH_V1_LocalisedText(self, LocalisationCH_V1_LocalisedText):
+        self.LocalisationCH_V1_LocalisedText = LocalisationCH_V1_LocalisedText
+
+    def add_LocalisationCH_V1_LocalisedText(self, value):
+        self.LocalisationCH_V1_LocalisedText.append(value)
+
+    def insert_LocalisationCH_V1_LocalisedText_at(self, index, value):
+        self.LocalisationCH_V1_LocalisedText.insert(index, value)
+
+    def replace_LocalisationCH_V1_LocalisedText_at(self, index, value):
+        self.LocalisationCH_V1_LocalisedText[index] = value
+
+    def _hasContent(self):
+        if self.LocalisationCH_V1_LocalisedText:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="LocalisedTextType",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("LocalisedTextType")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "LocalisedTextType":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(
+            outfile,
+            level,
+            already_processed,
+            namespaceprefix_,
+            name_="LocalisedTextType",
+        )
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="LocalisedTextType",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="LocalisedTextType",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="LocalisedTextType",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        for LocalisationCH_V1_LocalisedText_ in self.LocalisationCH_V1_LocalisedText:
+            namespaceprefix_ = (
+                self.LocalisationCH_V1_LocalisedText_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.LocalisationCH_V1_LocalisedText_nsprefix_)
+                else ""
+            )
+            LocalisationCH_V1_LocalisedText_.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="LocalisationCH_V1.LocalisedText",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "LocalisationCH_V1.LocalisedText":
+            obj_ = LocalisationCH_V1_LocalisedText.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.LocalisationCH_V1_LocalisedText.append(obj_)
+            obj_.original_tagname_ = "LocalisationCH_V1.LocalisedText"
+
+
+# end class LocalisedTextType
+
+
+class BlobType(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "BINBLBOX": MemberSpec_(
+            "BINBLBOX",
+            "BINBLBOXType",
+            0,
+            0,
+            {"name": "BINBLBOX", "type": "BINBLBOXType"},
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, BINBLBOX=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        self.BINBLBOX = BINBLBOX
+        self.BINBLBOX_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, BlobType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if BlobType.subclass:
+            return BlobType.subclass(*args_, **kwargs_)
+        else:
+            return BlobType(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_BINBLBOX(self):
+        return self.BINBLBOX
+
+    def set_BINBLBOX(self, BINBLBOX):
+        self.BINBLBOX = BINBLBOX
+
+    def _hasContent(self):
+        if self.BINBLBOX is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="BlobType",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("BlobType")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "BlobType":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_="BlobType")
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="BlobType",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(self, outfile, level, already_processed, namespaceprefix_="", name_="BlobType"):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="BlobType",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.BINBLBOX is not None:
+            namespaceprefix_ = (
+                self.BINBLBOX_nsprefix_ + ":" if (UseCapturedNS_ and self.BINBLBOX_nsprefix_) else ""
+            )
+            self.BINBLBOX.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="BINBLBOX",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "BINBLBOX":
+            obj_ = BINBLBOXType.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.BINBLBOX = obj_
+            obj_.original_tagname_ = "BINBLBOX"
+
+
+# end class BlobType
+
+
+class BINBLBOXType(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "valueOf_": MemberSpec_("valueOf_", "xsd:base64Binary", 0),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, valueOf_=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        self.valueOf_ = valueOf_
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, BINBLBOXType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if BINBLBOXType.subclass:
+            return BINBLBOXType.subclass(*args_, **kwargs_)
+        else:
+            return BINBLBOXType(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_valueOf_(self):
+        return self.valueOf_
+
+    def set_valueOf_(self, valueOf_):
+        self.valueOf_ = valueOf_
+
+    def _hasContent(self):
+        if 1 if type(self.valueOf_) in [int, float] else self.valueOf_:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_="",
+        name_="BINBLBOXType",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("BINBLBOXType")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "BINBLBOXType":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_="BINBLBOXType")
+        outfile.write(">")
+        self._exportChildren(
+            outfile,
+            level + 1,
+            namespaceprefix_,
+            namespacedef_,
+            name_,
+            pretty_print=pretty_print,
+        )
+        outfile.write(self.convert_unicode(self.valueOf_))
+        outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="BINBLBOXType",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_="",
+        name_="BINBLBOXType",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        pass
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        self.valueOf_ = get_all_text_(node)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        pass
+
+
+# end class BINBLBOXType
+
+
+class LocalisedBlobType(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "OeREBKRM_V2_0_LocalisedBlob": MemberSpec_(
+            "OeREBKRM_V2_0_LocalisedBlob",
+            "OeREBKRM_V2_0.LocalisedBlob",
+            1,
+            0,
+            {
+                "maxOccurs": "unbounded",
+                "name": "OeREBKRM_V2_0.LocalisedBlob",
+                "type": "OeREBKRM_V2_0.LocalisedBlob",
+            },
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, OeREBKRM_V2_0_LocalisedBlob=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if OeREBKRM_V2_0_LocalisedBlob is None:
+            self.OeREBKRM_V2_0_LocalisedBlob = []
+        else:
+            self.OeREBKRM_V2_0_LocalisedBlob = OeREBKRM_V2_0_LocalisedBlob
+        self.OeREBKRM_V2_0_LocalisedBlob_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, LocalisedBlobType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if LocalisedBlobType.subclass:
+            return LocalisedBlobType.subclass(*args_, **kwargs_)
+        else:
+            return LocalisedBlobType(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_OeREBKRM_V2_0_LocalisedBlob(self):
+        return self.OeREBKRM_V2_0_LocalisedBlob
+
+    def set_OeREBKRM_V2_0_LocalisedBlob(self, OeREBKRM_V2_0_LocalisedBlob):
+        self.OeREBKRM_V2_0_LocalisedBlob = OeREBKRM_V2_0_LocalisedBlob
+
+    def add_OeREBKRM_V2_0_LocalisedBlob(self, value):
+        self.OeREBKRM_V2_0_LocalisedBlob.append(value)
+
+    def insert_OeREBKRM_V2_0_LocalisedBlob_at(self, index, value):
+        self.OeREBKRM_V2_0_LocalisedBlob.insert(index, value)
+
+    def replace_OeREBKRM_V2_0_LocalisedBlob_at(self, index, value):
+        self.OeREBKRM_V2_0_LocalisedBlob[index] = value
+
+    def _hasContent(self):
+        if self.OeREBKRM_V2_0_LocalisedBlob:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="LocalisedBlobType",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("LocalisedBlobType")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "LocalisedBlobType":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(
+            outfile,
+            level,
+            already_processed,
+            namespaceprefix_,
+            name_="LocalisedBlobType",
+        )
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="LocalisedBlobType",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="LocalisedBlobType",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="LocalisedBlobType",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        for OeREBKRM_V2_0_LocalisedBlob_ in self.OeREBKRM_V2_0_LocalisedBlob:
+            namespaceprefix_ = (
+                self.OeREBKRM_V2_0_LocalisedBlob_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.OeREBKRM_V2_0_LocalisedBlob_nsprefix_)
+                else ""
+            )
+            OeREBKRM_V2_0_LocalisedBlob_.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="OeREBKRM_V2_0.LocalisedBlob",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "OeREBKRM_V2_0.LocalisedBlob":
+            obj_ = OeREBKRM_V2_0_LocalisedBlob.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.OeREBKRM_V2_0_LocalisedBlob.append(obj_)
+            obj_.original_tagname_ = "OeREBKRM_V2_0.LocalisedBlob"
+
+
+# end class LocalisedBlobType
+
+
+class LocalisedTextType86(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "OeREBKRM_V2_0_LocalisedUri": MemberSpec_(
+            "OeREBKRM_V2_0_LocalisedUri",
+            "OeREBKRM_V2_0.LocalisedUri",
+            1,
+            0,
+            {
+                "maxOccurs": "unbounded",
+                "name": "OeREBKRM_V2_0.LocalisedUri",
+                "type": "OeREBKRM_V2_0.LocalisedUri",
+            },
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, OeREBKRM_V2_0_LocalisedUri=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if OeREBKRM_V2_0_LocalisedUri is None:
+            self.OeREBKRM_V2_0_LocalisedUri = []
+        else:
+            self.OeREBKRM_V2_0_LocalisedUri = OeREBKRM_V2_0_LocalisedUri
+        self.OeREBKRM_V2_0_LocalisedUri_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, LocalisedTextType86)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if LocalisedTextType86.subclass:
+            return LocalisedTextType86.subclass(*args_, **kwargs_)
+        else:
+            return LocalisedTextType86(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_OeREBKRM_V2_0_LocalisedUri(self):
+        return self.OeREBKRM_V2_0_LocalisedUri
+
+    def set_OeREBKRM_V2_0_LocalisedUri(self, OeREBKRM_V2_0_LocalisedUri):
+        self.OeREBKRM_V2_0_LocalisedUri = OeREBKRM_V2_0_LocalisedUri
+
+    def add_OeREBKRM_V2_0_LocalisedUri(self, value):
+        self.OeREBKRM_V2_0_LocalisedUri.append(value)
+
+    def insert_OeREBKRM_V2_0_LocalisedUri_at(self, index, value):
+        self.OeREBKRM_V2_0_LocalisedUri.insert(index, value)
+
+    def replace_OeREBKRM_V2_0_LocalisedUri_at(self, index, value):
+        self.OeREBKRM_V2_0_LocalisedUri[index] = value
+
+    def _hasContent(self):
+        if self.OeREBKRM_V2_0_LocalisedUri:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="LocalisedTextType86",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("LocalisedTextType86")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "LocalisedTextType86":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(
+            outfile,
+            level,
+            already_processed,
+            namespaceprefix_,
+            name_="LocalisedTextType86",
+        )
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="LocalisedTextType86",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="LocalisedTextType86",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="LocalisedTextType86",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        for OeREBKRM_V2_0_LocalisedUri_ in self.OeREBKRM_V2_0_LocalisedUri:
+            namespaceprefix_ = (
+                self.OeREBKRM_V2_0_LocalisedUri_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.OeREBKRM_V2_0_LocalisedUri_nsprefix_)
+                else ""
+            )
+            OeREBKRM_V2_0_LocalisedUri_.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="OeREBKRM_V2_0.LocalisedUri",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "OeREBKRM_V2_0.LocalisedUri":
+            obj_ = OeREBKRM_V2_0_LocalisedUri.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.OeREBKRM_V2_0_LocalisedUri.append(obj_)
+            obj_.original_tagname_ = "OeREBKRM_V2_0.LocalisedUri"
+
+
+# end class LocalisedTextType86
+
+
+class NameType87(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "LocalisationCH_V1_MultilingualText": MemberSpec_(
+            "LocalisationCH_V1_MultilingualText",
+            "LocalisationCH_V1.MultilingualText",
+            0,
+            0,
+            {
+                "name": "LocalisationCH_V1.MultilingualText",
+                "type": "LocalisationCH_V1.MultilingualText",
+            },
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, LocalisationCH_V1_MultilingualText=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if LocalisationCH_V1_MultilingualText is None:
+            self.LocalisationCH_V1_MultilingualText = globals()["LocalisationCH_V1_MultilingualText"]()
+        else:
+            self.LocalisationCH_V1_MultilingualText = LocalisationCH_V1_MultilingualText
+        self.LocalisationCH_V1_MultilingualText_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, NameType87)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if NameType87.subclass:
+            return NameType87.subclass(*args_, **kwargs_)
+        else:
+            return NameType87(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_LocalisationCH_V1_MultilingualText(self):
+        return self.LocalisationCH_V1_MultilingualText
+
+    def set_LocalisationCH_V1_MultilingualText(self, LocalisationCH_V1_MultilingualText):
+        self.LocalisationCH_V1_MultilingualText = LocalisationCH_V1_MultilingualText
+
+    def _hasContent(self):
+        if self.LocalisationCH_V1_MultilingualText is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="NameType87",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("NameType87")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "NameType87":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_="NameType87")
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="NameType87",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(self, outfile, level, already_processed, namespaceprefix_="", name_="NameType87"):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="NameType87",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.LocalisationCH_V1_MultilingualText is not None:
+            namespaceprefix_ = (
+                self.LocalisationCH_V1_MultilingualText_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.LocalisationCH_V1_MultilingualText_nsprefix_)
+                else ""
+            )
+            self.LocalisationCH_V1_MultilingualText.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="LocalisationCH_V1.MultilingualText",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "LocalisationCH_V1.MultilingualText":
+            obj_ = LocalisationCH_V1_MultilingualText.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.LocalisationCH_V1_MultilingualText = obj_
+            obj_.original_tagname_ = "LocalisationCH_V1.MultilingualText"
+
+
+# end class NameType87
+
+
+class AmtImWebType(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "OeREBKRM_V2_0_MultilingualUri": MemberSpec_(
+            "OeREBKRM_V2_0_MultilingualUri",
+            "OeREBKRM_V2_0.MultilingualUri",
+            0,
+            0,
+            {
+                "name": "OeREBKRM_V2_0.MultilingualUri",
+                "type": "OeREBKRM_V2_0.MultilingualUri",
+            },
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, OeREBKRM_V2_0_MultilingualUri=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if OeREBKRM_V2_0_MultilingualUri is None:
+            self.OeREBKRM_V2_0_MultilingualUri = globals()["OeREBKRM_V2_0_MultilingualUri"]()
+        else:
+            self.OeREBKRM_V2_0_MultilingualUri = OeREBKRM_V2_0_MultilingualUri
+        self.OeREBKRM_V2_0_MultilingualUri_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, AmtImWebType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if AmtImWebType.subclass:
+            return AmtImWebType.subclass(*args_, **kwargs_)
+        else:
+            return AmtImWebType(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_OeREBKRM_V2_0_MultilingualUri(self):
+        return self.OeREBKRM_V2_0_MultilingualUri
+
+    def set_OeREBKRM_V2_0_MultilingualUri(self, OeREBKRM_V2_0_MultilingualUri):
+        self.OeREBKRM_V2_0_MultilingualUri = OeREBKRM_V2_0_MultilingualUri
+
+    def _hasContent(self):
+        if self.OeREBKRM_V2_0_MultilingualUri is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="AmtImWebType",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("AmtImWebType")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "AmtImWebType":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_="AmtImWebType")
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="AmtImWebType",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="AmtImWebType",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="AmtImWebType",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.OeREBKRM_V2_0_MultilingualUri is not None:
+            namespaceprefix_ = (
+                self.OeREBKRM_V2_0_MultilingualUri_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.OeREBKRM_V2_0_MultilingualUri_nsprefix_)
+                else ""
+            )
+            self.OeREBKRM_V2_0_MultilingualUri.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="OeREBKRM_V2_0.MultilingualUri",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "OeREBKRM_V2_0.MultilingualUri":
+            obj_ = OeREBKRM_V2_0_MultilingualUri.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.OeREBKRM_V2_0_MultilingualUri = obj_
+            obj_.original_tagname_ = "OeREBKRM_V2_0.MultilingualUri"
+
+
+# end class AmtImWebType
+
+
+class TitelType(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "LocalisationCH_V1_MultilingualText": MemberSpec_(
+            "LocalisationCH_V1_MultilingualText",
+            "LocalisationCH_V1.MultilingualText",
+            0,
+            0,
+            {
+                "name": "LocalisationCH_V1.MultilingualText",
+                "type": "LocalisationCH_V1.MultilingualText",
+            },
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, LocalisationCH_V1_MultilingualText=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if LocalisationCH_V1_MultilingualText is None:
+            self.LocalisationCH_V1_MultilingualText = globals()["LocalisationCH_V1_MultilingualText"]()
+        else:
+            self.LocalisationCH_V1_MultilingualText = LocalisationCH_V1_MultilingualText
+        self.LocalisationCH_V1_MultilingualText_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, TitelType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if TitelType.subclass:
+            return TitelType.subclass(*args_, **kwargs_)
+        else:
+            return TitelType(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_LocalisationCH_V1_MultilingualText(self):
+        return self.LocalisationCH_V1_MultilingualText
+
+    def set_LocalisationCH_V1_MultilingualText(self, LocalisationCH_V1_MultilingualText):
+        self.LocalisationCH_V1_MultilingualText = LocalisationCH_V1_MultilingualText
+
+    def _hasContent(self):
+        if self.LocalisationCH_V1_MultilingualText is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="TitelType",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("TitelType")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "TitelType":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_="TitelType")
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="TitelType",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(self, outfile, level, already_processed, namespaceprefix_="", name_="TitelType"):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="TitelType",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.LocalisationCH_V1_MultilingualText is not None:
+            namespaceprefix_ = (
+                self.LocalisationCH_V1_MultilingualText_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.LocalisationCH_V1_MultilingualText_nsprefix_)
+                else ""
+            )
+            self.LocalisationCH_V1_MultilingualText.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="LocalisationCH_V1.MultilingualText",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "LocalisationCH_V1.MultilingualText":
+            obj_ = LocalisationCH_V1_MultilingualText.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.LocalisationCH_V1_MultilingualText = obj_
+            obj_.original_tagname_ = "LocalisationCH_V1.MultilingualText"
+
+
+# end class TitelType
+
+
+class AbkuerzungType(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "LocalisationCH_V1_MultilingualText": MemberSpec_(
+            "LocalisationCH_V1_MultilingualText",
+            "LocalisationCH_V1.MultilingualText",
+            0,
+            0,
+            {
+                "name": "LocalisationCH_V1.MultilingualText",
+                "type": "LocalisationCH_V1.MultilingualText",
+            },
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, LocalisationCH_V1_MultilingualText=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if LocalisationCH_V1_MultilingualText is None:
+            self.LocalisationCH_V1_MultilingualText = globals()["LocalisationCH_V1_MultilingualText"]()
+        else:
+            self.LocalisationCH_V1_MultilingualText = LocalisationCH_V1_MultilingualText
+        self.LocalisationCH_V1_MultilingualText_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, AbkuerzungType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if AbkuerzungType.subclass:
+            return AbkuerzungType.subclass(*args_, **kwargs_)
+        else:
+            return AbkuerzungType(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_LocalisationCH_V1_MultilingualText(self):
+        return self.LocalisationCH_V1_MultilingualText
+
+    def set_LocalisationCH_V1_MultilingualText(self, LocalisationCH_V1_MultilingualText):
+        self.LocalisationCH_V1_MultilingualText = LocalisationCH_V1_MultilingualText
+
+    def _hasContent(self):
+        if self.LocalisationCH_V1_MultilingualText is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="AbkuerzungType",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("AbkuerzungType")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "AbkuerzungType":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_="AbkuerzungType")
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="AbkuerzungType",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="AbkuerzungType",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="AbkuerzungType",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.LocalisationCH_V1_MultilingualText is not None:
+            namespaceprefix_ = (
+                self.LocalisationCH_V1_MultilingualText_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.LocalisationCH_V1_MultilingualText_nsprefix_)
+                else ""
+            )
+            self.LocalisationCH_V1_MultilingualText.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="LocalisationCH_V1.MultilingualText",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "LocalisationCH_V1.MultilingualText":
+            obj_ = LocalisationCH_V1_MultilingualText.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.LocalisationCH_V1_MultilingualText = obj_
+            obj_.original_tagname_ = "LocalisationCH_V1.MultilingualText"
+
+
+# end class AbkuerzungType
+
+
+class OffizielleNrType(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "LocalisationCH_V1_MultilingualText": MemberSpec_(
+            "LocalisationCH_V1_MultilingualText",
+            "LocalisationCH_V1.MultilingualText",
+            0,
+            0,
+            {
+                "name": "LocalisationCH_V1.MultilingualText",
+                "type": "LocalisationCH_V1.MultilingualText",
+            },
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, LocalisationCH_V1_MultilingualText=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if LocalisationCH_V1_MultilingualText is None:
+            self.LocalisationCH_V1_MultilingualText = globals()["LocalisationCH_V1_MultilingualText"]()
+        else:
+            self.LocalisationCH_V1_MultilingualText = LocalisationCH_V1_MultilingualText
+        self.LocalisationCH_V1_MultilingualText_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, OffizielleNrType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if OffizielleNrType.subclass:
+            return OffizielleNrType.subclass(*args_, **kwargs_)
+        else:
+            return OffizielleNrType(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_LocalisationCH_V1_MultilingualText(self):
+        return self.LocalisationCH_V1_MultilingualText
+
+    def set_LocalisationCH_V1_MultilingualText(self, LocalisationCH_V1_MultilingualText):
+        self.LocalisationCH_V1_MultilingualText = LocalisationCH_V1_MultilingualText
+
+    def _hasContent(self):
+        if self.LocalisationCH_V1_MultilingualText is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OffizielleNrType",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("OffizielleNrType")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "OffizielleNrType":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(
+            outfile,
+            level,
+            already_processed,
+            namespaceprefix_,
+            name_="OffizielleNrType",
+        )
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="OffizielleNrType",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="OffizielleNrType",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="OffizielleNrType",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.LocalisationCH_V1_MultilingualText is not None:
+            namespaceprefix_ = (
+                self.LocalisationCH_V1_MultilingualText_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.LocalisationCH_V1_MultilingualText_nsprefix_)
+                else ""
+            )
+            self.LocalisationCH_V1_MultilingualText.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="LocalisationCH_V1.MultilingualText",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "LocalisationCH_V1.MultilingualText":
+            obj_ = LocalisationCH_V1_MultilingualText.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.LocalisationCH_V1_MultilingualText = obj_
+            obj_.original_tagname_ = "LocalisationCH_V1.MultilingualText"
+
+
+# end class OffizielleNrType
+
+
+class TextImWebType(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "OeREBKRM_V2_0_MultilingualUri": MemberSpec_(
+            "OeREBKRM_V2_0_MultilingualUri",
+            "OeREBKRM_V2_0.MultilingualUri",
+            0,
+            0,
+            {
+                "name": "OeREBKRM_V2_0.MultilingualUri",
+                "type": "OeREBKRM_V2_0.MultilingualUri",
+            },
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, OeREBKRM_V2_0_MultilingualUri=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if OeREBKRM_V2_0_MultilingualUri is None:
+            self.OeREBKRM_V2_0_MultilingualUri = globals()["OeREBKRM_V2_0_MultilingualUri"]()
+        else:
+            self.OeREBKRM_V2_0_MultilingualUri = OeREBKRM_V2_0_MultilingualUri
+        self.OeREBKRM_V2_0_MultilingualUri_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, TextImWebType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if TextImWebType.subclass:
+            return TextImWebType.subclass(*args_, **kwargs_)
+        else:
+            return TextImWebType(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_OeREBKRM_V2_0_MultilingualUri(self):
+        return self.OeREBKRM_V2_0_MultilingualUri
+
+    def set_OeREBKRM_V2_0_MultilingualUri(self, OeREBKRM_V2_0_MultilingualUri):
+        self.OeREBKRM_V2_0_MultilingualUri = OeREBKRM_V2_0_MultilingualUri
+
+    def _hasContent(self):
+        if self.OeREBKRM_V2_0_MultilingualUri is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="TextImWebType",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("TextImWebType")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "TextImWebType":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_="TextImWebType")
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="TextImWebType",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="TextImWebType",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="TextImWebType",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.OeREBKRM_V2_0_MultilingualUri is not None:
+            namespaceprefix_ = (
+                self.OeREBKRM_V2_0_MultilingualUri_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.OeREBKRM_V2_0_MultilingualUri_nsprefix_)
+                else ""
+            )
+            self.OeREBKRM_V2_0_MultilingualUri.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="OeREBKRM_V2_0.MultilingualUri",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "OeREBKRM_V2_0.MultilingualUri":
+            obj_ = OeREBKRM_V2_0_MultilingualUri.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.OeREBKRM_V2_0_MultilingualUri = obj_
+            obj_.original_tagname_ = "OeREBKRM_V2_0.MultilingualUri"
+
+
+# end class TextImWebType
+
+
+class DokumentType(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "OeREBKRM_V2_0_MultilingualBlob": MemberSpec_(
+            "OeREBKRM_V2_0_MultilingualBlob",
+            "OeREBKRM_V2_0.MultilingualBlob",
+            0,
+            0,
+            {
+                "name": "OeREBKRM_V2_0.MultilingualBlob",
+                "type": "OeREBKRM_V2_0.MultilingualBlob",
+            },
+            None,
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, OeREBKRM_V2_0_MultilingualBlob=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        if OeREBKRM_V2_0_MultilingualBlob is None:
+            self.OeREBKRM_V2_0_MultilingualBlob = globals()["OeREBKRM_V2_0_MultilingualBlob"]()
+        else:
+            self.OeREBKRM_V2_0_MultilingualBlob = OeREBKRM_V2_0_MultilingualBlob
+        self.OeREBKRM_V2_0_MultilingualBlob_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, DokumentType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if DokumentType.subclass:
+            return DokumentType.subclass(*args_, **kwargs_)
+        else:
+            return DokumentType(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_OeREBKRM_V2_0_MultilingualBlob(self):
+        return self.OeREBKRM_V2_0_MultilingualBlob
+
+    def set_OeREBKRM_V2_0_MultilingualBlob(self, OeREBKRM_V2_0_MultilingualBlob):
+        self.OeREBKRM_V2_0_MultilingualBlob = OeREBKRM_V2_0_MultilingualBlob
+
+    def _hasContent(self):
+        if self.OeREBKRM_V2_0_MultilingualBlob is not None:
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="DokumentType",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("DokumentType")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "DokumentType":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_="DokumentType")
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="DokumentType",
+                pretty_print=pretty_print,
+            )
+            showIndent(outfile, level, pretty_print)
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="DokumentType",
+    ):
+        pass
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_=' xmlns:None="http://www.interlis.ch/INTERLIS2.3" ',
+        name_="DokumentType",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.OeREBKRM_V2_0_MultilingualBlob is not None:
+            namespaceprefix_ = (
+                self.OeREBKRM_V2_0_MultilingualBlob_nsprefix_ + ":"
+                if (UseCapturedNS_ and self.OeREBKRM_V2_0_MultilingualBlob_nsprefix_)
+                else ""
+            )
+            self.OeREBKRM_V2_0_MultilingualBlob.export(
+                outfile,
+                level,
+                namespaceprefix_,
+                namespacedef_="",
+                name_="OeREBKRM_V2_0.MultilingualBlob",
+                pretty_print=pretty_print,
+            )
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        pass
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        if nodeName_ == "OeREBKRM_V2_0.MultilingualBlob":
+            obj_ = OeREBKRM_V2_0_MultilingualBlob.factory(parent_object_=self)
+            obj_.build(child_, gds_collector_=gds_collector_)
+            self.OeREBKRM_V2_0_MultilingualBlob = obj_
+            obj_.original_tagname_ = "OeREBKRM_V2_0.MultilingualBlob"
+
+
+# end class DokumentType
+
+
+class ZustaendigeStelleType(GeneratedsSuper):
+    __hash__ = GeneratedsSuper.__hash__
+    member_data_items_ = {
+        "REF": MemberSpec_("REF", "IliID", 0, 0, {"use": "required", "name": "REF"}),
+        "BID": MemberSpec_("BID", "IliID", 0, 1, {"use": "optional", "name": "BID"}),
+        "ORDER_POS": MemberSpec_(
+            "ORDER_POS",
+            "xsd:positiveInteger",
+            0,
+            1,
+            {"use": "optional", "name": "ORDER_POS"},
+        ),
+    }
+    subclass = None
+    superclass = None
+
+    def __init__(self, REF=None, BID=None, ORDER_POS=None, gds_collector_=None, **kwargs_):
+        self.gds_collector_ = gds_collector_
+        self.gds_elementtree_node_ = None
+        self.original_tagname_ = None
+        self.parent_object_ = kwargs_.get("parent_object_")
+        self.ns_prefix_ = None
+        self.REF = _cast(None, REF)
+        self.REF_nsprefix_ = None
+        self.BID = _cast(None, BID)
+        self.BID_nsprefix_ = None
+        self.ORDER_POS = _cast(int, ORDER_POS)
+        self.ORDER_POS_nsprefix_ = None
+
+    def factory(*args_, **kwargs_):
+        if CurrentSubclassModule_ is not None:
+            subclass = getSubclassFromModule_(CurrentSubclassModule_, ZustaendigeStelleType)
+            if subclass is not None:
+                return subclass(*args_, **kwargs_)
+        if ZustaendigeStelleType.subclass:
+            return ZustaendigeStelleType.subclass(*args_, **kwargs_)
+        else:
+            return ZustaendigeStelleType(*args_, **kwargs_)
+
+    factory = staticmethod(factory)
+
+    def get_ns_prefix_(self):
+        return self.ns_prefix_
+
+    def set_ns_prefix_(self, ns_prefix):
+        self.ns_prefix_ = ns_prefix
+
+    def get_REF(self):
+        return self.REF
+
+    def set_REF(self, REF):
+        self.REF = REF
+
+    def get_BID(self):
+        return self.BID
+
+    def set_BID(self, BID):
+        self.BID = BID
+
+    def get_ORDER_POS(self):
+        return self.ORDER_POS
+
+    def set_ORDER_POS(self, ORDER_POS):
+        self.ORDER_POS = ORDER_POS
+
+    def validate_IliID(self, value):
+        # Validate type IliID, a restriction on xsd:string.
+        if value is not None and Validate_simpletypes_ and self.gds_collector_ is not None:
+            if not isinstance(value, str):
+                lineno = self.gds_get_node_lineno_()
+                self.gds_collector_.add_message(
+                    'Value "%(value)s"%(lineno)s is not of the correct base simple type (str)'
+                    % {
+                        "value": value,
+                        "lineno": lineno,
+                    }
+                )
+                return False
+            if not self.gds_validate_simple_patterns(self.validate_IliID_patterns_, value):
+                self.gds_collector_.add_message(
+                    'Value "%s" does not match xsd pattern restrictions: %s'
+                    % (
+                        encode_str_2_3(value),
+                        self.validate_IliID_patterns_,
+                    )
+                )
+
+    validate_IliID_patterns_ = [["^(([a-zA-Z_][0-9a-zA-Z_\\-\\.]*:)?[0-9a-zA-Z_][0-9a-zA-Z_\\-\\.]*)$"]]
+
+    def _hasContent(self):
+        if ():
+            return True
+        else:
+            return False
+
+    def export(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_="",
+        name_="ZustaendigeStelleType",
+        pretty_print=True,
+    ):
+        imported_ns_def_ = GenerateDSNamespaceDefs_.get("ZustaendigeStelleType")
+        if imported_ns_def_ is not None:
+            namespacedef_ = imported_ns_def_
+        if pretty_print:
+            eol_ = "\n"
+        else:
+            eol_ = ""
+        if self.original_tagname_ is not None and name_ == "ZustaendigeStelleType":
+            name_ = self.original_tagname_
+        if UseCapturedNS_ and self.ns_prefix_:
+            namespaceprefix_ = self.ns_prefix_ + ":"
+        showIndent(outfile, level, pretty_print)
+        outfile.write(
+            "<%s%s%s"
+            % (
+                namespaceprefix_,
+                name_,
+                namespacedef_ and " " + namespacedef_ or "",
+            )
+        )
+        already_processed = set()
+        self._exportAttributes(
+            outfile,
+            level,
+            already_processed,
+            namespaceprefix_,
+            name_="ZustaendigeStelleType",
+        )
+        if self._hasContent():
+            outfile.write(">%s" % (eol_,))
+            self._exportChildren(
+                outfile,
+                level + 1,
+                namespaceprefix_,
+                namespacedef_,
+                name_="ZustaendigeStelleType",
+                pretty_print=pretty_print,
+            )
+            outfile.write("</%s%s>%s" % (namespaceprefix_, name_, eol_))
+        else:
+            outfile.write("/>%s" % (eol_,))
+
+    def _exportAttributes(
+        self,
+        outfile,
+        level,
+        already_processed,
+        namespaceprefix_="",
+        name_="ZustaendigeStelleType",
+    ):
+        if self.REF is not None and "REF" not in already_processed:
+            already_processed.add("REF")
+            outfile.write(
+                " REF=%s"
+                % (self.gds_encode(self.gds_format_string(quote_attrib(self.REF), input_name="REF")),)
+            )
+        if self.BID is not None and "BID" not in already_processed:
+            already_processed.add("BID")
+            outfile.write(
+                " BID=%s"
+                % (self.gds_encode(self.gds_format_string(quote_attrib(self.BID), input_name="BID")),)
+            )
+        if self.ORDER_POS is not None and "ORDER_POS" not in already_processed:
+            already_processed.add("ORDER_POS")
+            outfile.write(' ORDER_POS="%s"' % self.gds_format_integer(self.ORDER_POS, input_name="ORDER_POS"))
+
+    def _exportChildren(
+        self,
+        outfile,
+        level,
+        namespaceprefix_="",
+        namespacedef_="",
+        name_="ZustaendigeStelleType",
+        fromsubclass_=False,
+        pretty_print=True,
+    ):
+        pass
+
+    def build(self, node, gds_collector_=None):
+        self.gds_collector_ = gds_collector_
+        if SaveElementTreeNode:
+            self.gds_elementtree_node_ = node
+        already_processed = set()
+        self.ns_prefix_ = node.prefix
+        self._buildAttributes(node, node.attrib, already_processed)
+        for child in node:
+            nodeName_ = Tag_pattern_.match(child.tag).groups()[-1]
+            self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
+        return self
+
+    def _buildAttributes(self, node, attrs, already_processed):
+        value = find_attr_value_("REF", node)
+        if value is not None and "REF" not in already_processed:
+            already_processed.add("REF")
+            self.REF = value
+            self.validate_IliID(self.REF)  # validate type IliID
+        value = find_attr_value_("BID", node)
+        if value is not None and "BID" not in already_processed:
+            already_processed.add("BID")
+            self.BID = value
+            self.validate_IliID(self.BID)  # validate type IliID
+        value = find_attr_value_("ORDER_POS", node)
+        if value is not None and "ORDER_POS" not in already_processed:
+            already_processed.add("ORDER_POS")
+            self.ORDER_POS = self.gds_parse_integer(value, node, "ORDER_POS")
+            if self.ORDER_POS <= 0:
+                raise_parse_error(node, "Invalid PositiveInteger")
+
+    def _buildChildren(self, child_, node, nodeName_, fromsubclass_=False, gds_collector_=None):
+        pass
+
+
+# end class ZustaendigeStelleType
+
+
+__all__ = [
+    "OeREBKRM_V2_0_DokumentTyp",
+    "Models",
+    "Model",
+    "LocalisationCH_V1_LocalisedText",
+    "LocalisationCH_V1_MultilingualText",
+    "OeREBKRM_V2_0_LocalisedBlob",
+    "OeREBKRM_V2_0_LocalisedUri",
+    "OeREBKRM_V2_0_MultilingualBlob",
+    "OeREBKRM_V2_0_MultilingualUri",
+    "OeREBKRM_V2_0_Amt_Amt",
+    "OeREBKRM_V2_0_Dokumente_Dokument",
+    "HeaderSection",
+    "OidSpaces",
+    "OidSpace",
+    "LocalisedTextType",
+    "BlobType",
+    "BINBLBOXType",
+    "LocalisedBlobType",
+    "LocalisedTextType86",
+    "NameType87",
+    "AmtImWebType",
+    "TitelType",
+    "AbkuerzungType",
+    "OffizielleNrType",
+    "TextImWebType",
+    "DokumentType",
+    "ZustaendigeStelleType",
+]
@@ -0,0 +1,173 @@
+"""
+Writes the generated ``OeREBKRMtrsfr_V2_0`` objects as a complete INTERLIS 2.3 transfer (XTF). The elements
+are written to the output as soon as they are passed, so the transfer is never built in memory.
+"""
+
+import os
+from uuid import uuid4
+from xml.sax.saxutils import quoteattr
+
+from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.subset import HeaderSection, Model, Models
+
+INTERLIS_NAMESPACE = 'http://www.interlis.ch/INTERLIS2.3'
+
+MODEL_NAME = 'OeREBKRM_V2_0'
+MODEL_VERSION = '2021-04-14'
+MODEL_URI = 'https://models.geo.admin.ch/V_D/OeREB/'
+
+
+class TransferWriter(object):
+    """
+    Streams an XTF with one ``OeREBKRM_V2_0.Dokumente`` and one ``OeREBKRM_V2_0.Amt`` basket. The Dokumente
+    are written right away, the Ämter are kept until the Dokumente basket is closed. Their number is
+    limited by the number of responsible offices.
+
+    The writer can be used as a context manager which closes the transfer on exit. If the block is left
+    with an exception, the transfer is aborted (see :meth:`abort`), so an incomplete transfer is not
+    mistaken as valid.
+
+    Args:
+        outfile (file): The text file the transfer is written to.
+        sender (str): The sender written to the header (Default: geolink2oereb).
+        dokumente_bid (str): The BID of the Dokumente basket (Default: geolink2oereb.dokumente).
+        amt_bid (str): The BID of the Amt basket (Default: geolink2oereb.amt).
+    """
+
+    def __init__(
+        self,
+        outfile,
+        sender='geolink2oereb',
+        dokumente_bid='geolink2oereb.dokumente',
+        amt_bid='geolink2oereb.amt'
+    ):
+        self.outfile = outfile
+        self.sender = sender
+        self.dokumente_bid = dokumente_bid
+        self.amt_bid = amt_bid
+        self._aemter = []
+        self._started = False
+        self._closed = False
+        self._start_position = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def start(self):
+        """
+        Writes the header and opens the Dokumente basket.
+        """
+        if self._started:
+            return
+        self._started = True
+        if self.outfile.seekable():
+            self._start_position = self.outfile.tell()
+        self.outfile.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self.outfile.write('<TRANSFER xmlns={}>\n'.format(quoteattr(INTERLIS_NAMESPACE)))
+        header = HeaderSection(
+            SENDER=self.sender,
+            MODELS=Models(MODEL=[Model(NAME=MODEL_NAME, VERSION=MODEL_VERSION, URI=MODEL_URI)])
+        )
+        header.export(self.outfile, 1, namespacedef_='', name_='HEADERSECTION')
+        self.outfile.write('    <DATASECTION>\n')
+        self.outfile.write('        <OeREBKRM_V2_0.Dokumente BID={}>\n'.format(quoteattr(self.dokumente_bid)))
+
+    def write_dokument(self, dokument):
+        """
+        Writes a Dokument to the Dokumente basket.
+
+        Args:
+            dokument (geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument):  # noqa: E501
+                The Dokument with its final TID.
+        """
+        self.start()
+        dokument.export(self.outfile, 3, namespacedef_='')
+
+    def add_amt(self, amt):
+        """
+        Adds an Amt which is written to the Amt basket when the transfer is closed.
+
+        Args:
+            amt (geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Amt_Amt): The Amt
+                with its final TID.
+        """
+        self._aemter.append(amt)
+
+    def close(self):
+        """
+        Closes the Dokumente basket, writes the Amt basket and closes the transfer.
+        """
+        if self._closed:
+            return
+        self.start()
+        self._closed = True
+        self.outfile.write('        </OeREBKRM_V2_0.Dokumente>\n')
+        self.outfile.write('        <OeREBKRM_V2_0.Amt BID={}>\n'.format(quoteattr(self.amt_bid)))
+        for amt in self._aemter:
+            amt.export(self.outfile, 3, namespacedef_='')
+        self._aemter = []
+        self.outfile.write('        </OeREBKRM_V2_0.Amt>\n')
+        self.outfile.write('    </DATASECTION>\n')
+        self.outfile.write('</TRANSFER>\n')
+
+    def abort(self):
+        """
+        Stops writing without closing the transfer. If the file is seekable, everything written by the
+        writer is removed from it again. A file which is not seekable, like the standard output, keeps the
+        incomplete transfer.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._aemter = []
+        if self._start_position is not None:
+            self.outfile.seek(self._start_position)
+            self.outfile.truncate()
+
+
+def write_transfer(outfile, assigned, **kwargs):
+    """
+    Writes the Dokument/Amt pairs as complete transfer.
+
+    Args:
+        outfile (file): The text file the transfer is written to.
+        assigned (iterable of tuple): The unique Dokumente with their Amt or None if the Amt was passed
+            before, as yielded by :func:`geolink2oereb.transform.assign_uuids_iter`.
+        **kwargs: Further arguments for :class:`TransferWriter`.
+    """
+    with TransferWriter(outfile, **kwargs) as writer:
+        for dokument, amt in assigned:
+            if amt is not None:
+                writer.add_amt(amt)
+            writer.write_dokument(dokument)
+
+
+def write_transfer_file(path, assigned, **kwargs):
+    """
+    Writes the Dokument/Amt pairs as complete transfer to a file. The transfer is written to a temporary
+    file in the same directory, which replaces the file only once the transfer is complete. If writing
+    fails, an existing file is left untouched.
+
+    Args:
+        path (str): The path of the transfer file.
+        assigned (iterable of tuple): The unique Dokumente with their Amt or None if the Amt was passed
+            before, as yielded by :func:`geolink2oereb.transform.assign_uuids_iter`.
+        **kwargs: Further arguments for :class:`TransferWriter`.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    tmp_path = os.path.join(directory, '.{}.{}.tmp'.format(name, uuid4().hex))
+    # created like by open(), so the permissions follow the umask
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+            write_transfer(fh, assigned, **kwargs)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
@@ -4,16 +4,27 @@ All usage of ``pyramid_oereb`` elements should be implemented here and proxied t
 of geolink2oereb. That makes it easier to adapt once changes occur.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import threading
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from geolink_formatter import XML
 from pyramid_oereb.core.records.law_status import LawStatusRecord
 from pyramid_oereb.core.config import Config
-from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes import (
+from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.subset import (
     OeREBKRM_V2_0_DokumentTyp,
 )
 from pyramid_oereb.core.records.document_types import DocumentTypeRecord
 from pyramid_oereb.contrib.data_sources.oereblex.sources.document import OEREBlexSource
 from pyramid_oereb.core.views.webservice import Parameter
 from pyramid.path import DottedNameResolver
+from geolink2oereb.lib.concurrency import SingleFlight
+from geolink2oereb.lib.http import DEFAULT_TIMEOUT, PooledSession, fetch, fetch_async, is_overload
+from geolink2oereb.lib.ratelimit import get_rate_limiter
 
 logging.basicConfig(level="DEBUG", format="%(asctime)s [%(levelname)s] %(message)s")
 
@@ -48,6 +59,38 @@ def merge_attribute(master_attribute, merger_attribute):
     return None
 
 
+@lru_cache(maxsize=None)
+def get_geolink_parser(host_url, version, xsd_validation):
+    """
+    Returns a shared geoLink XML parser. Creating a parser loads the geoLink XSD which is expensive, so
+    parsers are created once per combination of the parameters and shared by all sources.
+
+    Args:
+        host_url (str): URL of the ÖREBlex host to resolve relative URLs.
+        version (str): The used geoLink schema version.
+        xsd_validation (bool): Turn XML validation on/off.
+
+    Returns:
+        geolink_formatter.XML: The parser.
+    """
+    return XML(host_url=host_url, version=version, xsd_validation=xsd_validation)
+
+
+FetchedGeolink = namedtuple("FetchedGeolink", ["url", "request_params", "cache_key", "content"])
+"""
+A geoLink response which is not parsed yet, see :meth:`OEREBlexSourceCustom.fetch_geolink`. The content is
+None if the parsed documents are in the document cache.
+"""
+
+FetchedLanguage = namedtuple("FetchedLanguage", ["language", "content", "read"])
+"""
+The response of a geolink in one language, see :meth:`OEREBlexLoader.fetch`. ``read`` is a function without
+arguments which parses the response and returns the records of the language. The raw ``content`` is None if
+it is not available, e.g. because the parsed documents are in the document cache or the source class is not
+an :class:`OEREBlexSourceCustom`.
+"""
+
+
 class OEREBlexSourceCustom(OEREBlexSource):
     """
     This subclass is basically used to manipulate the behaviour of the normal OEREBlexSource as it is used
@@ -57,7 +100,295 @@ class OEREBlexSourceCustom(OEREBlexSource):
     - adaption of _get_document_title to be able to manipulate title of documents more easy
     - adaption of _get_document_records to add a filter for federal documents because they are provided
       in another way and can be omitted.
+    - the geoLink XML parser is shared between all instances (see :func:`get_geolink_parser`).
+    - reading is split into building the request, fetching and converting the response, which allows to
+      read asynchronously with :meth:`read_async`.
+    - requests are sent with an injected ``http_session`` (e.g. a
+      :class:`geolink2oereb.lib.http.PooledSession`), so connections are reused between requests.
+    - responses can be stored in an injected ``cache`` and are revalidated with conditional requests.
+    - parsed documents can be kept in an injected ``document_cache``, so a geolink which is used by
+      multiple themes is only fetched and parsed once. Filtering and conversion to records, which depend
+      on the theme, still run for each source.
+    - with an injected ``single_flight``, concurrent reads of the same geolink in the same language share
+      one request to ÖREBlex.
+    - requests fail after the ``timeout`` of the ``oereblex`` configuration in seconds (Default: 30, null
+      to wait forever), so a stalled server does not block the reading thread.
+    - with an injected ``limiter``, the number of concurrent requests adapts to the response times,
+      timeouts and overload responses of ÖREBlex. The limiter is not applied by :meth:`read_async`.
+    - with a ``rate_limit`` in the ``oereblex`` configuration, the requests to the host are limited by a
+      token bucket shared by all sources (see :mod:`geolink2oereb.lib.ratelimit`).
+    - the records get the ÖREBlex document ID and the position of the file as ``identifier``, so the
+      records of the different languages can be matched (see :func:`merge_languages`).
+
+    Keyword Args:
+        http_session (requests.Session or None): The session used for all requests. If None, each request
+            opens a new connection like in ``pyramid_oereb``.
+        cache (geolink2oereb.lib.cache.DiskCache or None): The cache for the raw geoLink responses.
+        document_cache (geolink2oereb.lib.cache.LRUCache or None): The cache for the parsed documents.
+        single_flight (geolink2oereb.lib.concurrency.SingleFlight or None): Deduplicates concurrent
+            requests for the same geolink and language.
+        limiter (geolink2oereb.lib.concurrency.AdaptiveLimiter or None): Limits the concurrent requests.
+        **kwargs: All the keyword arguments ``OEREBlexSource`` accepts.
     """
+    def __init__(self, **kwargs):
+        self._http_session = kwargs.pop('http_session', None)
+        self._cache = kwargs.pop('cache', None)
+        self._document_cache = kwargs.pop('document_cache', None)
+        self._single_flight = kwargs.pop('single_flight', None)
+        self._limiter = kwargs.pop('limiter', None)
+        validation = kwargs.get('validation')
+        # the parser of the superclass is replaced by a shared one, so skip loading the XSD here
+        super(OEREBlexSourceCustom, self).__init__(**dict(kwargs, validation=False))
+        self._parser = get_geolink_parser(
+            self._parser.host_url,
+            self._version,
+            True if validation is None else validation
+        )
+        self._timeout = kwargs.get('timeout', DEFAULT_TIMEOUT)
+        rate_limit = kwargs.get('rate_limit')
+        self._rate_limiter = None
+        if rate_limit is not None:
+            self._rate_limiter = get_rate_limiter(self._parser.host_url, **rate_limit)
+
+    def get_request(self, params, geolink_id, law_status, oereblex_params=None):
+        """
+        Builds the geoLink request the same way as ``OEREBlexSource.read`` does.
+
+        Args:
+            params (pyramid_oereb.core.views.webservice.Parameter): The parameters of the extract request.
+            geolink_id (int): The geoLink ID.
+            law_status (pyramid_oereb.core.records.law_status.LawStatusRecord): The restriction's law status.
+            oereblex_params (string or None): Any additional parameters to pass to Oereblex
+
+        Returns:
+            (tuple): tuple containing:
+                str: The URL.
+                dict: The query parameters.
+        """
+        if self._use_prepubs and law_status.code != 'inForce':
+            service = 'prepubs'
+        else:
+            service = 'geolinks'
+
+        url = '{host}/api/{version}{service}/{id}.xml'.format(
+            host=self._parser.host_url,
+            version=self._version + '/' if self._pass_version else '',
+            service=service,
+            id=geolink_id
+        )
+        if oereblex_params:
+            url = url + '?' + oereblex_params
+        return url, {'locale': params.language or self._language}
+
+    def get_cache_key(self, url, geolink_id, language):
+        """
+        Returns the key of a geoLink response in the cache.
+
+        Args:
+            url (str): The requested URL.
+            geolink_id (int): The geoLink ID.
+            language (str): The requested language.
+
+        Returns:
+            list: The key consisting of host, geolink ID, language, schema version and URL.
+        """
+        return [self._parser.host_url, str(geolink_id), language, self._version, url]
+
+    def _parse(self, content, cache_key):
+        documents = self._parser.from_string(content)
+        if self._document_cache is not None:
+            self._document_cache.set(tuple(cache_key), documents)
+        return documents
+
+    def _get_cached_documents(self, cache_key):
+        if self._document_cache is None:
+            return None
+        return self._document_cache.get(tuple(cache_key))
+
+    def read_content(self, content, language, cache_key=None):
+        """
+        Parses a received geoLink response and converts it to records which are stored in ``records``.
+
+        Args:
+            content (bytes or str): The geoLink XML.
+            language (str): The language of the documents.
+            cache_key (list or None): If passed, the parsed documents are stored in the document cache
+                with this key.
+        """
+        if cache_key is None:
+            documents = self._parser.from_string(content)
+        else:
+            documents = self._parse(content, cache_key)
+        self._set_records(documents, language)
+
+    def _set_records(self, documents, language):
+        self.records = []
+        for document in documents:
+            self.records.extend(self._get_document_records(document, language))
+
+    def read(self, params, geolink_id, law_status, oereblex_params=None):
+        """
+        Requests the geoLink for the specified ID and stores records for the received documents in
+        ``records``.
+
+        Args:
+            params (pyramid_oereb.core.views.webservice.Parameter): The parameters of the extract request.
+            geolink_id (int): The geoLink ID.
+            law_status (pyramid_oereb.core.records.law_status.LawStatusRecord): The restriction's law status.
+            oereblex_params (string or None): Any additional parameters to pass to Oereblex
+        """
+        url, request_params = self.get_request(params, geolink_id, law_status, oereblex_params)
+        language = request_params['locale']
+        cache_key = self.get_cache_key(url, geolink_id, language)
+        if self._single_flight is None:
+            documents = self._load_documents(url, request_params, cache_key)
+        else:
+            documents = self._single_flight.do(
+                tuple(cache_key), self._load_documents, url, request_params, cache_key
+            )
+        self._set_records(documents, language)
+
+    def fetch_geolink(self, params, geolink_id, law_status, oereblex_params=None):
+        """
+        The network part of :meth:`read`: requests the geoLink without parsing it. The response is
+        converted to records by :meth:`read_fetched`, e.g. in another thread.
+
+        Args:
+            params (pyramid_oereb.core.views.webservice.Parameter): The parameters of the extract request.
+            geolink_id (int): The geoLink ID.
+            law_status (pyramid_oereb.core.records.law_status.LawStatusRecord): The restriction's law status.
+            oereblex_params (string or None): Any additional parameters to pass to Oereblex
+
+        Returns:
+            FetchedGeolink: The unparsed response.
+        """
+        url, request_params = self.get_request(params, geolink_id, law_status, oereblex_params)
+        cache_key = self.get_cache_key(url, geolink_id, request_params['locale'])
+        if self._get_cached_documents(cache_key) is not None:
+            return FetchedGeolink(url, request_params, cache_key, None)
+        if self._single_flight is None:
+            content = self._fetch_content(url, request_params, cache_key)
+        else:
+            content = self._single_flight.do(
+                ('content',) + tuple(cache_key), self._fetch_content, url, request_params, cache_key
+            )
+        return FetchedGeolink(url, request_params, cache_key, content)
+
+    def read_fetched(self, fetched):
+        """
+        Parses a response of :meth:`fetch_geolink` and stores records for the documents in ``records``.
+
+        Args:
+            fetched (FetchedGeolink): The response.
+        """
+        if fetched.content is None:
+            # the documents are read again if they were evicted from the cache in the meantime
+            documents = self._load_documents(fetched.url, fetched.request_params, fetched.cache_key)
+        else:
+            documents = self._parse(fetched.content, fetched.cache_key)
+        self._set_records(documents, fetched.request_params['locale'])
+
+    def _fetch_content(self, url, request_params, cache_key):
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        if self._limiter is not None:
+            return self._limiter.call(self._fetch, url, request_params, cache_key, is_overload=is_overload)
+        return self._fetch(url, request_params, cache_key)
+
+    def _fetch(self, url, request_params, cache_key):
+        return fetch(
+            self._http_session,
+            url,
+            request_params,
+            proxies=self._proxies,
+            auth=self._auth,
+            cache=self._cache,
+            cache_key=cache_key,
+            timeout=self._timeout
+        )
+
+    def _load_documents(self, url, request_params, cache_key):
+        documents = self._get_cached_documents(cache_key)
+        if documents is None:
+            documents = self._parse(self._fetch_content(url, request_params, cache_key), cache_key)
+        return documents
+
+    async def read_async(self, client, params, geolink_id, law_status, oereblex_params=None):
+        """
+        Asynchronous variant of :meth:`read`. The geoLink is requested with the passed client and the
+        response is parsed in the default executor of the running event loop. The injected ``limiter``
+        is not applied, the number of concurrent requests is bounded by the caller and the connection
+        limit of the client.
+
+        Args:
+            client (aiohttp.ClientSession): The client to use.
+            params (pyramid_oereb.core.views.webservice.Parameter): The parameters of the extract request.
+            geolink_id (int): The geoLink ID.
+            law_status (pyramid_oereb.core.records.law_status.LawStatusRecord): The restriction's law status.
+            oereblex_params (string or None): Any additional parameters to pass to Oereblex
+        """
+        url, request_params = self.get_request(params, geolink_id, law_status, oereblex_params)
+        language = request_params['locale']
+        cache_key = self.get_cache_key(url, geolink_id, language)
+        if self._single_flight is None:
+            documents = await self._load_documents_async(client, url, request_params, cache_key)
+        else:
+            documents = await self._single_flight.do_async(
+                tuple(cache_key), self._load_documents_async, client, url, request_params, cache_key
+            )
+        self._set_records(documents, language)
+
+    async def fetch_geolink_async(self, client, params, geolink_id, law_status, oereblex_params=None):
+        """
+        Asynchronous variant of :meth:`fetch_geolink`. Like :meth:`read_async`, it does not apply the
+        injected ``limiter``.
+
+        Args:
+            client (aiohttp.ClientSession): The client to use.
+            params (pyramid_oereb.core.views.webservice.Parameter): The parameters of the extract request.
+            geolink_id (int): The geoLink ID.
+            law_status (pyramid_oereb.core.records.law_status.LawStatusRecord): The restriction's law status.
+            oereblex_params (string or None): Any additional parameters to pass to Oereblex
+
+        Returns:
+            FetchedGeolink: The unparsed response.
+        """
+        url, request_params = self.get_request(params, geolink_id, law_status, oereblex_params)
+        cache_key = self.get_cache_key(url, geolink_id, request_params['locale'])
+        if self._get_cached_documents(cache_key) is not None:
+            return FetchedGeolink(url, request_params, cache_key, None)
+        if self._single_flight is None:
+            content = await self._fetch_content_async(client, url, request_params, cache_key)
+        else:
+            content = await self._single_flight.do_async(
+                ('content',) + tuple(cache_key), self._fetch_content_async, client, url, request_params,
+                cache_key
+            )
+        return FetchedGeolink(url, request_params, cache_key, content)
+
+    async def _fetch_content_async(self, client, url, request_params, cache_key):
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async()
+        return await fetch_async(
+            client,
+            url,
+            request_params,
+            proxies=self._proxies,
+            auth=self._auth,
+            cache=self._cache,
+            cache_key=cache_key,
+            timeout=self._timeout
+        )
+
+    async def _load_documents_async(self, client, url, request_params, cache_key):
+        documents = self._get_cached_documents(cache_key)
+        if documents is None:
+            content = await self._fetch_content_async(client, url, request_params, cache_key)
+            documents = await asyncio.get_running_loop().run_in_executor(
+                None, self._parse, content, cache_key
+            )
+        return documents
+
     @property
     def filter_federal_documents(self):
         """
@@ -116,7 +447,12 @@ class OEREBlexSourceCustom(OEREBlexSource):
                     f'in the filter list {self.filter_federal_documents}'
                 )
                 return []
-        return super(OEREBlexSourceCustom, self)._get_document_records(document, language)
+        records = super(OEREBlexSourceCustom, self)._get_document_records(document, language)
+        if document.id is not None:
+            # the ÖREBlex document ID and the position of the file identify the record in all languages
+            for position, record in enumerate(records):
+                record.identifier = "{}/{}".format(document.id, position)
+        return records
 
 
 def oerebkrm_v2_0_dokument_typ_2_document_type_records():
@@ -189,6 +525,154 @@ def get_law_status_code_by_extract_value(theme_code, extract_value):
     return None
 
 
+def translation_table(lookups):
+    """
+    Builds a dict out of the ``document_types_lookup`` or ``law_status_lookup`` of a theme as defined in
+    ``pyramid_oereb`` configuration yaml.
+
+    Args:
+        lookups (list of dict): The lookups with ``extract_code`` and ``transfer_code``.
+    Returns:
+        dict: The transfer code per extract code. The first lookup wins if a code is configured twice.
+    """
+    table = {}
+    for lookup in lookups:
+        table.setdefault(lookup["extract_code"], lookup["transfer_code"])
+    return table
+
+
+class CodeTranslations(object):
+    """
+    Translates the document type and law status codes of the records to the transfer codes. The lookups of
+    all themes are turned into dicts once, instead of scanning the configuration for each record.
+
+    Codes without a configured translation are set to None like before, but they are collected and
+    reported as one warning by :meth:`report_unmapped`.
+
+    Args:
+        config (dict): The ``pyramid_oereb`` configuration as loaded to
+            :attr:`pyramid_oereb.core.config.Config._config`.
+    """
+
+    def __init__(self, config):
+        self._document_types = {}
+        self._law_status = {}
+        for theme in config.get("plrs") or []:
+            theme_code = theme.get("code").lower()
+            if theme.get("document_types_lookup") is not None:
+                self._document_types[theme_code] = translation_table(theme["document_types_lookup"])
+            if theme.get("law_status_lookup") is not None:
+                self._law_status[theme_code] = translation_table(theme["law_status_lookup"])
+        self._unmapped = Counter()
+        self._lock = threading.Lock()
+
+    def document_types(self, theme_code):
+        """
+        Args:
+            theme_code (str): The theme code matching the ``pyramid_oereb`` configuration.
+        Returns:
+            dict: The transfer code per extract code of the document types.
+        Raises:
+            pyramid_oereb.core.exceptions.ConfigurationError: If the theme has no lookup configured.
+        """
+        table = self._document_types.get(theme_code.lower())
+        if table is None:
+            # raises the error of pyramid_oereb for themes without lookup
+            table = translation_table(Config.get_document_types_lookups(theme_code))
+        return table
+
+    def law_status(self, theme_code):
+        """
+        Args:
+            theme_code (str): The theme code matching the ``pyramid_oereb`` configuration.
+        Returns:
+            dict: The transfer code per extract code of the law status.
+        Raises:
+            pyramid_oereb.core.exceptions.ConfigurationError: If the theme has no lookup configured.
+        """
+        table = self._law_status.get(theme_code.lower())
+        if table is None:
+            table = translation_table(Config.get_law_status_lookups(theme_code))
+        return table
+
+    def translate(self, records, theme_code):
+        """
+        Replaces the document type and law status codes of the records by the transfer codes.
+
+        Args:
+            records (list of pyramid_oereb.core.records.documents.DocumentRecord): The records to update.
+            theme_code (str): The theme code matching the ``pyramid_oereb`` configuration.
+        Returns:
+            list of pyramid_oereb.core.records.documents.DocumentRecord: The updated records.
+        """
+        document_types = self.document_types(theme_code)
+        law_status = self.law_status(theme_code)
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        unmapped = []
+        for record in records:
+            old_code = record.document_type.code
+            new_code = document_types.get(old_code)
+            if new_code is None:
+                unmapped.append(("document type", theme_code, old_code))
+            if debug:
+                logging.debug("Document code: %s -> %s", old_code, new_code)
+            record.document_type.code = new_code
+
+            old_code = record.law_status.code
+            new_code = law_status.get(old_code)
+            if new_code is None:
+                unmapped.append(("law status", theme_code, old_code))
+            if debug:
+                logging.debug("Law status code: %s -> %s", old_code, new_code)
+            record.law_status.code = new_code
+        if unmapped:
+            with self._lock:
+                self._unmapped.update(unmapped)
+        return records
+
+    def take_unmapped(self):
+        """
+        Returns and resets the codes which could not be translated since the last call.
+
+        Returns:
+            collections.Counter: The number of records per ``(kind, theme code, extract code)`` which were
+                not translated.
+        """
+        with self._lock:
+            unmapped, self._unmapped = self._unmapped, Counter()
+        return unmapped
+
+    def update_unmapped(self, unmapped):
+        """
+        Adds codes which could not be translated somewhere else, e.g. in a worker process.
+
+        Args:
+            unmapped (collections.Counter): The counter as returned by :meth:`take_unmapped`.
+        """
+        if unmapped:
+            with self._lock:
+                self._unmapped.update(unmapped)
+
+    def report_unmapped(self):
+        """
+        Logs one warning for all codes which could not be translated since the last report.
+
+        Returns:
+            collections.Counter: The number of records per ``(kind, theme code, extract code)`` which were
+                not translated.
+        """
+        unmapped = self.take_unmapped()
+        if unmapped:
+            logging.warning(
+                "No transfer code is configured for %s",
+                ", ".join(
+                    "{} {!r} of theme {} ({} records)".format(kind, code, theme_code, count)
+                    for (kind, theme_code, code), count in sorted(unmapped.items(), key=str)
+                ),
+            )
+        return unmapped
+
+
 def merge_office(master, merger):
     """
     Merge multiple ``OfficeRecords`` to one. While processing ÖREBlex there can occur different versions
@@ -242,6 +726,43 @@ def merge_document(master, merger):
     return master
 
 
+def merge_languages(records_per_language, languages):
+    """
+    Merges the records of all languages into one record per ÖREBlex document file. The records are matched
+    by their ``identifier`` (see :class:`OEREBlexSourceCustom`), records without identifier are matched by
+    their position. Records which are missing in some languages are kept with the languages available.
+
+    Args:
+        records_per_language (list of list of pyramid_oereb.core.records.documents.DocumentRecord): The
+            records per language.
+        languages (list of str): The language codes in the order of ``records_per_language``.
+    Returns:
+        (tuple): tuple containing:
+            list of pyramid_oereb.core.records.documents.DocumentRecord: The merged records in the order
+                they occur first.
+            dict: The missing languages per identifier of the records which are not available in all
+                languages.
+    """
+    merged = {}
+    found_in = {}
+    for language, records in zip(languages, records_per_language):
+        for position, record in enumerate(records):
+            key = record.identifier if record.identifier is not None else position
+            master = merged.get(key)
+            if master is None:
+                merged[key] = record
+                found_in[key] = {language}
+            else:
+                merge_document(master, record)
+                found_in[key].add(language)
+    missing = {
+        key: [language for language in languages if language not in found]
+        for key, found in found_in.items()
+        if len(found) < len(languages)
+    }
+    return list(merged.values()), missing
+
+
 def make_office_at_web_multilingual(documents, language):
     """
     ÖEREBlex offers multilingual elements via different URLS. With this method we combine all available
@@ -259,6 +780,424 @@ def make_office_at_web_multilingual(documents, language):
     return documents
 
 
+def in_force_law_status_record():
+    """
+    Creates the law status record which is used to read documents from ÖREBlex. The documents delivered by
+    ÖREBlex are always considered to be in force.
+
+    Returns:
+        pyramid_oereb.core.records.law_status.LawStatusRecord: The law status record.
+    """
+    return LawStatusRecord(
+        "inKraft",
+        {
+            "de": "in Kraft",
+            "fr": "En vigueur",
+            "it": "In vigore",
+            "rm": "En vigur",
+            "en": "In force",
+        },
+    )
+
+
+class OEREBlexLoader(object):
+    """
+    Keeps an initialized ``pyramid_oereb`` configuration and the resolved ÖREBlex source class to load the
+    documents of many geolinks without parsing the configuration yaml again for each of them.
+
+    ``pyramid_oereb`` holds its configuration on the class level of
+    :class:`pyramid_oereb.core.config.Config`. Each loader keeps its own state and re-activates it before
+    loading, so loaders with different configurations can be used one after the other. Only one
+    configuration can be active per process at a time: loaders with different configurations must not be
+    used concurrently from different threads or tasks, because activating one replaces the configuration
+    the other one is reading with. Any number of threads can use the same loader.
+
+    The loader can be used as a context manager which calls :meth:`close` on exit.
+
+    Args:
+        pyramid_oereb_config_path (str): The configuration yaml file path.
+        pyramid_config_section (str): The section within the yaml file.
+        source_class_path (str): The point separated path to the class which is used to produce the document
+            records (Default: ``geolink2oereb.lib.interfaces.pyramid_oereb.OEREBlexSourceCustom``).
+        c2ctemplate_style (bool): If set to true, c2c.template library will be used
+            to load config file (Default: False).
+        language_workers (int or None): The maximum number of languages which are read from ÖREBlex
+            concurrently. If None, all configured languages are read at the same time (Default: None).
+        http_session (requests.Session or None): The session which is passed to all created sources. If
+            None, a :class:`geolink2oereb.lib.http.PooledSession` is created, which is closed by
+            :meth:`close` (Default: None).
+        pool_size (int): The connection pool size of the created session (Default: 10).
+        cache (geolink2oereb.lib.cache.DiskCache or None): The cache for raw geoLink responses which is
+            passed to all created sources (Default: None).
+        document_cache (geolink2oereb.lib.cache.LRUCache or None): The cache for parsed geoLink documents
+            which is passed to all created sources (Default: None).
+        limiter (geolink2oereb.lib.concurrency.AdaptiveLimiter or None): Limits the concurrent requests of
+            all created sources, except for :meth:`load_async` (Default: None).
+    """
+
+    def __init__(
+        self,
+        pyramid_oereb_config_path,
+        pyramid_config_section,
+        source_class_path="geolink2oereb.lib.interfaces.pyramid_oereb.OEREBlexSourceCustom",
+        c2ctemplate_style=False,
+        language_workers=None,
+        http_session=None,
+        pool_size=10,
+        cache=None,
+        document_cache=None,
+        limiter=None,
+    ):
+        Config._config = None
+        Config.init(
+            pyramid_oereb_config_path,
+            pyramid_config_section,
+            c2ctemplate_style=c2ctemplate_style,
+            init_data=False,
+        )
+        self._config = Config._config
+        # everything besides the responses which changes the transformed records of a geolink
+        self._fingerprint = hashlib.sha256(
+            json.dumps([source_class_path, self._config], sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        self._code_translations = CodeTranslations(self._config)
+        self._document_types = oerebkrm_v2_0_dokument_typ_2_document_type_records()
+        self._law_status = in_force_law_status_record()
+        self._source_class = DottedNameResolver().resolve(source_class_path)
+        self._language_workers = language_workers
+        # only a session created here is closed by the loader, a passed one belongs to the caller
+        self._owns_http_session = http_session is None
+        self._http_session = http_session if http_session is not None else PooledSession(pool_size)
+        self._cache = cache
+        self._document_cache = document_cache
+        self._single_flight = SingleFlight()
+        self._limiter = limiter
+        self.activate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the connections of the session created by the loader. A session passed as ``http_session``
+        is left open.
+        """
+        if self._owns_http_session:
+            self._http_session.close()
+
+    @property
+    def law_status(self):
+        """
+        Returns:
+            pyramid_oereb.core.records.law_status.LawStatusRecord: The law status used to read documents.
+        """
+        return self._law_status
+
+    @property
+    def http_session(self):
+        """
+        Returns:
+            requests.Session: The session shared by all sources of this loader.
+        """
+        return self._http_session
+
+    @property
+    def single_flight(self):
+        """
+        Returns:
+            geolink2oereb.lib.concurrency.SingleFlight: Deduplicates concurrent requests of all sources of
+                this loader.
+        """
+        return self._single_flight
+
+    @property
+    def limiter(self):
+        """
+        Returns:
+            geolink2oereb.lib.concurrency.AdaptiveLimiter or None: Limits the concurrent requests of all
+                sources of this loader.
+        """
+        return self._limiter
+
+    @property
+    def code_translations(self):
+        """
+        Returns:
+            CodeTranslations: The translation of the document type and law status codes.
+        """
+        return self._code_translations
+
+    @property
+    def source_class(self):
+        """
+        Returns:
+            type: The resolved class which is used to produce the document records.
+        """
+        return self._source_class
+
+    def activate(self):
+        """
+        Makes the state of this loader the active ``pyramid_oereb`` configuration. This is cheap and does
+        not read the configuration yaml again. The configuration is global to the process and not guarded
+        by a lock, see :class:`OEREBlexLoader`.
+        """
+        Config._config = self._config
+        Config.document_types = self._document_types
+        Config.law_status = [self._law_status]
+
+    def create_source(self, theme_code):
+        """
+        Creates a new ÖREBlex source for the passed theme out of the loaded configuration. Sources which
+        accept an ``http_session`` and caches (like :class:`OEREBlexSourceCustom`) receive the ones of the
+        loader.
+
+        Args:
+            theme_code (str): The theme code matching the ``pyramid_oereb`` configuration.
+
+        Returns:
+            pyramid_oereb.contrib.data_sources.oereblex.sources.document.OEREBlexSource: The source to read
+                the documents.
+        """
+        source_config = dict(Config.get_oereblex_config())
+        if issubclass(self._source_class, OEREBlexSourceCustom):
+            source_config["http_session"] = self._http_session
+            source_config["cache"] = self._cache
+            source_config["document_cache"] = self._document_cache
+            source_config["single_flight"] = self._single_flight
+            source_config["limiter"] = self._limiter
+        return create_document_source(
+            source_config,
+            theme_code,
+            self._config["default_language"],
+            oereb_lex_document_source_class=self._source_class,
+        )
+
+    def read(self, geolink_id, theme_code, language):
+        """
+        Reads the records of one geolink in one language. Each call uses its own source and parameter
+        instance, so it can be called from multiple threads.
+
+        Args:
+            geolink_id (int): The geoLink ID (lexlink ID).
+            theme_code (str): The theme code matching the ``pyramid_oereb`` configuration.
+            language (str): The language code (de, it, fr, ...).
+
+        Returns:
+            list of pyramid_oereb.core.records.documents.DocumentRecord: The records with a multilingual
+                office_at_web.
+        """
+        p = Parameter("xml")
+        p.set_language(language)
+        source = self.create_source(theme_code)
+        source.read(p, geolink_id, self._law_status)
+        return make_office_at_web_multilingual(source.records, language)
+
+    def read_languages(self, geolink_id, theme_code):
+        """
+        Reads the records of one geolink in all configured languages. The languages are read concurrently.
+
+        Args:
+            geolink_id (int): The geoLink ID (lexlink ID).
+            theme_code (str): The theme code matching the ``pyramid_oereb`` configuration.
+
+        Returns:
+            list of list of pyramid_oereb.core.records.documents.DocumentRecord: The records per language in
+                the order of the configured languages.
+        """
+        return self._map_languages(lambda language: self.read(geolink_id, theme_code, language))
+
+    def _map_languages(self, fn):
+        languages = Config.get_language()
+        max_workers = min(len(languages), self._language_workers or len(languages))
+        if max_workers <= 1:
+            return [fn(language) for language in languages]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fn, languages))
+
+    def fetch(self, geolink_id, theme_code):
+        """
+        The network part of :meth:`load`: requests the geolink in all configured languages without parsing
+        the responses. Together with :meth:`transform` it allows to fetch and transform different geolinks
+        at the same time. Source classes other than :class:`OEREBlexSourceCustom` are read completely here.
+
+        Args:
+            geolink_id (int): The geoLink ID (lexlink ID).
+            theme_code (str): The theme code matching the ``pyramid_oereb`` configuration.
+
+        Returns:
+            list of FetchedLanguage: The responses in the order of the configured languages.
+        """
+        self.activate()
+        return self._map_languages(lambda language: self._fetch(geolink_id, theme_code, language))
+
+    def _fetch(self, geolink_id, theme_code, language):
+        p = Parameter("xml")
+        p.set_language(language)
+        source = self.create_source(theme_code)
+        if not isinstance(source, OEREBlexSourceCustom):
+            source.read(p, geolink_id, self._law_status)
+            records = make_office_at_web_multilingual(source.records, language)
+            return FetchedLanguage(language, None, lambda: records)
+        fetched = source.fetch_geolink(p, geolink_id, self._law_status)
+        read = partial(self._read_fetched, source, fetched, language)
+        return FetchedLanguage(language, fetched.content, read)
+
+    def _read_fetched(self, source, fetched, language):
+        source.read_fetched(fetched)
+        return make_office_at_web_multilingual(source.records, language)
+
+    def transform(self, fetched, theme_code):
+        """
+        The processing part of :meth:`load`: parses the responses of :meth:`fetch`, merges the languages and
+        translates the codes.
+
+        Args:
+            fetched (list of FetchedLanguage): The result of :meth:`fetch` or :meth:`fetch_async`.
+            theme_code (str): The theme code matching the ``pyramid_oereb`` configuration.
+
+        Returns:
+            list of pyramid_oereb.core.records.documents.DocumentRecord: The collected and corrected
+                documents, with types and offices.
+        """
+        self.activate()
+        return self.combine([item.read() for item in fetched], theme_code)
+
+    def fetched_digest(self, fetched, theme_code):
+        """
+        Builds a digest of the raw responses of all languages of a geolink, e.g. to detect if a geolink
+        changed since the last run before parsing it. The configuration and the source class are part of
+        the digest, so the digest changes with everything that changes the transformed records.
+
+        Args:
+            fetched (list of FetchedLanguage): The result of :meth:`fetch` or :meth:`fetch_async`.
+            theme_code (str): The theme code matching the ``pyramid_oereb`` configuration.
+
+        Returns:
+            str or None: The hex encoded SHA-256 digest or None if the content of a language is not
+                available.
+        """
+        digest = hashlib.sha256()
+        digest.update(self._fingerprint.encode("utf-8"))
+        digest.update(theme_code.encode("utf-8"))
+        for item in fetched:
+            if item.content is None:
+                return None
+            content = item.content.encode("utf-8") if isinstance(item.content, str) else item.content
+            digest.update(item.language.encode("utf-8"))
+            digest.update(hashlib.sha256(content).digest())
+        return digest.hexdigest()
+
+    async def fetch_async(self, client, geolink_id, theme_code):
+        """
+        Asynchronous variant of :meth:`fetch`. All languages are requested concurrently. It needs a source
+        class which offers ``fetch_geolink_async`` like :class:`OEREBlexSourceCustom`.
+
+        Args:
+            client (aiohttp.ClientSession): The client to use.
+            geolink_id (int): The geoLink ID (lexlink ID).
+            theme_code (str): The theme code matching the ``pyramid_oereb`` configuration.
+
+        Returns:
+            list of FetchedLanguage: The responses in the order of the configured languages.
+        """
+        self.activate()
+        return list(await asyncio.gather(*[
+            self._fetch_async(client, geolink_id, theme_code, language) for language in Config.get_language()
+        ]))
+
+    async def _fetch_async(self, client, geolink_id, theme_code, language):
+        p = Parameter("xml")
+        p.set_language(language)
+        source = self.create_source(theme_code)
+        fetched = await source.fetch_geolink_async(client, p, geolink_id, self._law_status)
+        read = partial(self._read_fetched, source, fetched, language)
+        return FetchedLanguage(language, fetched.content, read)
+
+    async def read_async(self, client, geolink_id, theme_code, language):
+        """
+        Asynchronous variant of :meth:`read`. It needs a source class which offers ``read_async`` like
+        :class:`OEREBlexSourceCustom`.
+
+        Args:
+            client (aiohttp.ClientSession): The client to use.
+            geolink_id (int): The geoLink ID (lexlink ID).
+            theme_code (str): The theme code matching the ``pyramid_oereb`` configuration.
+            language (str): The language code (de, it, fr, ...).
+
+        Returns:
+            list of pyramid_oereb.core.records.documents.DocumentRecord: The records with a multilingual
+                office_at_web.
+        """
+        p = Parameter("xml")
+        p.set_language(language)
+        source = self.create_source(theme_code)
+        await source.read_async(client, p, geolink_id, self._law_status)
+        return make_office_at_web_multilingual(source.records, language)
+
+    def combine(self, records_per_language, theme_code):
+        """
+        Merges the records of all languages (see :func:`merge_languages`) and translates the document type
+        and law status codes to the transfer codes.
+
+        Args:
+            records_per_language (list of list of pyramid_oereb.core.records.documents.DocumentRecord): The
+                records per language in the order of the configured languages.
+            theme_code (str): The theme code matching the ``pyramid_oereb`` configuration.
+
+        Returns:
+            list of pyramid_oereb.core.records.documents.DocumentRecord: The collected and corrected
+                documents, with types and offices.
+        """
+        result, missing = merge_languages(records_per_language, Config.get_language())
+        if missing:
+            logging.warning(
+                "Records of theme %s are missing in some languages: %s",
+                theme_code,
+                ", ".join("{} ({})".format(key, ", ".join(languages)) for key, languages in missing.items()),
+            )
+        return self._code_translations.translate(result, theme_code)
+
+    def load(self, geolink_id, theme_code):
+        """
+        Obtains a set of records from ÖREBlex by utilizing the loaded configuration.
+
+        Args:
+            geolink_id (int): The geoLink ID (lexlink ID).
+            theme_code (str): The theme code matching the ``pyramid_oereb`` configuration.
+
+        Returns:
+            list of pyramid_oereb.core.records.documents.DocumentRecord: The collected and corrected
+                documents, with types and offices.
+        """
+        self.activate()
+        return self.combine(self.read_languages(geolink_id, theme_code), theme_code)
+
+    async def load_async(self, client, geolink_id, theme_code):
+        """
+        Asynchronous variant of :meth:`load`. All languages are requested concurrently. Merging and
+        translating the records run in the default executor of the running event loop.
+
+        Args:
+            client (aiohttp.ClientSession): The client to use.
+            geolink_id (int): The geoLink ID (lexlink ID).
+            theme_code (str): The theme code matching the ``pyramid_oereb`` configuration.
+
+        Returns:
+            list of pyramid_oereb.core.records.documents.DocumentRecord: The collected and corrected
+                documents, with types and offices.
+        """
+        self.activate()
+        records_per_language = await asyncio.gather(*[
+            self.read_async(client, geolink_id, theme_code, language) for language in Config.get_language()
+        ])
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.combine, list(records_per_language), theme_code
+        )
+
+
 def load(
     geolink_id,
     theme_code,
@@ -269,6 +1208,8 @@ def load(
 ):
     """
     Interface method to ``pyramid_oereb``. It utilizes the lib to obtain a set of records from ÖREBlex.
+    The configuration is read on each call. Use :class:`OEREBlexLoader` to load many geolinks against the
+    same configuration.
 
     Args:
         geolink_id (int): The geoLink ID (lexlink ID).
@@ -284,58 +1225,12 @@ def load(
         list of pyramid_oereb.core.records.documents.DocumentRecord: The collected and corrected
             documents, with types and offices.
     """
-    Config._config = None
-    Config.init(
+    with OEREBlexLoader(
         pyramid_oereb_config_path,
         pyramid_config_section,
-        c2ctemplate_style=c2ctemplate_style,
-        init_data=False,
-    )
-    Config.document_types = oerebkrm_v2_0_dokument_typ_2_document_type_records()
-    lst = LawStatusRecord(
-        "inKraft",
-        {
-            "de": "in Kraft",
-            "fr": "En vigueur",
-            "it": "In vigore",
-            "rm": "En vigur",
-            "en": "In force",
-        },
-    )
-    Config.law_status = [lst]
-    p = Parameter("xml")
-
-    resolver = DottedNameResolver()
-    oereblex_source_class = resolver.resolve(source_class_path)
-    source = create_document_source(
-        Config.get_oereblex_config(),
-        theme_code,
-        Config._config["default_language"],
-        oereb_lex_document_source_class=oereblex_source_class,
-    )
-
-    master_language = Config.get_language()[0]
-    p.set_language(master_language)
-    source.read(p, geolink_id, lst)
-    result = make_office_at_web_multilingual(source.records, master_language)
-
-    for language in Config.get_language():
-        if language != master_language:
-            p.set_language(language)
-            source.read(p, geolink_id, lst)
-            mergers = make_office_at_web_multilingual(source.records, language)
-            for index, record in enumerate(mergers):
-                merge_document(result[index], record)
-
-    for record in result:
-        new_code = get_document_type_code_by_extract_value(theme_code, record.document_type.code)
-        logging.debug(f"Old document code: {record.document_type.code}")
-        logging.debug(f"New document code: {new_code}")
-        record.document_type.code = new_code
-
-        new_code = get_law_status_code_by_extract_value(theme_code, record.law_status.code)
-        logging.debug(f"Old law status code: {record.law_status.code}")
-        logging.debug(f"New law status code: {new_code}")
-        record.law_status.code = new_code
-
+        source_class_path,
+        c2ctemplate_style,
+    ) as loader:
+        result = loader.load(geolink_id, theme_code)
+        loader.code_translations.report_unmapped()
     return result
@@ -0,0 +1,163 @@
+"""
+Token bucket rate limiting of the requests to an ÖREBlex host. It is configured in the ``oereblex`` section of
+the ``pyramid_oereb`` configuration yaml:
+
+.. code-block:: yaml
+
+  oereblex:
+    host: https://oereblex.example.com
+    rate_limit:
+      # the allowed average number of requests per second
+      requests_per_second: 5
+      # the number of requests which may be sent at once after a pause (Default: 1)
+      burst: 1
+      # a file to share the limit with other processes (Default: None)
+      lock_file: /tmp/geolink2oereb-oereblex.lock
+
+All sources of a process which request the same host with the same settings share one bucket. Processes
+share the bucket through the lock file, so it has to be set if the geolinks are processed by multiple
+processes (e.g. ``--processes`` or parallel runs of ``load_documents``).
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class TokenBucket(object):
+    """
+    A thread safe token bucket. Each request takes one token, the tokens are refilled with ``rate`` per
+    second up to ``burst``. Requests which find the bucket empty reserve a future token and have to wait
+    until it is available, so waiting requests are served in order.
+
+    The tokens are refilled by the monotonic clock, so changes of the system time do not cause bursts or
+    stalls.
+
+    Args:
+        rate (float): The number of tokens added per second.
+        burst (int): The maximum number of tokens in the bucket (Default: 1).
+    """
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError('The rate has to be positive: {}'.format(rate))
+        self.rate = float(rate)
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = self._now()
+
+    def _now(self):
+        return time.monotonic()
+
+    def _take(self, tokens, updated, now):
+        tokens = min(self.burst, tokens + max(0, now - updated) * self.rate) - 1
+        return tokens, max(0.0, -tokens / self.rate)
+
+    def reserve(self):
+        """
+        Takes a token.
+
+        Returns:
+            float: The seconds to wait until the token may be used.
+        """
+        with self._lock:
+            now = self._now()
+            self._tokens, delay = self._take(self._tokens, self._updated, now)
+            self._updated = now
+        return delay
+
+    def acquire(self):
+        """
+        Takes a token and waits until it may be used.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """
+        Asynchronous variant of :meth:`acquire`. The token is taken in the default executor of the running
+        event loop, as taking it may wait for the lock of another process.
+        """
+        delay = await asyncio.get_running_loop().run_in_executor(None, self.reserve)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    A :class:`TokenBucket` which keeps its state in a file, so it is shared by all processes using the same
+    file. The file is locked while the state is updated. It needs ``fcntl`` and is therefore not available
+    on Windows. As the monotonic clock is not shared by processes, the tokens are refilled by the system
+    time.
+
+    Args:
+        rate (float): The number of tokens added per second.
+        burst (int): The maximum number of tokens in the bucket (Default: 1).
+        path (str): The lock file. It is created if it does not exist.
+    """
+
+    def __init__(self, rate, burst=1, path=None):
+        if fcntl is None:
+            raise RuntimeError('Sharing the rate limit between processes needs fcntl')
+        super(FileTokenBucket, self).__init__(rate, burst)
+        self.path = path
+
+    def _now(self):
+        return time.time()
+
+    def reserve(self):
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                now = self._now()
+                try:
+                    tokens, updated = (float(value) for value in os.read(fd, 64).split())
+                except ValueError:
+                    # a new or unreadable file starts with a full bucket
+                    tokens, updated = float(self.burst), now
+                tokens, delay = self._take(tokens, updated, now)
+                state = '{!r} {!r}'.format(tokens, now).encode('ascii')
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, state)
+            finally:
+                os.close(fd)
+        return delay
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(host, requests_per_second, burst=1, lock_file=None):
+    """
+    Returns the bucket shared by all sources of this process requesting the host with the same settings.
+
+    Args:
+        host (str): The ÖREBlex host.
+        requests_per_second (float): The allowed average number of requests per second.
+        burst (int): The number of requests which may be sent at once after a pause (Default: 1).
+        lock_file (str or None): A file to share the bucket with other processes (Default: None).
+
+    Returns:
+        TokenBucket: The bucket.
+    """
+    key = (host, requests_per_second, burst, lock_file)
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            if lock_file is None:
+                bucket = TokenBucket(requests_per_second, burst)
+            else:
+                bucket = FileTokenBucket(requests_per_second, burst, lock_file)
+            _buckets[key] = bucket
+        return bucket
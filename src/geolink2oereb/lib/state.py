@@ -0,0 +1,115 @@
+"""
+The state of incremental runs. For each geolink and theme it keeps a digest of the raw ÖREBlex responses of
+all languages and the Dokument/Amt elements they were transformed to. If a geolink delivers the same responses
+again, the stored elements are reused without parsing, merging and translating the responses again.
+"""
+
+import pickle
+import sqlite3
+import threading
+import time
+
+# increased whenever the stored elements change, older states are discarded then
+VERSION = 1
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS geolinks (
+    theme_code TEXT NOT NULL,
+    geolink_id INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    elements BLOB NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (theme_code, geolink_id)
+)
+'''
+
+
+class SyncState(object):
+    """
+    A SQLite database with the digest and the compact elements of each processed geolink. The elements are
+    stored pickled, so the database must only be shared with trusted users.
+
+    The state can be used by multiple threads and processes at the same time. Each process opens its own
+    connection.
+
+    Args:
+        path (str): The database file. It is created if it does not exist.
+        timeout (float): The seconds to wait for a lock held by another process (Default: 30).
+    """
+
+    def __init__(self, path, timeout=30):
+        self.path = path
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        with self._lock, self._connection:
+            if self._connection.execute('PRAGMA user_version').fetchone()[0] != VERSION:
+                self._connection.execute('DROP TABLE IF EXISTS geolinks')
+                self._connection.execute('PRAGMA user_version = {}'.format(VERSION))
+            self._connection.execute(SCHEMA)
+        self._unchanged = 0
+        self._changed = 0
+
+    def __getstate__(self):
+        return {'path': self.path, 'timeout': self.timeout}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @property
+    def stats(self):
+        """
+        Returns:
+            dict: The number of geolinks which were ``unchanged`` and ``changed`` (or new) since the state
+                was opened.
+        """
+        return {'unchanged': self._unchanged, 'changed': self._changed}
+
+    def get(self, theme_code, geolink_id, digest):
+        """
+        Returns the stored elements of a geolink if its responses did not change.
+
+        Args:
+            theme_code (str): The theme code.
+            geolink_id (int): The geolink ID.
+            digest (str): The digest of the current responses.
+
+        Returns:
+            list of tuple or None: The stored Dokument/Amt pairs, or None if the geolink is unknown or
+                its responses changed.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT digest, elements FROM geolinks WHERE theme_code = ? AND geolink_id = ?',
+                (theme_code, geolink_id)
+            ).fetchone()
+            if row is None or row[0] != digest:
+                self._changed += 1
+                return None
+            self._unchanged += 1
+        return pickle.loads(row[1])
+
+    def set(self, theme_code, geolink_id, digest, elements):
+        """
+        Stores the elements of a geolink.
+
+        Args:
+            theme_code (str): The theme code.
+            geolink_id (int): The geolink ID.
+            digest (str): The digest of the responses.
+            elements (list of tuple): The compact Dokument/Amt pairs.
+        """
+        data = pickle.dumps(elements, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO geolinks (theme_code, geolink_id, digest, elements, updated_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (theme_code, geolink_id, digest, data, time.time())
+            )
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
@@ -3,14 +3,555 @@ The basic entry module. It offers methods to be used right away:
 
 * run
 * run_batch
+* run_batch_iter
+* run_pipeline
+* run_async
+* run_batch_async
+
+To process many geolinks against the same configuration, a :class:`Geolink2OerebSession` can be used
+directly. It keeps the ``pyramid_oereb`` configuration loaded between the calls.
 """
 
-from uuid import uuid4
-from geolink2oereb.lib.interfaces.pyramid_oereb import load
+import asyncio
+import logging
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from functools import lru_cache
+from uuid import UUID, uuid4, uuid5
+from geolink2oereb.lib.cache import LRUCache
+from geolink2oereb.lib.concurrency import ordered_pipeline
+from geolink2oereb.lib.http import create_async_client
+from geolink2oereb.lib.interfaces.pyramid_oereb import OEREBlexLoader
 from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.generators import (
+    document_record_to_compact,
     document_record_to_oerebkrmtrsfr,
 )
 
+log = logging.getLogger(__name__)
+
+
+class BatchError(Exception):
+    """
+    Raised by ``run_batch`` once all geolinks were processed and at least one of them failed.
+
+    Args:
+        errors (dict): The exception per failed geolink ID.
+        gathered (list): The results of all geolinks which were processed successfully, in input order. It
+            is empty if the results were streamed by ``run_batch_iter`` or ``run_batch_async``.
+    """
+
+    def __init__(self, errors, gathered):
+        self.errors = errors
+        self.gathered = gathered
+        super(BatchError, self).__init__(
+            'Processing failed for geolink(s): {}'.format(', '.join(str(key) for key in errors))
+        )
+
+
+class Geolink2OerebSession(object):
+    """
+    A session loads the ``pyramid_oereb`` configuration, resolves the ÖREBlex source class and builds the
+    document type and law status records once. Afterwards any number of geolinks can be processed against
+    that warm state.
+
+    ``pyramid_oereb`` keeps its configuration globally per process. Sessions with different configurations
+    can be used one after the other, but not at the same time from different threads or tasks (see
+    :class:`~geolink2oereb.lib.interfaces.pyramid_oereb.OEREBlexLoader`).
+
+    Args:
+        pyramid_oereb_config_path (str): The absolute path to the pyramid_oereb yml configuration file.
+        section (str): The section inside the yml configuration where the pyramid_oereb configuration can be
+            found.
+        source_class_path (str): The pythonic dotted path to the ÖREBlex Source class definition which is used
+            to construct pyramid_oereb DocumentRecords.
+        c2ctemplate_style (bool): If the C2C way of parsing a yml should be used or not.
+        language_workers (int or None): The maximum number of languages which are read from ÖREBlex
+            concurrently per geolink. If None, all languages are read at the same time.
+        http_session (requests.Session or None): The session used for all ÖREBlex requests. If None, a
+            pooled session is created.
+        pool_size (int): The connection pool size of the created session. It should cover the number of
+            concurrent requests, which is ``max_workers`` times the number of languages (Default: 10).
+        cache (geolink2oereb.lib.cache.DiskCache or None): The cache for raw geoLink responses
+            (Default: None).
+        document_cache_size (int or None): The number of parsed geoLink documents (per geolink and language)
+            which are kept in memory, so themes referencing the same geolinks do not fetch and parse them
+            again. As the cached documents are not revalidated, it should only be enabled for sessions with a
+            limited lifetime like a batch run. If None, no documents are cached (Default: None).
+        compact (bool): If True, the results are the compact elements
+            :class:`~geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.generators.CompactDokument` and
+            :class:`~geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.generators.CompactAmt`. They need much
+            less memory and are converted to the generated classes only when they are exported
+            (Default: False).
+        limiter (geolink2oereb.lib.concurrency.AdaptiveLimiter or None): Adapts the number of concurrent
+            ÖREBlex requests to what the server sustains. ``max_workers`` is the upper bound then. With
+            ``processes``, each worker process adapts its own copy. The asynchronous methods do not use it,
+            their requests are bounded by ``concurrency``. If None, the requests are not limited
+            (Default: None).
+        state (geolink2oereb.lib.state.SyncState or None): The state of incremental runs. If passed, the
+            responses of all languages of a geolink are compared to the last run before they are parsed
+            (see :meth:`~geolink2oereb.lib.interfaces.pyramid_oereb.OEREBlexLoader.fetched_digest`). If
+            none of them changed, the elements are taken from the state and parsing, merging and
+            translation are skipped. Geolinks whose responses are not available, e.g. because they are in
+            the document cache, are transformed as usual (Default: None).
+    """
+
+    def __init__(
+        self,
+        pyramid_oereb_config_path,
+        section,
+        source_class_path="geolink2oereb.lib.interfaces.pyramid_oereb.OEREBlexSourceCustom",
+        c2ctemplate_style=False,
+        language_workers=None,
+        http_session=None,
+        pool_size=10,
+        cache=None,
+        document_cache_size=None,
+        compact=False,
+        limiter=None,
+        state=None,
+    ):
+        # the options a worker process needs to create an equal session (see run_batch_iter)
+        self._options = dict(
+            pyramid_oereb_config_path=pyramid_oereb_config_path,
+            section=section,
+            source_class_path=source_class_path,
+            c2ctemplate_style=c2ctemplate_style,
+            language_workers=language_workers,
+            http_session=http_session,
+            pool_size=pool_size,
+            cache=cache,
+            document_cache_size=document_cache_size,
+            compact=True,
+            limiter=limiter,
+            state=state,
+        )
+        self._compact = compact
+        self.state = state
+        self._translate = document_record_to_compact if compact else document_record_to_oerebkrmtrsfr
+        self.document_cache = LRUCache(document_cache_size) if document_cache_size else None
+        self.loader = OEREBlexLoader(
+            pyramid_oereb_config_path,
+            section,
+            source_class_path,
+            c2ctemplate_style,
+            language_workers=language_workers,
+            http_session=http_session,
+            pool_size=pool_size,
+            cache=cache,
+            document_cache=self.document_cache,
+            limiter=limiter,
+        )
+
+    def run(self, geolink_id, theme_code):
+        """Loads documents from one ÖREBlex geolink and transforms it to OeREBKRMtrsfr objects.
+
+        Args:
+            geolink_id (int): The lexlink/geolink of the ÖREBlex document to download.
+            theme_code (str): The theme code which is used to read the ÖREBlex specific config from the
+                pyramid_oereb yml configuration.
+
+        Returns:
+            list of geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument
+        """
+        try:
+            return self._run(geolink_id, theme_code)
+        finally:
+            self.loader.code_translations.report_unmapped()
+
+    def _run(self, geolink_id, theme_code):
+        if self.state is None:
+            document_records = self.loader.load(geolink_id, theme_code)
+            return [self._translate(record) for record in document_records]
+        return self._transform(geolink_id, theme_code, self.loader.fetch(geolink_id, theme_code))
+
+    def _transform(self, geolink_id, theme_code, fetched):
+        if self.state is None:
+            document_records = self.loader.transform(fetched, theme_code)
+            return [self._translate(record) for record in document_records]
+        digest = self.loader.fetched_digest(fetched, theme_code)
+        pairs = None if digest is None else self.state.get(theme_code, geolink_id, digest)
+        if pairs is None:
+            document_records = self.loader.transform(fetched, theme_code)
+            pairs = [document_record_to_compact(record) for record in document_records]
+            if digest is not None:
+                self.state.set(theme_code, geolink_id, digest, pairs)
+        if self._compact:
+            return pairs
+        return [(dokument.to_oerebkrmtrsfr(), amt.to_oerebkrmtrsfr()) for dokument, amt in pairs]
+
+    def _run_safe(self, geolink_id, theme_code):
+        try:
+            return self._run(geolink_id, theme_code), None
+        except Exception as e:
+            log.error(f"Processing geolink {geolink_id} failed: {e}")
+            return None, e
+
+    def run_batch(self, geolink_ids, theme_code, max_workers=None, processes=None, chunk_size=16):
+        """
+        Loads documents from multiple ÖREBlex geolinks and transforms it to OeREBKRMtrsfr objects.
+
+        Args:
+            geolink_ids (list of int): A list of the lexlinks/geolinks of the ÖREBlex document to download.
+            theme_code (str): The theme code which is used to read the ÖREBlex specific config from the
+                pyramid_oereb yml configuration.
+            max_workers (int or None): The number of geolinks which are processed concurrently. If None or 1,
+                the geolinks are processed one after the other (Default: None). With ``processes`` it is
+                the number of threads per process.
+            processes (int or None): The number of worker processes the geolinks are distributed to. If None
+                or 1, all geolinks are processed in this process (Default: None).
+            chunk_size (int): The number of geolinks which are passed to a worker process at once
+                (Default: 16).
+
+        Returns:
+            list of geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument:
+                The results in the order of the passed geolink IDs.
+
+        Raises:
+            BatchError: If processing of at least one geolink failed. The remaining geolinks are processed
+                anyway and their results are available on the exception.
+        """
+        gathered = []
+        try:
+            gathered.extend(self.run_batch_iter(
+                geolink_ids,
+                theme_code,
+                max_workers=max_workers,
+                processes=processes,
+                chunk_size=chunk_size
+            ))
+        except BatchError as e:
+            raise BatchError(e.errors, gathered)
+        return gathered
+
+    def _outcomes(self, geolink_ids, theme_code, max_workers):
+        if max_workers is None or max_workers <= 1:
+            for geolink_id in geolink_ids:
+                yield geolink_id, self._run_safe(geolink_id, theme_code)
+            return
+        # only a limited number of geolinks is submitted ahead, so the pending results do not pile up
+        # if the consumer is slower than the workers
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for geolink_id in geolink_ids:
+                pending.append((geolink_id, executor.submit(self._run_safe, geolink_id, theme_code)))
+                if len(pending) >= 2 * max_workers:
+                    geolink_id, future = pending.popleft()
+                    yield geolink_id, future.result()
+            while pending:
+                geolink_id, future = pending.popleft()
+                yield geolink_id, future.result()
+
+    def _process_outcomes(self, geolink_ids, theme_code, max_workers, processes, chunk_size):
+        geolink_ids = iter(geolink_ids)
+        executor = ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(self._options,)
+        )
+        with executor:
+            pending = deque()
+            while True:
+                chunk = list(islice(geolink_ids, chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_run_chunk, chunk, theme_code, max_workers))
+                if len(pending) >= 2 * processes:
+                    yield from self._chunk_outcomes(pending.popleft().result())
+            while pending:
+                yield from self._chunk_outcomes(pending.popleft().result())
+
+    def _chunk_outcomes(self, chunk_result):
+        outcomes, unmapped = chunk_result
+        self.loader.code_translations.update_unmapped(unmapped)
+        for geolink_id, result, error in outcomes:
+            if result is not None and not self._compact:
+                result = [(dokument.to_oerebkrmtrsfr(), amt.to_oerebkrmtrsfr()) for dokument, amt in result]
+            yield geolink_id, (result, error)
+
+    def run_batch_iter(self, geolink_ids, theme_code, max_workers=None, processes=None, chunk_size=16):
+        """
+        Streaming variant of :meth:`run_batch`. It is a generator which yields the Dokument/Amt pairs of
+        each geolink as soon as the geolink and all geolinks before it are processed. The results are not
+        kept, so the memory usage does not grow with the number of geolinks.
+
+        With ``processes``, the geolinks are distributed in chunks to a pool of worker processes, so
+        parsing and transformation use multiple cores. Each worker keeps its own warm session and sends
+        the compact elements back. Unifying and assigning UUIDs is left to the caller in this process.
+
+        Args:
+            geolink_ids (iterable of int): The lexlinks/geolinks of the ÖREBlex document to download.
+            theme_code (str): The theme code which is used to read the ÖREBlex specific config from the
+                pyramid_oereb yml configuration.
+            max_workers (int or None): The number of geolinks which are processed concurrently. If None or 1,
+                the geolinks are processed one after the other (Default: None). With ``processes`` it is
+                the number of threads per process.
+            processes (int or None): The number of worker processes the geolinks are distributed to. If None
+                or 1, all geolinks are processed in this process (Default: None).
+            chunk_size (int): The number of geolinks which are passed to a worker process at once
+                (Default: 16).
+
+        Yields:
+            (tuple): tuple containing:
+                geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument:
+                    The Dokument.
+                geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Amt_Amt:
+                    The Amt.
+
+        Raises:
+            BatchError: After all results were yielded, if processing of at least one geolink failed.
+        """
+        if processes is not None and processes > 1:
+            outcomes = self._process_outcomes(geolink_ids, theme_code, max_workers, processes, chunk_size)
+        else:
+            outcomes = self._outcomes(geolink_ids, theme_code, max_workers)
+        errors = {}
+        try:
+            for geolink_id, (result, error) in outcomes:
+                if error is None:
+                    yield from result
+                else:
+                    errors[geolink_id] = error
+        finally:
+            # codes without translation are reported once for the whole batch
+            self.loader.code_translations.report_unmapped()
+        if errors:
+            raise BatchError(errors, [])
+
+    def run_pipeline(self, geolink_ids, theme_code, fetch_workers=4, transform_workers=1, queue_size=8):
+        """
+        Variant of :meth:`run_batch_iter` which runs fetching and transformation as separate stages.
+        The fetch threads only request ÖREBlex and pass the responses through a bounded queue to the
+        transform threads, which parse, merge and translate them. The consumer of the generator, e.g. the
+        transfer writer, is the last stage. So the network, the transformation and the output work at the
+        same time, and a slow stage holds back the stages before it.
+
+        Args:
+            geolink_ids (iterable of int): The lexlinks/geolinks of the ÖREBlex document to download.
+            theme_code (str): The theme code which is used to read the ÖREBlex specific config from the
+                pyramid_oereb yml configuration.
+            fetch_workers (int): The number of geolinks which are fetched concurrently (Default: 4).
+            transform_workers (int): The number of geolinks which are transformed concurrently. As the
+                transformation is bound by the CPU, more than one thread rarely helps (Default: 1).
+            queue_size (int): The number of geolinks which can wait in front of each stage (Default: 8).
+
+        Yields:
+            (tuple): The Dokument and its Amt, in the order of the passed geolink IDs.
+
+        Raises:
+            BatchError: After all results were yielded, if processing of at least one geolink failed.
+        """
+        def fetch(geolink_id):
+            return geolink_id, self.loader.fetch(geolink_id, theme_code)
+
+        def transform(fetched):
+            geolink_id, fetched = fetched
+            return self._transform(geolink_id, theme_code, fetched)
+
+        stages = [(fetch, fetch_workers), (transform, transform_workers)]
+        errors = {}
+        try:
+            for geolink_id, (result, error) in ordered_pipeline(geolink_ids, stages, queue_size):
+                if error is None:
+                    yield from result
+                else:
+                    log.error(f"Processing geolink {geolink_id} failed: {error}")
+                    errors[geolink_id] = error
+        finally:
+            self.loader.code_translations.report_unmapped()
+        if errors:
+            raise BatchError(errors, [])
+
+    async def run_async(self, geolink_id, theme_code, client=None):
+        """
+        Asynchronous variant of :meth:`run`. The geoLink XML is fetched with a pooled asynchronous HTTP
+        client, parsing and transformation run in the default executor of the event loop.
+
+        Args:
+            geolink_id (int): The lexlink/geolink of the ÖREBlex document to download.
+            theme_code (str): The theme code which is used to read the ÖREBlex specific config from the
+                pyramid_oereb yml configuration.
+            client (aiohttp.ClientSession or None): The client to use. If None, a client is created for
+                this call.
+
+        Returns:
+            list of geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument
+        """
+        if client is None:
+            async with create_async_client() as client:
+                return await self.run_async(geolink_id, theme_code, client)
+        try:
+            return await self._run_async(geolink_id, theme_code, client)
+        finally:
+            self.loader.code_translations.report_unmapped()
+
+    async def _run_async(self, geolink_id, theme_code, client):
+        loop = asyncio.get_running_loop()
+        if self.state is None:
+            document_records = await self.loader.load_async(client, geolink_id, theme_code)
+            return await loop.run_in_executor(
+                None,
+                lambda: [self._translate(record) for record in document_records]
+            )
+        fetched = await self.loader.fetch_async(client, geolink_id, theme_code)
+        return await loop.run_in_executor(None, self._transform, geolink_id, theme_code, fetched)
+
+    async def run_batch_async(self, geolink_ids, theme_code, concurrency=10, client=None):
+        """
+        Asynchronous variant of :meth:`run_batch`. It is an async generator which yields the results as
+        soon as a geolink is processed, so the order of the results is not the order of the input.
+
+        Only ``concurrency`` geolinks are processed at the same time, the next geolink is taken from
+        ``geolink_ids`` when one of them is done. If the consumer stops early, the geolinks in progress are
+        cancelled before the client is closed.
+
+        Args:
+            geolink_ids (iterable of int): The lexlinks/geolinks of the ÖREBlex document to download.
+            theme_code (str): The theme code which is used to read the ÖREBlex specific config from the
+                pyramid_oereb yml configuration.
+            concurrency (int): The maximum number of geolinks which are processed at the same time
+                (Default: 10).
+            client (aiohttp.ClientSession or None): The client to use. If None, a client with a connection
+                pool matching the concurrency is created.
+
+        Yields:
+            (tuple): tuple containing:
+                int: The geolink ID.
+                list of geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument:  # noqa: E501
+                    The result of the geolink.
+
+        Raises:
+            BatchError: After all results were yielded, if processing of at least one geolink failed.
+        """
+        if client is None:
+            async with create_async_client(limit=concurrency) as client:
+                results = self.run_batch_async(geolink_ids, theme_code, concurrency, client)
+                try:
+                    async for result in results:
+                        yield result
+                finally:
+                    # the geolinks in progress are cancelled before the client is closed
+                    await results.aclose()
+            return
+
+        async def process(geolink_id):
+            try:
+                return geolink_id, await self._run_async(geolink_id, theme_code, client), None
+            except Exception as e:
+                log.error(f"Processing geolink {geolink_id} failed: {e}")
+                return geolink_id, None, e
+
+        geolink_ids = iter(geolink_ids)
+        errors = {}
+        pending = set()
+        try:
+            while True:
+                # tasks are only created for the geolinks which are processed right away
+                for geolink_id in islice(geolink_ids, max(0, concurrency - len(pending))):
+                    pending.add(asyncio.ensure_future(process(geolink_id)))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    geolink_id, result, error = task.result()
+                    if error is None:
+                        yield geolink_id, result
+                    else:
+                        errors[geolink_id] = error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            self.loader.code_translations.report_unmapped()
+        if errors:
+            # the results were streamed, so they are not kept for the error
+            raise BatchError(errors, [])
+
+
+# the session of a worker process, see Geolink2OerebSession.run_batch_iter
+_worker_session = None
+
+
+def _init_worker(options):
+    global _worker_session
+    # with the fork start method the options are not pickled, but connections, locks and limiters must
+    # not be shared with the parent process
+    _worker_session = Geolink2OerebSession(**pickle.loads(pickle.dumps(options)))
+
+
+def _picklable(error):
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(repr(error))
+
+
+def _run_chunk(geolink_ids, theme_code, max_workers):
+    outcomes = [
+        (geolink_id, result, None if error is None else _picklable(error))
+        for geolink_id, (result, error) in _worker_session._outcomes(geolink_ids, theme_code, max_workers)
+    ]
+    # the untranslated codes are reported by the parent process once for the whole batch
+    unmapped = _worker_session.loader.code_translations.take_unmapped()
+    return outcomes, unmapped
+
+
+def get_session(
+    pyramid_oereb_config_path,
+    section,
+    source_class_path="geolink2oereb.lib.interfaces.pyramid_oereb.OEREBlexSourceCustom",
+    c2ctemplate_style=False,
+):
+    """
+    Returns a shared :class:`Geolink2OerebSession` for the passed configuration. Sessions are cached per
+    combination of the parameters and the modification time of the configuration yaml, so the file is only
+    read again once it changed. Files included by the configuration are not watched, call
+    ``get_session.cache_clear()`` to force re-reading them.
+
+    Args:
+        pyramid_oereb_config_path (str): The absolute path to the pyramid_oereb yml configuration file.
+        section (str): The section inside the yml configuration where the pyramid_oereb configuration can be
+            found.
+        source_class_path (str): The pythonic dotted path to the ÖREBlex Source class definition which is used
+            to construct pyramid_oereb DocumentRecords.
+        c2ctemplate_style (bool): If the C2C way of parsing a yml should be used or not.
+
+    Returns:
+        Geolink2OerebSession: The warm session.
+    """
+    return _get_session(
+        pyramid_oereb_config_path,
+        _modification_time(pyramid_oereb_config_path),
+        section,
+        source_class_path,
+        c2ctemplate_style,
+    )
+
+
+def _modification_time(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        # the session reports the missing configuration
+        return None
+
+
+@lru_cache(maxsize=8)
+def _get_session(pyramid_oereb_config_path, modification_time, section, source_class_path, c2ctemplate_style):
+    return Geolink2OerebSession(
+        pyramid_oereb_config_path,
+        section,
+        source_class_path,
+        c2ctemplate_style,
+    )
+
+
+get_session.cache_clear = _get_session.cache_clear
+
 
 def run(
     geolink_id,
@@ -36,15 +577,13 @@ def run(
     Returns:
         list of geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument
     """
-    document_records = load(
-        geolink_id,
-        theme_code,
+    session = get_session(
         pyramid_oereb_config_path,
         section,
         source_class_path,
         c2ctemplate_style,
     )
-    return [document_record_to_oerebkrmtrsfr(record) for record in document_records]
+    return session.run(geolink_id, theme_code)
 
 
 def run_batch(
@@ -53,7 +592,9 @@ def run_batch(
     pyramid_oereb_config_path,
     section,
     source_class_path="geolink2oereb.lib.interfaces.pyramid_oereb.OEREBlexSourceCustom",
-    c2ctemplate_style=False
+    c2ctemplate_style=False,
+    max_workers=None,
+    processes=None
 ):
     """
     Loads documents from multiple ÖREBlex geolinks and transforms it to OeREBKRMtrsfr objects.
@@ -68,25 +609,76 @@ def run_batch(
         source_class_path (str): The pythonic dotted path to the ÖREBlex Source class definition which is used
             to construct pyramid_oereb DocumentRecords.
         c2ctemplate_style (bool): If the C2C way of parsing a yml should be used or not.
+        max_workers (int or None): The number of geolinks which are processed concurrently. If None or 1,
+            the geolinks are processed one after the other (Default: None).
+        processes (int or None): The number of worker processes the geolinks are distributed to. If None or
+            1, all geolinks are processed in this process (Default: None).
 
     Returns:
-        list of geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument
+        list of geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument:
+            The results in the order of the passed geolink IDs.
+
+    Raises:
+        BatchError: If processing of at least one geolink failed. The remaining geolinks are processed
+            anyway and their results are available on the exception.
     """
-    gathered = []
-    for geolink_id in geolink_ids:
-        gathered = gathered + run(
-            geolink_id,
-            theme_code,
-            pyramid_oereb_config_path,
-            section,
-            source_class_path,
-            c2ctemplate_style,
-        )
-    return gathered
+    session = get_session(
+        pyramid_oereb_config_path,
+        section,
+        source_class_path,
+        c2ctemplate_style,
+    )
+    return session.run_batch(geolink_ids, theme_code, max_workers=max_workers, processes=processes)
+
+
+def run_batch_iter(
+    geolink_ids,
+    theme_code,
+    pyramid_oereb_config_path,
+    section,
+    source_class_path="geolink2oereb.lib.interfaces.pyramid_oereb.OEREBlexSourceCustom",
+    c2ctemplate_style=False,
+    max_workers=None,
+    processes=None
+):
+    """
+    Streaming variant of :func:`run_batch` which yields the Dokument/Amt pairs as soon as they are
+    available. It can be combined with :func:`unify_gathered_iter` and :func:`assign_uuids_iter`.
+
+    Args:
+        geolink_ids (iterable of int): The lexlinks/geolinks of the ÖREBlex document to download.
+        theme_code (str): The theme code which is used to read the ÖREBlex specific config from the
+            pyramid_oereb yml configuration.
+        pyramid_oereb_config_path (str): The absolute path to the pyramid_oereb yml configuration file.
+        section (str): The section inside the yml configuration where the pyramid_oereb configuration can be
+            found.
+        source_class_path (str): The pythonic dotted path to the ÖREBlex Source class definition which is used
+            to construct pyramid_oereb DocumentRecords.
+        c2ctemplate_style (bool): If the C2C way of parsing a yml should be used or not.
+        max_workers (int or None): The number of geolinks which are processed concurrently. If None or 1,
+            the geolinks are processed one after the other (Default: None).
+        processes (int or None): The number of worker processes the geolinks are distributed to. If None or
+            1, all geolinks are processed in this process (Default: None).
+
+    Yields:
+        (tuple): The Dokument and its Amt, in the order of the passed geolink IDs.
+
+    Raises:
+        BatchError: After all results were yielded, if processing of at least one geolink failed.
+    """
+    session = get_session(
+        pyramid_oereb_config_path,
+        section,
+        source_class_path,
+        c2ctemplate_style,
+    )
+    yield from session.run_batch_iter(geolink_ids, theme_code, max_workers=max_workers, processes=processes)
 
 
 def unify_gathered(gathered):
-    """add docs
+    """
+    Removes duplicated Dokumente and Ämter. Elements are equal if they got the same content digest as TID
+    while they were generated. The order of first occurrence is kept.
 
     Args:
         gathered (list):
@@ -102,30 +694,44 @@ def unify_gathered(gathered):
             list of geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Amt_Amt:
                 The list of unified Ämter.
     """
-    unique_amt_tids = []
+    unique_amt_tids = set()
     unique_amt = []
-    unique_dokument_tids = []
+    unique_dokument_tids = set()
     unique_dokument = []
     for dokument, amt in gathered:
-        if str(amt) not in unique_amt_tids:
-            unique_amt_tids.append(str(amt))
+        if amt.TID not in unique_amt_tids:
+            unique_amt_tids.add(amt.TID)
             unique_amt.append(amt)
         if dokument.TID not in unique_dokument_tids:
-            unique_dokument_tids.append(dokument.TID)
+            unique_dokument_tids.add(dokument.TID)
             unique_dokument.append(dokument)
     return unique_dokument, unique_amt
 
 
-def assign_uuids(unique_dokumente, unique_aemter):
+def _uuid_factory(namespace):
+    if namespace is None:
+        return lambda element: str(uuid4())
+    if not isinstance(namespace, UUID):
+        namespace = UUID(namespace)
+    return lambda element: str(uuid5(namespace, element.TID))
+
+
+def assign_uuids(unique_dokumente, unique_aemter, namespace=None):
     """
     Assigns UUIDs to a list of unique Aemter and Dokumente. It needs the lists to be in predefined order
     to match the correct objects.
 
+    By default random UUIDs are assigned. If a namespace is passed, the UUIDs are derived from the content
+    digests the elements got as TID while they were generated (UUID version 5), so the same content gets
+    the same UUID in every run.
+
     Args:
         unique_dokumente (list of geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument):  # noqa: E501
             List of unique dokumente where each dokument should receive a UUID.
         unique_aemter (list of geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Amt_Amt):
             List of unique aemter where each amt should receive a UUID.
+        namespace (uuid.UUID or str or None): The namespace of the derived UUIDs. If None, random UUIDs are
+            assigned.
     Returns:
         (tuple): tuple containing:
             list of geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument:
@@ -133,15 +739,166 @@ def assign_uuids(unique_dokumente, unique_aemter):
             list of geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Amt_Amt):
                 The list of unique Ämter where each Amt has a valid UUID assigned.
     """
+    new_uuid = _uuid_factory(namespace)
+    dokumente_by_amt = {}
+    for dokument in unique_dokumente:
+        dokumente_by_amt.setdefault(dokument.ZustaendigeStelle.REF, []).append(dokument)
     uuid_aemter = []
     uuid_dokumente = []
     for amt in unique_aemter:
-        new_amt_uuid = str(uuid4())
-        for dokument in unique_dokumente:
-            if dokument.ZustaendigeStelle.REF == str(amt):
-                dokument.ZustaendigeStelle.set_REF(new_amt_uuid)
-                uuid_dokumente.append(dokument)
-                dokument.set_TID(str(uuid4()))
+        new_amt_uuid = new_uuid(amt)
+        # Dokumente which do not reference any of the Ämter are dropped
+        for dokument in dokumente_by_amt.pop(amt.TID, []):
+            dokument.ZustaendigeStelle.set_REF(new_amt_uuid)
+            uuid_dokumente.append(dokument)
+            dokument.set_TID(new_uuid(dokument))
         amt.set_TID(new_amt_uuid)
         uuid_aemter.append(amt)
     return uuid_dokumente, uuid_aemter
+
+
+def unify_gathered_iter(gathered):
+    """
+    Streaming variant of :func:`unify_gathered`. Only the TIDs of the already yielded elements are kept.
+
+    Args:
+        gathered (iterable of tuple): The Dokument/Amt pairs, e.g. from :func:`run_batch_iter`.
+
+    Yields:
+        (tuple): tuple containing:
+            geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument:
+                Each Dokument the first time it occurs.
+            geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Amt_Amt or None:
+                The Amt of the Dokument, or None if it was yielded before.
+    """
+    unique_amt_tids = set()
+    unique_dokument_tids = set()
+    for dokument, amt in gathered:
+        if dokument.TID in unique_dokument_tids:
+            continue
+        unique_dokument_tids.add(dokument.TID)
+        if amt.TID in unique_amt_tids:
+            yield dokument, None
+        else:
+            unique_amt_tids.add(amt.TID)
+            yield dokument, amt
+
+
+def assign_uuids_iter(unified, namespace=None):
+    """
+    Streaming variant of :func:`assign_uuids`. Each Amt gets its UUID when it occurs first, the Dokumente
+    are relinked to it right away. The Dokumente are yielded in input order instead of being grouped by
+    Amt.
+
+    Args:
+        unified (iterable of tuple): The pairs yielded by :func:`unify_gathered_iter`.
+        namespace (uuid.UUID or str or None): The namespace of the derived UUIDs. If None, random UUIDs are
+            assigned.
+
+    Yields:
+        (tuple): The pairs of :func:`unify_gathered_iter` with the UUIDs assigned. Dokumente which do not
+            reference any known Amt are dropped.
+    """
+    new_uuid = _uuid_factory(namespace)
+    amt_uuids = {}
+    for dokument, amt in unified:
+        if amt is not None:
+            new_amt_uuid = new_uuid(amt)
+            amt_uuids[amt.TID] = new_amt_uuid
+            amt.set_TID(new_amt_uuid)
+        amt_uuid = amt_uuids.get(dokument.ZustaendigeStelle.REF)
+        if amt_uuid is None:
+            continue
+        dokument.ZustaendigeStelle.set_REF(amt_uuid)
+        dokument.set_TID(new_uuid(dokument))
+        yield dokument, amt
+
+
+async def run_async(
+    geolink_id,
+    theme_code,
+    pyramid_oereb_config_path,
+    section,
+    source_class_path="geolink2oereb.lib.interfaces.pyramid_oereb.OEREBlexSourceCustom",
+    c2ctemplate_style=False,
+    client=None
+):
+    """
+    Asynchronous variant of :func:`run`. The configuration is read synchronously on the first call for a
+    configuration, all further calls reuse the warm session.
+
+    Args:
+        geolink_id (int): The lexlink/geolink of the ÖREBlex document to download.
+        theme_code (str): The theme code which is used to read the ÖREBlex specific config from the
+            pyramid_oereb yml configuration.
+        pyramid_oereb_config_path (str): The absolute path to the pyramid_oereb yml configuration file.
+        section (str): The section inside the yml configuration where the pyramid_oereb configuration can be
+            found.
+        source_class_path (str): The pythonic dotted path to the ÖREBlex Source class definition which is used
+            to construct pyramid_oereb DocumentRecords. It has to support asynchronous reading.
+        c2ctemplate_style (bool): If the C2C way of parsing a yml should be used or not.
+        client (aiohttp.ClientSession or None): The client to use. If None, a client is created for
+            this call.
+
+    Returns:
+        list of geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument
+    """
+    session = get_session(
+        pyramid_oereb_config_path,
+        section,
+        source_class_path,
+        c2ctemplate_style,
+    )
+    return await session.run_async(geolink_id, theme_code, client=client)
+
+
+async def run_batch_async(
+    geolink_ids,
+    theme_code,
+    pyramid_oereb_config_path,
+    section,
+    source_class_path="geolink2oereb.lib.interfaces.pyramid_oereb.OEREBlexSourceCustom",
+    c2ctemplate_style=False,
+    concurrency=10,
+    client=None
+):
+    """
+    Asynchronous variant of :func:`run_batch`. It is an async generator which yields the results as soon as
+    a geolink is processed.
+
+    Args:
+        geolink_ids (iterable of int): The lexlinks/geolinks of the ÖREBlex document to download.
+        theme_code (str): The theme code which is used to read the ÖREBlex specific config from the
+            pyramid_oereb yml configuration.
+        pyramid_oereb_config_path (str): The absolute path to the pyramid_oereb yml configuration file.
+        section (str): The section inside the yml configuration where the pyramid_oereb configuration can be
+            found.
+        source_class_path (str): The pythonic dotted path to the ÖREBlex Source class definition which is used
+            to construct pyramid_oereb DocumentRecords. It has to support asynchronous reading.
+        c2ctemplate_style (bool): If the C2C way of parsing a yml should be used or not.
+        concurrency (int): The maximum number of geolinks which are processed at the same time
+            (Default: 10).
+        client (aiohttp.ClientSession or None): The client to use. If None, a client with a connection
+            pool matching the concurrency is created.
+
+    Yields:
+        (tuple): tuple containing:
+            int: The geolink ID.
+            list of geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes.OeREBKRM_V2_0_Dokumente_Dokument:
+                The result of the geolink.
+
+    Raises:
+        BatchError: After all results were yielded, if processing of at least one geolink failed.
+    """
+    session = get_session(
+        pyramid_oereb_config_path,
+        section,
+        source_class_path,
+        c2ctemplate_style,
+    )
+    results = session.run_batch_async(geolink_ids, theme_code, concurrency, client)
+    try:
+        async for result in results:
+            yield result
+    finally:
+        await results.aclose()
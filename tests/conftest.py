@@ -0,0 +1,175 @@
+import hashlib
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import yaml
+
+
+OEREBLEX_HOST = 'https://oereblex.example.com'
+
+GEOLINK_PATH = r'/api/1\.2\.2/geolinks/(?P<geolink_id>\d+)\.xml'
+
+GEOLINK_URL = re.compile(OEREBLEX_HOST + GEOLINK_PATH)
+
+FAILING_GEOLINK_ID = 999
+
+TITLES = {
+    'de': 'Zonenplan',
+    'it': 'Piano delle zone',
+    'rm': 'Plan da zonas'
+}
+
+
+def write_pyramid_oereb_config(path, host, **oereblex):
+    config = {
+        'pyramid_oereb': {
+            'language': ['de', 'it'],
+            'default_language': 'de',
+            'flavour': ['REDUCED'],
+            'srid': 2056,
+            'oereblex': {
+                'host': host,
+                'version': '1.2.2',
+                'pass_version': True,
+                'validation': True,
+                'language': 'de',
+                'canton': 'GR',
+                'mapping': {
+                    'official_number': 'number',
+                    'abbreviation': 'abbreviation'
+                },
+                'related_decree_as_main': False,
+                'related_notice_as_main': False,
+                'proxy': None
+            },
+            'plrs': [{
+                'code': 'ch.Planungszonen',
+                'language': 'de',
+                'federal': False,
+                'law_status_lookup': [{
+                    'data_code': 'inKraft',
+                    'transfer_code': 'inKraft',
+                    'extract_code': 'inForce'
+                }],
+                'document_types_lookup': [{
+                    'data_code': 'decree',
+                    'transfer_code': 'Rechtsvorschrift',
+                    'extract_code': 'LegalProvision'
+                }, {
+                    'data_code': 'edict',
+                    'transfer_code': 'GesetzlicheGrundlage',
+                    'extract_code': 'Law'
+                }, {
+                    'data_code': 'notice',
+                    'transfer_code': 'Hinweis',
+                    'extract_code': 'Hint'
+                }]
+            }, {
+                'code': 'ch.Nutzungsplanung',
+                'language': 'de',
+                'federal': False,
+                'law_status_lookup': [{
+                    'data_code': 'inKraft',
+                    'transfer_code': 'inKraft',
+                    'extract_code': 'inForce'
+                }],
+                'document_types_lookup': [{
+                    'data_code': 'decree',
+                    'transfer_code': 'Rechtsvorschrift',
+                    'extract_code': 'LegalProvision'
+                }]
+            }]
+        }
+    }
+    config['pyramid_oereb']['oereblex'].update(oereblex)
+    with open(path, 'w') as fh:
+        yaml.safe_dump(config, fh, allow_unicode=True)
+    return str(path)
+
+
+@pytest.fixture
+def pyramid_oereb_config_path(tmp_path):
+    yield write_pyramid_oereb_config(tmp_path / 'pyramid_oereb.yml', OEREBLEX_HOST)
+
+
+def geolink_xml(geolink_id, language):
+    """Renders a geoLink response with one decree for the passed geolink ID and language."""
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<geolinks>'
+        '<document id="{id}" doctype="decree" category="main" federal_level="Gemeinde" '
+        'authority="Gemeinde {language}" authority_url="www.gemeinde.ch/{language}" '
+        'title="{title} {geolink_id}" number="{geolink_id}.{language}" enactment_date="2020-01-01" '
+        'language="{language}" index="1">'
+        '<file category="main" href="/api/attachments/{id}.{language}" title="{title}.pdf"/>'
+        '</document>'
+        '</geolinks>'
+    ).format(id=int(geolink_id) * 10 + 1, geolink_id=geolink_id, language=language, title=TITLES[language])
+
+
+def _geolink_response(request, context):
+    geolink_id = GEOLINK_URL.match(request.url).group('geolink_id')
+    return geolink_xml(geolink_id, request.qs['locale'][0])
+
+
+@pytest.fixture
+def oereblex_mock(requests_mock):
+    requests_mock.get(GEOLINK_URL, text=_geolink_response)
+    yield requests_mock
+
+
+class GeolinkHandler(BaseHTTPRequestHandler):
+    """
+    Serves geoLink responses like ÖREBlex does, including an ETag for conditional requests. Requests for
+    ``FAILING_GEOLINK_ID`` fail.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        match = re.fullmatch(GEOLINK_PATH, url.path)
+        self.server.requests.append(self.path)
+        time.sleep(self.server.delay)
+        if match is None or int(match.group('geolink_id')) == FAILING_GEOLINK_ID:
+            status, body = 500, b'error'
+        else:
+            language = parse_qs(url.query)['locale'][0]
+            status, body = 200, geolink_xml(match.group('geolink_id'), language).encode('utf-8')
+        etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+        if status == 200 and self.headers.get('If-None-Match') == etag:
+            status, body = 304, b''
+        self.server.statuses.append(status)
+        self.send_response(status)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Type', 'application/xml')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def oereblex_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), GeolinkHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.statuses = []
+    server.delay = 0
+    server.url = 'http://127.0.0.1:{}'.format(server.server_address[1])
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def pyramid_oereb_server_config_path(tmp_path, oereblex_server):
+    yield write_pyramid_oereb_config(tmp_path / 'pyramid_oereb_server.yml', oereblex_server.url)
@@ -1,4 +1,5 @@
 import datetime
+import pickle
 import pytest
 
 from pyramid_oereb.core.records.document_types import DocumentTypeRecord
@@ -9,6 +10,9 @@ from pyramid_oereb.core.records.office import OfficeRecord
 from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes import TitelType, TextImWebType, \
     OeREBKRM_V2_0_Amt_Amt, OeREBKRM_V2_0_Dokumente_Dokument, ZustaendigeStelleType
 from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.generators import (
+    canonical_key,
+    content_digest,
+    document_record_to_compact,
     multilingual_text_from_dict,
     fix_url,
     multilingual_uri_from_dict,
@@ -128,3 +132,43 @@ def test_document_record_to_oerebkrmtrsfr(document_record):
     assert dokument.publiziertAb == document_record.published_from
     assert dokument.publiziertBis == document_record.published_until
     assert isinstance(dokument.ZustaendigeStelle, ZustaendigeStelleType)
+
+
+def test_canonical_key(office_record):
+    first = office_record_to_oerebkrmtrsfr(office_record)
+    second = office_record_to_oerebkrmtrsfr(office_record)
+    assert hash(canonical_key(first)) == hash(canonical_key(second))
+    assert canonical_key(first) == canonical_key(second)
+    second.set_Ort('Bern')
+    assert canonical_key(first) != canonical_key(second)
+
+
+def test_document_record_to_oerebkrmtrsfr_identifiers(document_record):
+    dokument, amt = document_record_to_oerebkrmtrsfr(document_record)
+    other_dokument, other_amt = document_record_to_oerebkrmtrsfr(document_record)
+    assert len(dokument.TID) == len(amt.TID) == 64
+    assert dokument.TID == other_dokument.TID
+    assert amt.TID == other_amt.TID == dokument.ZustaendigeStelle.REF
+    assert content_digest(other_amt) != amt.TID
+
+
+def test_document_record_to_compact(document_record):
+    dokument, amt = document_record_to_compact(document_record)
+    assert not hasattr(dokument, '__dict__')
+    assert not hasattr(amt, '__dict__')
+    assert dokument.Titel == (('de', 'Title'),)
+    assert amt.AmtImWeb == (('de', 'https://www.example.com'),)
+    assert dokument.ZustaendigeStelle.REF == amt.TID
+    generated_dokument, generated_amt = document_record_to_oerebkrmtrsfr(document_record)
+    assert dokument.TID == generated_dokument.TID
+    assert amt.TID == generated_amt.TID
+    assert str(dokument.to_oerebkrmtrsfr()) == str(generated_dokument)
+    assert str(amt.to_oerebkrmtrsfr()) == str(generated_amt)
+
+
+def test_compact_pickle(document_record):
+    dokument, amt = document_record_to_compact(document_record)
+    restored = pickle.loads(pickle.dumps(dokument))
+    assert str(restored.to_oerebkrmtrsfr()) == str(dokument.to_oerebkrmtrsfr())
+    assert restored.TID == dokument.TID
+    assert restored.ZustaendigeStelle.REF == amt.TID
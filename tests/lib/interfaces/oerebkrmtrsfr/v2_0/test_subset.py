@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def test_transform_does_not_load_complete_model():
+    code = (
+        'import sys, geolink2oereb.transform, geolink2oereb.cli; '
+        'print("geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes" in sys.modules)'
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.check_output([sys.executable, '-c', code], text=True, env=env)
+    assert output.strip() == 'False'
+
+
+def test_complete_model_uses_subset_classes():
+    import geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0 as v2_0
+    from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0 import classes, subset
+    assert classes.OeREBKRM_V2_0_Amt_Amt is subset.OeREBKRM_V2_0_Amt_Amt
+    assert v2_0.OeREBKRM_V2_0_Amt_Amt is subset.OeREBKRM_V2_0_Amt_Amt
+    assert v2_0.DataSection is classes.DataSection
+    # all classes share the support code of generateDS
+    assert issubclass(classes.DataSection, subset.GeneratedsSuper)
+    assert classes.CurrentSubclassModule_ is subset.CurrentSubclassModule_
+    assert classes.GenerateDSNamespaceDefs_ is subset.GenerateDSNamespaceDefs_
+    with pytest.raises(AttributeError):
+        v2_0.NotAClass
@@ -0,0 +1,115 @@
+import datetime
+import os
+from io import StringIO
+
+import pytest
+from lxml import etree
+
+from pyramid_oereb.core.records.document_types import DocumentTypeRecord
+from pyramid_oereb.core.records.documents import DocumentRecord
+from pyramid_oereb.core.records.law_status import LawStatusRecord
+from pyramid_oereb.core.records.office import OfficeRecord
+
+import geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0 as v2_0
+from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.generators import (
+    document_record_to_compact,
+    document_record_to_oerebkrmtrsfr
+)
+from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.transfer import (
+    TransferWriter,
+    write_transfer,
+    write_transfer_file
+)
+from geolink2oereb.transform import assign_uuids_iter, unify_gathered_iter
+
+NS = {'ili': 'http://www.interlis.ch/INTERLIS2.3'}
+
+XSD_PATH = os.path.join(os.path.dirname(v2_0.__file__), 'OeREBKRMtrsfr_V2_0.xsd')
+
+
+@pytest.fixture
+def document_records():
+    office = OfficeRecord({'de': 'Amt'}, office_at_web={'de': 'www.example.com'})
+    records = [
+        DocumentRecord(
+            DocumentTypeRecord('Rechtsvorschrift', {'de': 'Rechtsvorschrift'}),
+            index,
+            LawStatusRecord('inKraft', {'de': 'Rechtskräftig'}),
+            {'de': 'Titel {}'.format(index)},
+            office,
+            datetime.date(2020, 1, 1),
+            text_at_web={'de': 'https://example.com/{}.pdf'.format(index)}
+        )
+        for index in range(3)
+    ]
+    yield records + records
+
+
+@pytest.fixture
+def gathered(document_records):
+    yield [document_record_to_oerebkrmtrsfr(record) for record in document_records]
+
+
+@pytest.mark.parametrize('translate', [document_record_to_oerebkrmtrsfr, document_record_to_compact])
+def test_write_transfer_is_valid(document_records, translate):
+    gathered = [translate(record) for record in document_records]
+    output = StringIO()
+    write_transfer(output, assign_uuids_iter(unify_gathered_iter(gathered)))
+    schema = etree.XMLSchema(etree.parse(XSD_PATH))
+    transfer = etree.fromstring(output.getvalue().encode('utf-8'))
+    schema.assertValid(transfer)
+    dokumente = transfer.findall(
+        'ili:DATASECTION/ili:OeREBKRM_V2_0.Dokumente/ili:OeREBKRM_V2_0.Dokumente.Dokument', NS
+    )
+    aemter = transfer.findall('ili:DATASECTION/ili:OeREBKRM_V2_0.Amt/ili:OeREBKRM_V2_0.Amt.Amt', NS)
+    assert len(dokumente) == 3
+    assert len(aemter) == 1
+    assert {dokument.find('ili:ZustaendigeStelle', NS).get('REF') for dokument in dokumente} == \
+        {aemter[0].get('TID')}
+
+
+def test_transfer_writer_streams(gathered):
+    output = StringIO()
+    dokument, amt = gathered[0]
+    with TransferWriter(output) as writer:
+        writer.add_amt(amt)
+        writer.write_dokument(dokument)
+        assert 'OeREBKRM_V2_0.Dokumente.Dokument' in output.getvalue()
+        assert 'OeREBKRM_V2_0.Amt.Amt' not in output.getvalue()
+    assert output.getvalue().endswith('</TRANSFER>\n')
+
+
+def test_transfer_writer_not_closed_on_error(gathered):
+    output = StringIO()
+    with pytest.raises(RuntimeError):
+        with TransferWriter(output):
+            raise RuntimeError('failed')
+    assert '</TRANSFER>' not in output.getvalue()
+
+
+def test_transfer_writer_removes_output_on_error(gathered):
+    output = StringIO()
+    output.write('before\n')
+    dokument, amt = gathered[0]
+    with pytest.raises(RuntimeError):
+        with TransferWriter(output) as writer:
+            writer.write_dokument(dokument)
+            raise RuntimeError('failed')
+    assert output.getvalue() == 'before\n'
+
+
+def test_write_transfer_file_keeps_file_on_error(gathered, tmp_path):
+    path = tmp_path / 'transfer.xtf'
+    path.write_text('previous transfer')
+
+    def failing():
+        yield from assign_uuids_iter(unify_gathered_iter(gathered))
+        raise RuntimeError('failed')
+
+    with pytest.raises(RuntimeError):
+        write_transfer_file(str(path), failing())
+    assert path.read_text() == 'previous transfer'
+    assert os.listdir(str(tmp_path)) == ['transfer.xtf']
+    write_transfer_file(str(path), assign_uuids_iter(unify_gathered_iter(gathered)))
+    assert path.read_text().endswith('</TRANSFER>\n')
+    assert os.listdir(str(tmp_path)) == ['transfer.xtf']
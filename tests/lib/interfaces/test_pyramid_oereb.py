@@ -11,7 +11,8 @@ from pyramid_oereb.core.records.office import OfficeRecord
 from geolink2oereb.lib.interfaces.pyramid_oereb import oerebkrm_v2_0_dokument_typ_2_document_type_records, \
     create_document_source, OEREBlexSourceCustom, get_document_type_code_by_extract_value, \
     get_law_status_code_by_extract_value, merge_office, merge_document_type, merge_document, \
-    merge_attribute, make_office_at_web_multilingual
+    merge_attribute, make_office_at_web_multilingual, OEREBlexLoader, load, CodeTranslations, \
+    merge_languages
 
 
 @pytest.fixture
@@ -379,6 +380,32 @@ def test_get_law_status_code_by_extract_value(input, output, pyramid_oereb_confi
     assert result == output
 
 
+def test_code_translations(pyramid_oereb_config, caplog):
+    translations = CodeTranslations(pyramid_oereb_config)
+    assert translations.document_types('CH.PLANUNGSZONEN')['Law'] == 'GesetzlicheGrundlage'
+    assert translations.law_status('ch.Planungszonen')['inForce'] == 'inKraft'
+    records = [
+        DocumentRecord(
+            DocumentTypeRecord(document_type, {}),
+            1,
+            LawStatusRecord('inForce', {}),
+            {'de': 'Titel'},
+            OfficeRecord({'de': 'Amt'}),
+            datetime.date(2020, 1, 1)
+        )
+        for document_type in ['LegalProvision', 'NotConfigured', 'NotConfigured']
+    ]
+    translations.translate(records, 'ch.Planungszonen')
+    assert [record.document_type.code for record in records] == ['Rechtsvorschrift', None, None]
+    assert [record.law_status.code for record in records] == ['inKraft'] * 3
+    with caplog.at_level('WARNING'):
+        unmapped = translations.report_unmapped()
+    assert unmapped == {('document type', 'ch.Planungszonen', 'NotConfigured'): 2}
+    assert len(caplog.records) == 1
+    assert "document type 'NotConfigured' of theme ch.Planungszonen (2 records)" in caplog.text
+    assert not translations.report_unmapped()
+
+
 def test_merge_office_updated_name():
     office_master = OfficeRecord({'de': 'Das ist ein Testname'})
     office_merger = OfficeRecord({'en': 'This is a test name'})
@@ -497,6 +524,34 @@ def test_merge_document():
     assert result.official_number == {'de': 'RPG 1234', 'en': 'legal 1234'}
 
 
+def test_merge_languages():
+    def record(identifier, language):
+        return DocumentRecord(
+            DocumentTypeRecord('Rechtsvorschrift', {}),
+            1,
+            LawStatusRecord('inKraft', {}),
+            {language: '{} {}'.format(identifier, language)},
+            OfficeRecord({language: 'Amt'}),
+            datetime.date(2020, 1, 1),
+            identifier=identifier
+        )
+
+    result, missing = merge_languages(
+        [
+            [record('1/0', 'de'), record('1/1', 'de'), record('2/0', 'de')],
+            [record('2/0', 'it'), record('1/0', 'it'), record('3/0', 'it')],
+        ],
+        ['de', 'it']
+    )
+    assert [item.title for item in result] == [
+        {'de': '1/0 de', 'it': '1/0 it'},
+        {'de': '1/1 de'},
+        {'de': '2/0 de', 'it': '2/0 it'},
+        {'it': '3/0 it'},
+    ]
+    assert missing == {'1/1': ['it'], '3/0': ['de']}
+
+
 def test_make_office_at_web_multilingual_pass():
     office = OfficeRecord(
         {'de': 'Das ist ein Testname'},
@@ -555,3 +610,100 @@ def test_make_office_at_web_multilingual_not_pass():
     )
     result = make_office_at_web_multilingual([document], 'de')
     assert result[0].responsible_office.office_at_web == {'de': 'https://test.de'}
+
+
+def test_oereblex_loader(pyramid_oereb_config_path, oereblex_mock):
+    from pyramid_oereb.core.config import Config
+    loader = OEREBlexLoader(pyramid_oereb_config_path, 'pyramid_oereb')
+    assert loader.source_class is OEREBlexSourceCustom
+    config = Config._config
+    Config._config = None
+    result = loader.load(1, 'ch.Planungszonen')
+    assert Config._config is config
+    assert len(result) == 1
+    assert result[0].document_type.code == 'Rechtsvorschrift'
+    assert result[0].law_status.code == 'inKraft'
+    assert result[0].identifier == '11/0'
+    assert result[0].title == {
+        'de': 'Zonenplan 1 (Zonenplan.pdf)',
+        'it': 'Piano delle zone 1 (Piano delle zone.pdf)'
+    }
+    assert result[0].responsible_office.office_at_web == {
+        'de': 'www.gemeinde.ch/de',
+        'it': 'www.gemeinde.ch/it'
+    }
+    assert Config.get_oereblex_config().get('code') is None
+
+
+def test_load(pyramid_oereb_config_path, oereblex_mock):
+    result = load(1, 'ch.Planungszonen', pyramid_oereb_config_path, 'pyramid_oereb')
+    assert len(result) == 1
+    assert result[0].document_type.code == 'Rechtsvorschrift'
+
+
+def test_load_closes_session(pyramid_oereb_config_path, oereblex_mock):
+    from unittest.mock import patch
+    from geolink2oereb.lib.http import PooledSession
+    with patch.object(PooledSession, 'close', autospec=True) as close:
+        load(1, 'ch.Planungszonen', pyramid_oereb_config_path, 'pyramid_oereb')
+    assert close.call_count == 1
+
+
+def test_oereblex_loader_keeps_passed_session(pyramid_oereb_config_path, oereblex_mock):
+    from unittest.mock import patch
+    from geolink2oereb.lib.http import PooledSession
+    http_session = PooledSession()
+    with patch.object(PooledSession, 'close', autospec=True) as close:
+        with OEREBlexLoader(pyramid_oereb_config_path, 'pyramid_oereb', http_session=http_session) as loader:
+            loader.load(1, 'ch.Planungszonen')
+    close.assert_not_called()
+
+
+def test_oereblex_loader_reads_languages_concurrently(pyramid_oereb_config_path, oereblex_mock):
+    import threading
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierLoader(OEREBlexLoader):
+        def read(self, geolink_id, theme_code, language):
+            # both languages have to be read at the same time to pass the barrier
+            barrier.wait()
+            return super(BarrierLoader, self).read(geolink_id, theme_code, language)
+
+    loader = BarrierLoader(pyramid_oereb_config_path, 'pyramid_oereb')
+    records_per_language = loader.read_languages(1, 'ch.Planungszonen')
+    assert [records[0].title for records in records_per_language] == [
+        {'de': 'Zonenplan 1 (Zonenplan.pdf)'},
+        {'it': 'Piano delle zone 1 (Piano delle zone.pdf)'}
+    ]
+
+
+def test_oereblex_loader_sequential_languages(pyramid_oereb_config_path, oereblex_mock):
+    loader = OEREBlexLoader(pyramid_oereb_config_path, 'pyramid_oereb', language_workers=1)
+    result = loader.load(1, 'ch.Planungszonen')
+    assert len(result) == 1
+    assert set(result[0].title.keys()) == {'de', 'it'}
+    assert oereblex_mock.call_count == 2
+
+
+def test_oereblex_source_custom_shares_parser(source_config):
+    first = create_document_source(
+        dict(source_config), 'ch.Planungszonen', 'de', oereb_lex_document_source_class=OEREBlexSourceCustom
+    )
+    second = create_document_source(
+        dict(source_config), 'ch.Planungszonen', 'it', oereb_lex_document_source_class=OEREBlexSourceCustom
+    )
+    assert first._parser is second._parser
+    assert first._parser.host_url == source_config['host']
+
+
+def test_oereblex_loader_fetched_digest(pyramid_oereb_config_path, oereblex_mock):
+    loader = OEREBlexLoader(pyramid_oereb_config_path, 'pyramid_oereb')
+    fetched = loader.fetch(1, 'ch.Planungszonen')
+    assert [item.language for item in fetched] == ['de', 'it']
+    digest = loader.fetched_digest(fetched, 'ch.Planungszonen')
+    assert digest == loader.fetched_digest(loader.fetch(1, 'ch.Planungszonen'), 'ch.Planungszonen')
+    assert loader.fetched_digest(fetched, 'ch.Nutzungsplanung') != digest
+    changed = [fetched[0], fetched[1]._replace(content=b'<changed/>')]
+    assert loader.fetched_digest(changed, 'ch.Planungszonen') != digest
+    unavailable = [fetched[0]._replace(content=None), fetched[1]]
+    assert loader.fetched_digest(unavailable, 'ch.Planungszonen') is None
@@ -0,0 +1,69 @@
+import json
+import os
+import time
+
+from geolink2oereb.lib.cache import DiskCache, CacheEntry
+
+
+def test_disk_cache_set_get(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    assert cache.get(['host', '1', 'de']) is None
+    last_modified = 'Mon, 01 Jan 2024 00:00:00 GMT'
+    cache.set(['host', '1', 'de'], b'<geolinks/>', etag='"abc"', last_modified=last_modified)
+    entry = cache.get(['host', '1', 'de'])
+    assert isinstance(entry, CacheEntry)
+    assert entry.content == b'<geolinks/>'
+    assert entry.etag == '"abc"'
+    assert entry.last_modified == last_modified
+    assert cache.get(['host', '1', 'it']) is None
+    assert DiskCache(str(tmp_path)).get(['host', '1', 'de']).content == b'<geolinks/>'
+
+
+def test_disk_cache_ttl(tmp_path):
+    cache = DiskCache(str(tmp_path), ttl=60)
+    cache.set(['a'], b'a')
+    path = cache._path(['a'])
+    with open(path + '.json') as fh:
+        meta = json.load(fh)
+    meta['stored_at'] = time.time() - 120
+    with open(path + '.json', 'w') as fh:
+        json.dump(meta, fh)
+    assert cache.get(['a']) is None
+    assert not os.path.exists(path + '.xml')
+
+
+def test_disk_cache_touch_restarts_ttl(tmp_path):
+    cache = DiskCache(str(tmp_path), ttl=60)
+    cache.set(['a'], b'a')
+    stored_at = cache.get(['a']).stored_at
+    time.sleep(0.01)
+    cache.touch(['a'])
+    assert cache.get(['a']).stored_at > stored_at
+
+
+def test_disk_cache_size_eviction(tmp_path):
+    cache = DiskCache(str(tmp_path), max_size=25)
+    for index, key in enumerate(['a', 'b', 'c']):
+        cache.set([key], b'x' * 10)
+        path = cache._path([key])
+        os.utime(path + '.xml', (1000 + index, 1000 + index))
+    cache.set(['d'], b'x' * 10)
+    assert cache.get(['a']) is None
+    assert cache.get(['b']) is None
+    assert cache.get(['c']) is not None
+    assert cache.get(['d']) is not None
+
+
+def test_lru_cache():
+    from geolink2oereb.lib.cache import LRUCache
+    cache = LRUCache(maxsize=2)
+    assert cache.get('a') is None
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    assert cache.stats == {'hits': 2, 'misses': 2, 'evictions': 1, 'size': 2}
+    cache.clear()
+    assert cache.stats['size'] == 0
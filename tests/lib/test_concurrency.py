@@ -0,0 +1,247 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from geolink2oereb.lib.concurrency import AdaptiveLimiter, SingleFlight, ordered_pipeline
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.001)
+
+
+def test_single_flight_shares_result():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return ['document']
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(single_flight.do(('1', 'de'), fetch)))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: single_flight.shared == 2)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == [['document']] * 3
+    assert results[0] is results[1]
+
+
+def test_single_flight_shares_error():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def fetch():
+        release.wait(5)
+        raise RuntimeError('failed')
+
+    def call():
+        try:
+            single_flight.do('key', fetch)
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: single_flight.shared == 1)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(errors) == 2
+
+
+def test_single_flight_calls_again_after_completion():
+    single_flight = SingleFlight()
+    assert single_flight.do('key', lambda: 1) == 1
+    assert single_flight.do('key', lambda: 2) == 2
+    assert single_flight.shared == 0
+
+
+def test_single_flight_async():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def fetch(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value
+
+    async def run():
+        return await asyncio.gather(
+            single_flight.do_async('a', fetch, 1),
+            single_flight.do_async('a', fetch, 1),
+            single_flight.do_async('b', fetch, 2)
+        )
+
+    assert asyncio.run(run()) == [1, 1, 2]
+    assert calls == [1, 2]
+    assert single_flight.shared == 1
+
+
+def test_single_flight_async_error():
+    single_flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise RuntimeError('failed')
+
+    async def run():
+        return await asyncio.gather(
+            single_flight.do_async('a', fetch),
+            single_flight.do_async('a', fetch),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    with pytest.raises(RuntimeError):
+        asyncio.run(single_flight.do_async('a', fetch))
+
+
+def test_single_flight_async_cancel():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            calls.append('cancelled')
+            raise
+
+    async def run():
+        first = asyncio.ensure_future(single_flight.do_async('a', fetch))
+        second = asyncio.ensure_future(single_flight.do_async('a', fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        await asyncio.sleep(0.01)
+        # the call goes on while the second caller waits for it
+        assert calls == []
+        second.cancel()
+        await asyncio.gather(first, second, return_exceptions=True)
+        assert calls == ['cancelled']
+
+    asyncio.run(run())
+
+
+def test_ordered_pipeline_keeps_order():
+    def first(item):
+        time.sleep(0.001 * (10 - item))
+        if item == 3:
+            raise RuntimeError('failed')
+        return item * 2
+
+    results = list(ordered_pipeline(range(10), [(first, 4), (lambda value: value + 1, 2)], queue_size=2))
+    assert [item for item, outcome in results] == list(range(10))
+    assert [value for item, (value, error) in results if error is None] == [
+        item * 2 + 1 for item in range(10) if item != 3
+    ]
+    assert str(results[3][1][1]) == 'failed'
+
+
+def test_ordered_pipeline_runs_stages_at_the_same_time():
+    fetched = threading.Event()
+
+    def fetch(item):
+        if item == 1:
+            fetched.set()
+        return item
+
+    def transform(item):
+        # the first item can only be transformed while the second one is fetched
+        if item == 0:
+            assert fetched.wait(5)
+        return item
+
+    results = list(ordered_pipeline([0, 1], [(fetch, 1), (transform, 1)]))
+    assert [value for item, (value, error) in results] == [0, 1]
+
+
+def test_ordered_pipeline_limits_items_in_flight():
+    taken = []
+    release = threading.Event()
+
+    def items():
+        for item in range(100):
+            taken.append(item)
+            yield item
+
+    pipeline = ordered_pipeline(items(), [(lambda item: release.wait(5) and item, 2)], queue_size=3)
+    thread = threading.Thread(target=lambda: next(pipeline))
+    thread.start()
+    wait_for(lambda: len(taken) == 5)
+    time.sleep(0.05)
+    assert len(taken) == 5
+    release.set()
+    thread.join()
+    pipeline.close()
+
+
+def test_adaptive_limiter_increases_and_decreases():
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=3, target_latency=1)
+    for _ in range(2):
+        limiter.release(limiter.acquire(), 0.1)
+    assert limiter.limit == 2
+    for _ in range(10):
+        limiter.release(limiter.acquire(), 0.1)
+    assert limiter.limit == 3
+    # both requests were started before the cut, so the limit is only cut once
+    first = limiter.acquire()
+    second = limiter.acquire()
+    limiter.release(first, 0.1, overloaded=True)
+    limiter.release(second, 5)
+    assert limiter.limit == 1
+    limiter.release(limiter.acquire(), 5)
+    assert limiter.limit == 1
+
+
+def test_adaptive_limiter_blocks_at_limit():
+    limiter = AdaptiveLimiter(initial_limit=1)
+    token = limiter.acquire()
+    acquired = []
+    thread = threading.Thread(target=lambda: acquired.append(limiter.acquire()))
+    thread.start()
+    time.sleep(0.05)
+    assert acquired == []
+    assert limiter.stats['in_flight'] == 1
+    limiter.release(token, 0.1)
+    thread.join(5)
+    assert len(acquired) == 1
+
+
+def test_adaptive_limiter_call():
+    limiter = AdaptiveLimiter(initial_limit=4)
+    assert limiter.call(lambda value: value, 'result') == 'result'
+
+    def throttled():
+        raise RuntimeError('429')
+
+    with pytest.raises(RuntimeError):
+        limiter.call(throttled, is_overload=lambda error: str(error) == '429')
+    assert limiter.limit == 2
+    assert limiter.stats['in_flight'] == 0
+
+
+def test_adaptive_limiter_stats():
+    limiter = AdaptiveLimiter(initial_limit=4, target_latency=10)
+    assert limiter.stats == {'limit': 4, 'in_flight': 0, 'p50': None, 'p95': None}
+    for latency in range(1, 101):
+        limiter.release(limiter.acquire(), latency / 100)
+    stats = limiter.stats
+    assert stats['p50'] == 0.5
+    assert stats['p95'] == 0.95
@@ -0,0 +1,87 @@
+import time
+
+import pytest
+from requests import ConnectTimeout, HTTPError
+
+from geolink2oereb.lib.http import PooledSession, fetch, is_overload
+
+
+def test_pooled_session_reuses_connections(oereblex_server):
+    session = PooledSession(pool_size=2)
+    url = '{}/api/1.2.2/geolinks/1.xml'.format(oereblex_server.url)
+    for language in ['de', 'it', 'de']:
+        content = fetch(session, url, {'locale': language})
+        assert content.startswith(b'<?xml')
+    assert session.stats == {'requests': 3, 'connections': 1}
+
+
+def test_fetch_without_session(oereblex_server):
+    content = fetch(None, '{}/api/1.2.2/geolinks/1.xml'.format(oereblex_server.url), {'locale': 'de'})
+    assert b'Zonenplan 1' in content
+
+
+def test_fetch_raises(oereblex_server):
+    with pytest.raises(HTTPError):
+        fetch(PooledSession(), '{}/api/1.2.2/geolinks/999.xml'.format(oereblex_server.url), {'locale': 'de'})
+
+
+def test_fetch_revalidates_cached_response(oereblex_server, tmp_path):
+    from geolink2oereb.lib.cache import DiskCache
+    cache = DiskCache(str(tmp_path))
+    session = PooledSession()
+    url = '{}/api/1.2.2/geolinks/1.xml'.format(oereblex_server.url)
+    first = fetch(session, url, {'locale': 'de'}, cache=cache, cache_key=[url, 'de'])
+    second = fetch(session, url, {'locale': 'de'}, cache=cache, cache_key=[url, 'de'])
+    assert first == second
+    assert oereblex_server.statuses == [200, 304]
+
+
+def test_fetch_async_revalidates_cached_response(oereblex_server, tmp_path):
+    import asyncio
+    import threading
+    from geolink2oereb.lib.cache import DiskCache
+    from geolink2oereb.lib.http import create_async_client, fetch_async
+    url = '{}/api/1.2.2/geolinks/1.xml'.format(oereblex_server.url)
+
+    async def fetch_twice():
+        async with create_async_client() as client:
+            return [
+                await fetch_async(client, url, {'locale': 'de'}, cache=cache, cache_key=[url, 'de'])
+                for _ in range(2)
+            ]
+
+    threads = []
+
+    class ThreadRecordingCache(DiskCache):
+        def get(self, key):
+            threads.append(threading.get_ident())
+            return super(ThreadRecordingCache, self).get(key)
+
+    cache = ThreadRecordingCache(str(tmp_path))
+    first, second = asyncio.run(fetch_twice())
+    assert first == second
+    assert oereblex_server.statuses == [200, 304]
+    # the cache files are not read on the thread of the event loop
+    assert threading.get_ident() not in threads
+
+
+def test_record_and_replay(oereblex_server, tmp_path):
+    from geolink2oereb.lib.http import create_recording_session, create_replay_session
+    url = '{}/api/1.2.2/geolinks/1.xml'.format(oereblex_server.url)
+    recorded = fetch(create_recording_session(str(tmp_path)), url, {'locale': 'de'})
+    replay_session = create_replay_session(str(tmp_path), latency=0.05)
+    start = time.monotonic()
+    replayed = fetch(replay_session, url, {'locale': 'de'})
+    assert time.monotonic() - start >= 0.05
+    assert replayed == recorded
+    assert len(oereblex_server.requests) == 1
+    with pytest.raises(HTTPError):
+        fetch(replay_session, url, {'locale': 'it'})
+
+
+def test_is_overload(oereblex_server):
+    with pytest.raises(HTTPError) as excinfo:
+        fetch(None, '{}/api/1.2.2/geolinks/999.xml'.format(oereblex_server.url))
+    assert is_overload(excinfo.value)
+    assert is_overload(ConnectTimeout())
+    assert not is_overload(ValueError())
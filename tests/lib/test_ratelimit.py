@@ -0,0 +1,78 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from geolink2oereb.lib.ratelimit import FileTokenBucket, TokenBucket, get_rate_limiter
+
+
+def test_token_bucket_reserves_future_tokens():
+    with patch('geolink2oereb.lib.ratelimit.time.monotonic', return_value=100.0):
+        bucket = TokenBucket(10, burst=2)
+        delays = [bucket.reserve() for _ in range(4)]
+    assert delays == pytest.approx([0, 0, 0.1, 0.2])
+    with patch('geolink2oereb.lib.ratelimit.time.monotonic', return_value=101.0):
+        # the bucket is refilled up to the burst only
+        assert [bucket.reserve() for _ in range(3)] == pytest.approx([0, 0, 0.1])
+
+
+def test_token_bucket_ignores_system_time():
+    bucket = TokenBucket(10)
+    with patch('geolink2oereb.lib.ratelimit.time.time', return_value=0.0):
+        assert bucket.reserve() == 0
+    with patch('geolink2oereb.lib.ratelimit.time.time', return_value=1e9):
+        # a jump of the system time does not refill the bucket
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+
+
+def test_token_bucket_acquire_async():
+    import asyncio
+    bucket = TokenBucket(20)
+
+    async def acquire():
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire_async()
+        return time.monotonic() - start
+
+    assert asyncio.run(acquire()) >= 0.09
+
+
+def test_token_bucket_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_file_token_bucket_is_shared(tmp_path):
+    path = str(tmp_path / 'oereblex.lock')
+    # two buckets on the same file behave like the buckets of two processes
+    first = FileTokenBucket(10, path=path)
+    second = FileTokenBucket(10, path=path)
+    with patch('geolink2oereb.lib.ratelimit.time.time', return_value=100.0):
+        assert first.reserve() == 0
+        assert second.reserve() == pytest.approx(0.1)
+        assert first.reserve() == pytest.approx(0.2)
+
+
+def test_get_rate_limiter_is_shared_per_host(tmp_path):
+    first = get_rate_limiter('https://oereblex.example.com', 5)
+    assert get_rate_limiter('https://oereblex.example.com', 5) is first
+    assert get_rate_limiter('https://other.example.com', 5) is not first
+    shared = get_rate_limiter('https://oereblex.example.com', 5, lock_file=str(tmp_path / 'lock'))
+    assert isinstance(shared, FileTokenBucket)
+
+
+def test_rate_limit_from_config(tmp_path, oereblex_server):
+    from conftest import write_pyramid_oereb_config
+    from geolink2oereb.transform import Geolink2OerebSession
+    config_path = write_pyramid_oereb_config(
+        tmp_path / 'pyramid_oereb.yml',
+        oereblex_server.url,
+        rate_limit={'requests_per_second': 20, 'lock_file': str(tmp_path / 'oereblex.lock')}
+    )
+    session = Geolink2OerebSession(config_path, 'pyramid_oereb')
+    start = time.monotonic()
+    assert len(session.run_batch([1, 2, 3], 'ch.Planungszonen', max_workers=3)) == 3
+    # six requests with one token at the start and 20 tokens per second
+    assert time.monotonic() - start >= 0.25
+    assert len(oereblex_server.requests) == 6
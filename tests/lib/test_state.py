@@ -0,0 +1,47 @@
+import pickle
+import sqlite3
+
+from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.generators import CompactAmt, CompactDokument, \
+    CompactZustaendigeStelle
+from geolink2oereb.lib.state import SyncState
+
+
+def pairs():
+    amt = CompactAmt(TID='amt', Name=(('de', 'Gemeinde'),))
+    dokument = CompactDokument(
+        TID='dokument', Titel=(('de', 'Titel'),), ZustaendigeStelle=CompactZustaendigeStelle('amt')
+    )
+    return [(dokument, amt)]
+
+
+def content(pairs):
+    return [
+        (dokument.TID, dokument.Titel, dokument.ZustaendigeStelle.REF, amt.TID, amt.Name)
+        for dokument, amt in pairs
+    ]
+
+
+def test_sync_state(tmp_path):
+    path = str(tmp_path / 'state.sqlite')
+    state = SyncState(path)
+    assert state.get('ch.Planungszonen', 1, 'digest') is None
+    state.set('ch.Planungszonen', 1, 'digest', pairs())
+    stored = state.get('ch.Planungszonen', 1, 'digest')
+    assert content(stored) == content(pairs())
+    assert state.get('ch.Planungszonen', 1, 'changed') is None
+    assert state.get('ch.Nutzungsplanung', 1, 'digest') is None
+    assert state.stats == {'unchanged': 1, 'changed': 3}
+    state.close()
+    reopened = pickle.loads(pickle.dumps(SyncState(path)))
+    assert content(reopened.get('ch.Planungszonen', 1, 'digest')) == content(pairs())
+
+
+def test_sync_state_discards_other_versions(tmp_path):
+    path = str(tmp_path / 'state.sqlite')
+    state = SyncState(path)
+    state.set('ch.Planungszonen', 1, 'digest', pairs())
+    state.close()
+    connection = sqlite3.connect(path)
+    connection.execute('PRAGMA user_version = 0')
+    connection.close()
+    assert SyncState(path).get('ch.Planungszonen', 1, 'digest') is None
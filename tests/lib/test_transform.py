@@ -63,8 +63,17 @@ def document_record(office_record, document_type_record, law_status_record):
     )
 
 
+@pytest.fixture(autouse=True)
+def clear_sessions():
+    from geolink2oereb.transform import get_session
+    get_session.cache_clear()
+    yield
+    get_session.cache_clear()
+
+
 def test_run(document_record):
-    with patch('geolink2oereb.lib.interfaces.pyramid_oereb.load', return_value=[document_record]):
+    with patch('geolink2oereb.transform.OEREBlexLoader') as loader_class:
+        loader_class.return_value.load.return_value = [document_record]
         from geolink2oereb.transform import run
         from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes import OeREBKRM_V2_0_Dokumente_Dokument
         result = run(
@@ -130,8 +139,9 @@ def gathered_documents():
     yield [document_merger, document_master]
 
 
-def test_run_batch(gathered_documents):
-    with patch('geolink2oereb.lib.interfaces.pyramid_oereb.load', return_value=gathered_documents):
+def test_run_batch(document_record):
+    with patch('geolink2oereb.transform.OEREBlexLoader') as loader_class:
+        loader_class.return_value.load.return_value = [document_record]
         from geolink2oereb.transform import run_batch
         from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes import (
             OeREBKRM_V2_0_Dokumente_Dokument, OeREBKRM_V2_0_Amt_Amt)
@@ -150,6 +160,197 @@ def test_run_batch(gathered_documents):
         assert isinstance(list(result[1])[1], OeREBKRM_V2_0_Amt_Amt)
 
 
+def test_run_reuses_session(document_record):
+    with patch('geolink2oereb.transform.OEREBlexLoader') as loader_class:
+        loader_class.return_value.load.return_value = [document_record]
+        from geolink2oereb.transform import run, run_batch
+        run(4304, 'ch.Planungszonen', '/a/b/c', 'pyramid_oereb')
+        run(4305, 'ch.Planungszonen', '/a/b/c', 'pyramid_oereb')
+        run_batch([4306, 4307], 'ch.Planungszonen', '/a/b/c', 'pyramid_oereb')
+        assert loader_class.call_count == 1
+        assert loader_class.return_value.load.call_count == 4
+
+
+def test_run_reloads_changed_configuration(document_record, tmp_path):
+    import os
+    config_path = tmp_path / 'pyramid_oereb.yml'
+    config_path.write_text('pyramid_oereb: {}')
+    with patch('geolink2oereb.transform.OEREBlexLoader') as loader_class:
+        loader_class.return_value.load.return_value = [document_record]
+        from geolink2oereb.transform import run
+        run(4304, 'ch.Planungszonen', str(config_path), 'pyramid_oereb')
+        run(4304, 'ch.Planungszonen', str(config_path), 'pyramid_oereb')
+        assert loader_class.call_count == 1
+        stat = os.stat(str(config_path))
+        os.utime(str(config_path), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        run(4304, 'ch.Planungszonen', str(config_path), 'pyramid_oereb')
+        assert loader_class.call_count == 2
+
+
+def test_session_run_batch(pyramid_oereb_config_path, oereblex_mock):
+    from geolink2oereb.transform import Geolink2OerebSession
+    from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes import OeREBKRM_V2_0_Dokumente_Dokument
+    session = Geolink2OerebSession(pyramid_oereb_config_path, 'pyramid_oereb')
+    result = session.run_batch([1, 2], 'ch.Planungszonen')
+    assert len(result) == 2
+    assert isinstance(result[0][0], OeREBKRM_V2_0_Dokumente_Dokument)
+    assert result[0][0].Typ == 'Rechtsvorschrift'
+    assert result[0][0].Rechtsstatus == 'inKraft'
+    assert oereblex_mock.call_count == 4
+
+
+def test_session_run_batch_concurrent_keeps_order(pyramid_oereb_config_path, oereblex_mock):
+    import threading
+    from geolink2oereb.transform import Geolink2OerebSession
+    barrier = threading.Barrier(3, timeout=5)
+
+    class BarrierSession(Geolink2OerebSession):
+        def run(self, geolink_id, theme_code):
+            # all geolinks have to be processed at the same time to pass the barrier
+            barrier.wait()
+            return super(BarrierSession, self).run(geolink_id, theme_code)
+
+    session = BarrierSession(pyramid_oereb_config_path, 'pyramid_oereb')
+    result = session.run_batch([3, 1, 2], 'ch.Planungszonen', max_workers=3)
+    assert [dokument.OffizielleNr.LocalisationCH_V1_MultilingualText.LocalisedText
+            .LocalisationCH_V1_LocalisedText[0].Text for dokument, amt in result] == ['3.de', '1.de', '2.de']
+
+
+def test_session_run_batch_reports_failures(document_record):
+    from geolink2oereb.transform import Geolink2OerebSession, BatchError
+
+    def load(geolink_id, theme_code):
+        if geolink_id == 2:
+            raise RuntimeError('ÖREBlex not available')
+        return [document_record]
+
+    with patch('geolink2oereb.transform.OEREBlexLoader') as loader_class:
+        loader_class.return_value.load.side_effect = load
+        session = Geolink2OerebSession('/a/b/c', 'pyramid_oereb')
+        with pytest.raises(BatchError) as excinfo:
+            session.run_batch([1, 2, 3], 'ch.Planungszonen', max_workers=2)
+    assert list(excinfo.value.errors.keys()) == [2]
+    assert isinstance(excinfo.value.errors[2], RuntimeError)
+    assert len(excinfo.value.gathered) == 2
+
+
+def test_run_batch_concurrent_unify_and_assign(document_record):
+    from geolink2oereb.transform import run_batch, unify_gathered, assign_uuids
+    with patch('geolink2oereb.transform.OEREBlexLoader') as loader_class:
+        loader_class.return_value.load.return_value = [document_record]
+        result = run_batch([1, 2, 3, 4], 'ch.Planungszonen', '/a/b/c', 'pyramid_oereb', max_workers=4)
+    assert len(result) == 4
+    dokumente, aemter = assign_uuids(*unify_gathered(result))
+    assert len(dokumente) == 1
+    assert len(aemter) == 1
+    assert dokumente[0].ZustaendigeStelle.REF == aemter[0].TID
+
+
+def test_session_run_batch_iter_streams(document_record):
+    from geolink2oereb.transform import Geolink2OerebSession, BatchError
+    loaded = []
+
+    def load(geolink_id, theme_code):
+        loaded.append(geolink_id)
+        if geolink_id == 3:
+            raise RuntimeError('ÖREBlex not available')
+        return [document_record]
+
+    with patch('geolink2oereb.transform.OEREBlexLoader') as loader_class:
+        loader_class.return_value.load.side_effect = load
+        session = Geolink2OerebSession('/a/b/c', 'pyramid_oereb')
+        results = session.run_batch_iter([1, 2, 3], 'ch.Planungszonen')
+        next(results)
+        assert loaded == [1]
+        next(results)
+        with pytest.raises(BatchError) as excinfo:
+            next(results)
+    assert loaded == [1, 2, 3]
+    assert list(excinfo.value.errors.keys()) == [3]
+
+
+def test_run_batch_iter_unify_and_assign_streaming(document_record, gathered_documents):
+    from geolink2oereb.transform import run_batch_iter, unify_gathered_iter, assign_uuids_iter
+    with patch('geolink2oereb.transform.OEREBlexLoader') as loader_class:
+        loader_class.return_value.load.return_value = gathered_documents
+        result = list(assign_uuids_iter(unify_gathered_iter(
+            run_batch_iter([1, 2, 3], 'ch.Planungszonen', '/a/b/c', 'pyramid_oereb', max_workers=2)
+        )))
+    assert len(result) == 2
+    (first_dokument, amt), (second_dokument, no_amt) = result
+    assert no_amt is None
+    assert UUID(amt.TID, version=4)
+    assert first_dokument.ZustaendigeStelle.REF == second_dokument.ZustaendigeStelle.REF == amt.TID
+
+
+def test_session_run_async(pyramid_oereb_server_config_path, oereblex_server):
+    import asyncio
+    from geolink2oereb.transform import Geolink2OerebSession
+    from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes import OeREBKRM_V2_0_Dokumente_Dokument
+    session = Geolink2OerebSession(pyramid_oereb_server_config_path, 'pyramid_oereb')
+    result = asyncio.run(session.run_async(1, 'ch.Planungszonen'))
+    assert len(result) == 1
+    assert isinstance(result[0][0], OeREBKRM_V2_0_Dokumente_Dokument)
+    assert result[0][0].Typ == 'Rechtsvorschrift'
+    assert len(result[0][0].Titel.LocalisationCH_V1_MultilingualText.LocalisedText
+               .LocalisationCH_V1_LocalisedText) == 2
+    assert len(oereblex_server.requests) == 2
+
+
+def test_run_batch_async(pyramid_oereb_server_config_path, oereblex_server):
+    import asyncio
+    from geolink2oereb.transform import run_batch_async
+
+    async def collect():
+        return [result async for result in run_batch_async(
+            [1, 2, 3, 4], 'ch.Planungszonen', pyramid_oereb_server_config_path, 'pyramid_oereb', concurrency=2
+        )]
+
+    results = asyncio.run(collect())
+    assert sorted(geolink_id for geolink_id, result in results) == [1, 2, 3, 4]
+    assert all(len(result) == 1 for geolink_id, result in results)
+    assert len(oereblex_server.requests) == 8
+
+
+def test_run_batch_async_reports_failures(pyramid_oereb_server_config_path, oereblex_server):
+    import asyncio
+    from conftest import FAILING_GEOLINK_ID
+    from geolink2oereb.transform import Geolink2OerebSession, BatchError
+    session = Geolink2OerebSession(pyramid_oereb_server_config_path, 'pyramid_oereb')
+    yielded = []
+
+    async def collect():
+        geolink_ids = [1, FAILING_GEOLINK_ID, 2]
+        async for geolink_id, result in session.run_batch_async(geolink_ids, 'ch.Planungszonen'):
+            yielded.append(geolink_id)
+
+    with pytest.raises(BatchError) as excinfo:
+        asyncio.run(collect())
+    assert sorted(yielded) == [1, 2]
+    assert list(excinfo.value.errors.keys()) == [FAILING_GEOLINK_ID]
+    assert excinfo.value.gathered == []
+
+
+def test_run_batch_async_stops_early(pyramid_oereb_server_config_path, oereblex_server):
+    import asyncio
+    from geolink2oereb.transform import Geolink2OerebSession
+    session = Geolink2OerebSession(pyramid_oereb_server_config_path, 'pyramid_oereb')
+    oereblex_server.delay = 0.1
+
+    async def first():
+        results = session.run_batch_async(range(1, 21), 'ch.Planungszonen', concurrency=2)
+        async for result in results:
+            break
+        await results.aclose()
+        return result, asyncio.all_tasks() - {asyncio.current_task()}
+
+    (geolink_id, result), remaining = asyncio.run(first())
+    assert len(result) == 1
+    # the geolink still in progress was cancelled and no further geolinks were started
+    assert remaining == set()
+    assert len(oereblex_server.requests) <= 4
+
+
 @pytest.fixture
 def gathered_oerebkrm(gathered_documents):
     from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.generators import document_record_to_oerebkrmtrsfr
@@ -167,6 +368,15 @@ def test_unify_gathered(gathered_oerebkrm):
     assert len(list(result)[1]) == 1
 
 
+def test_unify_gathered_keeps_order(gathered_documents):
+    from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.generators import document_record_to_oerebkrmtrsfr
+    from geolink2oereb.transform import unify_gathered
+    gathered = [document_record_to_oerebkrmtrsfr(record) for record in gathered_documents * 3]
+    unique_dokumente, unique_aemter = unify_gathered(gathered)
+    assert [dokument.TID for dokument in unique_dokumente] == [dokument.TID for dokument, amt in gathered[:2]]
+    assert [str(amt) for amt in unique_aemter] == [str(gathered[0][1])]
+
+
 def test_assign_uuids(gathered_oerebkrm):
     from geolink2oereb.transform import unify_gathered, assign_uuids
     result = assign_uuids(*unify_gathered(gathered_oerebkrm))
@@ -178,3 +388,216 @@ def test_assign_uuids(gathered_oerebkrm):
     assert UUID(list(result)[0][1].TID, version=4)
     assert list(result)[0][0].ZustaendigeStelle.REF == list(result)[1][0].TID
     assert list(result)[0][1].ZustaendigeStelle.REF == list(result)[1][0].TID
+
+
+def test_assign_uuids_drops_dokumente_without_amt(gathered_documents):
+    from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.generators import document_record_to_oerebkrmtrsfr
+    from geolink2oereb.transform import unify_gathered, assign_uuids
+    unique_dokumente, unique_aemter = unify_gathered(
+        [document_record_to_oerebkrmtrsfr(record) for record in gathered_documents]
+    )
+    unique_dokumente[1].ZustaendigeStelle.set_REF('unknown')
+    uuid_dokumente, uuid_aemter = assign_uuids(unique_dokumente, unique_aemter)
+    assert uuid_dokumente == [unique_dokumente[0]]
+    assert uuid_dokumente[0].ZustaendigeStelle.REF == uuid_aemter[0].TID
+
+
+def test_assign_uuids_namespace(gathered_documents):
+    from uuid import NAMESPACE_URL
+    from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.generators import document_record_to_oerebkrmtrsfr
+    from geolink2oereb.transform import unify_gathered, assign_uuids
+
+    def assign():
+        gathered = [document_record_to_oerebkrmtrsfr(record) for record in gathered_documents]
+        return assign_uuids(*unify_gathered(gathered), namespace=str(NAMESPACE_URL))
+
+    first_dokumente, first_aemter = assign()
+    second_dokumente, second_aemter = assign()
+    assert UUID(first_aemter[0].TID).version == 5
+    assert [dokument.TID for dokument in first_dokumente] == [dokument.TID for dokument in second_dokumente]
+    assert first_aemter[0].TID == second_aemter[0].TID == first_dokumente[0].ZustaendigeStelle.REF
+
+
+def test_session_run_batch_shares_connections(pyramid_oereb_server_config_path, oereblex_server):
+    from geolink2oereb.transform import Geolink2OerebSession
+    session = Geolink2OerebSession(pyramid_oereb_server_config_path, 'pyramid_oereb', pool_size=2)
+    result = session.run_batch([1, 2, 3], 'ch.Planungszonen')
+    assert len(result) == 3
+    stats = session.loader.http_session.stats
+    assert stats['requests'] == 6
+    assert stats['connections'] <= 2
+
+
+def test_session_run_batch_with_cache(pyramid_oereb_server_config_path, oereblex_server, tmp_path):
+    from geolink2oereb.lib.cache import DiskCache
+    from geolink2oereb.transform import Geolink2OerebSession
+    cache = DiskCache(str(tmp_path / 'cache'))
+    first = Geolink2OerebSession(pyramid_oereb_server_config_path, 'pyramid_oereb', cache=cache)
+    assert len(first.run_batch([1, 2], 'ch.Planungszonen')) == 2
+    second = Geolink2OerebSession(pyramid_oereb_server_config_path, 'pyramid_oereb', cache=cache)
+    assert len(second.run_batch([1, 2], 'ch.Planungszonen')) == 2
+    assert oereblex_server.statuses == [200] * 4 + [304] * 4
+
+
+def test_session_document_cache_across_themes(pyramid_oereb_server_config_path, oereblex_server):
+    from geolink2oereb.transform import Geolink2OerebSession
+    session = Geolink2OerebSession(pyramid_oereb_server_config_path, 'pyramid_oereb', document_cache_size=10)
+    first = session.run(1, 'ch.Planungszonen')
+    second = session.run(1, 'ch.Nutzungsplanung')
+    assert len(first) == len(second) == 1
+    assert first[0][0].Typ == second[0][0].Typ == 'Rechtsvorschrift'
+    assert len(oereblex_server.requests) == 2
+    assert session.document_cache.stats == {'hits': 2, 'misses': 2, 'evictions': 0, 'size': 2}
+
+
+def test_session_document_cache_async(pyramid_oereb_server_config_path, oereblex_server):
+    import asyncio
+    from geolink2oereb.transform import Geolink2OerebSession
+    session = Geolink2OerebSession(pyramid_oereb_server_config_path, 'pyramid_oereb', document_cache_size=10)
+
+    async def run_themes():
+        return [await session.run_async(1, theme) for theme in ['ch.Planungszonen', 'ch.Nutzungsplanung']]
+
+    first, second = asyncio.run(run_themes())
+    assert len(first) == len(second) == 1
+    assert len(oereblex_server.requests) == 2
+    assert session.document_cache.stats['hits'] == 2
+
+
+def test_session_run_batch_single_flight(pyramid_oereb_server_config_path, oereblex_server):
+    from geolink2oereb.transform import Geolink2OerebSession
+    oereblex_server.delay = 0.2
+    session = Geolink2OerebSession(pyramid_oereb_server_config_path, 'pyramid_oereb')
+    result = session.run_batch([1, 1, 1], 'ch.Planungszonen', max_workers=3)
+    assert len(result) == 3
+    assert len(oereblex_server.requests) == 2
+    assert session.loader.single_flight.shared == 4
+
+
+def test_session_run_batch_replay(pyramid_oereb_server_config_path, oereblex_server, tmp_path):
+    from geolink2oereb.lib.http import create_recording_session, create_replay_session
+    from geolink2oereb.transform import Geolink2OerebSession
+    recording = str(tmp_path / 'recording')
+    recorder = Geolink2OerebSession(
+        pyramid_oereb_server_config_path,
+        'pyramid_oereb',
+        http_session=create_recording_session(recording)
+    )
+    recorded = recorder.run_batch([1, 2], 'ch.Planungszonen')
+    oereblex_server.shutdown()
+    replayer = Geolink2OerebSession(
+        pyramid_oereb_server_config_path,
+        'pyramid_oereb',
+        http_session=create_replay_session(recording)
+    )
+    replayed = replayer.run_batch([1, 2], 'ch.Planungszonen', max_workers=2)
+    assert len(oereblex_server.requests) == 4
+    assert [dokument.TextImWeb for dokument, amt in replayed] == \
+        [dokument.TextImWeb for dokument, amt in recorded]
+
+
+def test_session_run_batch_processes(pyramid_oereb_server_config_path, oereblex_server):
+    from conftest import FAILING_GEOLINK_ID
+    from geolink2oereb.transform import Geolink2OerebSession, BatchError
+    from geolink2oereb.lib.interfaces.oerebkrmtrsfr.v2_0.classes import OeREBKRM_V2_0_Dokumente_Dokument
+    session = Geolink2OerebSession(pyramid_oereb_server_config_path, 'pyramid_oereb')
+    geolink_ids = [1, 2, FAILING_GEOLINK_ID, 3, 4]
+    with pytest.raises(BatchError) as excinfo:
+        session.run_batch(geolink_ids, 'ch.Planungszonen', processes=2, chunk_size=2)
+    assert list(excinfo.value.errors.keys()) == [FAILING_GEOLINK_ID]
+    gathered = excinfo.value.gathered
+    assert all(isinstance(dokument, OeREBKRM_V2_0_Dokumente_Dokument) for dokument, amt in gathered)
+    expected = session.run_batch([1, 2, 3, 4], 'ch.Planungszonen')
+    assert [dokument.TID for dokument, amt in gathered] == [dokument.TID for dokument, amt in expected]
+
+
+def test_session_run_pipeline(pyramid_oereb_server_config_path, oereblex_server):
+    from conftest import FAILING_GEOLINK_ID
+    from geolink2oereb.transform import Geolink2OerebSession, BatchError
+    session = Geolink2OerebSession(pyramid_oereb_server_config_path, 'pyramid_oereb', compact=True)
+    gathered = []
+    with pytest.raises(BatchError) as excinfo:
+        gathered.extend(session.run_pipeline(
+            [1, 2, FAILING_GEOLINK_ID, 3, 4], 'ch.Planungszonen', fetch_workers=3, queue_size=1
+        ))
+    assert list(excinfo.value.errors.keys()) == [FAILING_GEOLINK_ID]
+    expected = session.run_batch([1, 2, 3, 4], 'ch.Planungszonen')
+    assert [dokument.TID for dokument, amt in gathered] == [dokument.TID for dokument, amt in expected]
+
+
+def test_session_adaptive_limiter(pyramid_oereb_server_config_path, oereblex_server):
+    from conftest import FAILING_GEOLINK_ID
+    from geolink2oereb.lib.concurrency import AdaptiveLimiter
+    from geolink2oereb.transform import Geolink2OerebSession, BatchError
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=8)
+    session = Geolink2OerebSession(pyramid_oereb_server_config_path, 'pyramid_oereb', limiter=limiter)
+    with pytest.raises(BatchError):
+        session.run_batch([1, FAILING_GEOLINK_ID], 'ch.Planungszonen', max_workers=2)
+    stats = limiter.stats
+    # the 500 response of the failing geolink cuts the limit
+    assert stats['limit'] < 4
+    assert stats['in_flight'] == 0
+    assert stats['p50'] is not None
+
+
+def test_session_adaptive_limiter_timeout(oereblex_server, tmp_path):
+    import requests
+    from conftest import write_pyramid_oereb_config
+    from geolink2oereb.lib.concurrency import AdaptiveLimiter
+    from geolink2oereb.transform import Geolink2OerebSession, BatchError
+    config_path = write_pyramid_oereb_config(tmp_path / 'timeout.yml', oereblex_server.url, timeout=0.1)
+    oereblex_server.delay = 0.5
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=8, target_latency=5)
+    session = Geolink2OerebSession(config_path, 'pyramid_oereb', limiter=limiter)
+    with pytest.raises(BatchError) as excinfo:
+        session.run_batch([1], 'ch.Planungszonen')
+    assert isinstance(excinfo.value.errors[1], requests.Timeout)
+    # the stalled server cuts the limit like an overload response
+    assert limiter.stats['limit'] < 4
+
+
+def test_session_incremental(pyramid_oereb_server_config_path, oereblex_server, tmp_path):
+    from conftest import TITLES
+    from geolink2oereb.lib.interfaces.pyramid_oereb import OEREBlexSourceCustom
+    from geolink2oereb.lib.state import SyncState
+    from geolink2oereb.transform import Geolink2OerebSession
+    state = SyncState(str(tmp_path / 'state.sqlite'))
+    first = Geolink2OerebSession(pyramid_oereb_server_config_path, 'pyramid_oereb', compact=True, state=state)
+    expected = first.run_batch([1, 2], 'ch.Planungszonen')
+    assert state.stats == {'unchanged': 0, 'changed': 2}
+    second = Geolink2OerebSession(
+        pyramid_oereb_server_config_path, 'pyramid_oereb', compact=True, state=state
+    )
+    with patch.object(OEREBlexSourceCustom, '_parse') as parse, \
+            patch('geolink2oereb.lib.interfaces.pyramid_oereb.merge_languages') as merge, \
+            patch('geolink2oereb.transform.document_record_to_compact') as translate:
+        result = second.run_batch([1, 2], 'ch.Planungszonen')
+    # unchanged responses are neither parsed nor merged nor translated
+    parse.assert_not_called()
+    merge.assert_not_called()
+    translate.assert_not_called()
+    # the TIDs are digests of the content
+    assert [(dokument.TID, amt.TID) for dokument, amt in result] == \
+        [(dokument.TID, amt.TID) for dokument, amt in expected]
+    assert state.stats == {'unchanged': 2, 'changed': 2}
+    with patch.dict(TITLES, it='Piano'):
+        changed = second.run_batch([1, 2], 'ch.Planungszonen')
+    assert state.stats == {'unchanged': 2, 'changed': 4}
+    assert changed[0][0].TID != expected[0][0].TID
+
+
+def test_session_incremental_async(pyramid_oereb_server_config_path, oereblex_server, tmp_path):
+    import asyncio
+    from geolink2oereb.lib.interfaces.pyramid_oereb import OEREBlexSourceCustom
+    from geolink2oereb.lib.state import SyncState
+    from geolink2oereb.transform import Geolink2OerebSession
+    state = SyncState(str(tmp_path / 'state.sqlite'))
+    session = Geolink2OerebSession(
+        pyramid_oereb_server_config_path, 'pyramid_oereb', compact=True, state=state
+    )
+    expected = asyncio.run(session.run_async(1, 'ch.Planungszonen'))
+    with patch.object(OEREBlexSourceCustom, '_parse') as parse:
+        result = asyncio.run(session.run_async(1, 'ch.Planungszonen'))
+    parse.assert_not_called()
+    assert [dokument.TID for dokument, amt in result] == [dokument.TID for dokument, amt in expected]
+    assert state.stats == {'unchanged': 1, 'changed': 1}
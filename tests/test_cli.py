@@ -0,0 +1,132 @@
+import sys
+from unittest.mock import patch
+
+import pytest
+from lxml import etree
+
+from geolink2oereb.cli import geolink2oereb
+
+
+def run_cli(*args):
+    with patch.object(sys, 'argv', ['load_documents'] + list(args)):
+        geolink2oereb()
+
+
+def test_cli_writes_transfer(pyramid_oereb_server_config_path, oereblex_server, tmp_path):
+    outfile = tmp_path / 'transfer.xtf'
+    run_cli(
+        '-l', '1',
+        '-t', 'ch.Planungszonen',
+        '-p', pyramid_oereb_server_config_path,
+        '-o', str(outfile),
+        '--uuid-namespace', '6ba7b811-9dad-11d1-80b4-00c04fd430c8'
+    )
+    transfer = etree.parse(str(outfile)).getroot()
+    assert etree.QName(transfer).localname == 'TRANSFER'
+    ns = {'ili': 'http://www.interlis.ch/INTERLIS2.3'}
+    assert len(transfer.findall('.//ili:OeREBKRM_V2_0.Dokumente.Dokument', ns)) == 1
+    assert len(transfer.findall('.//ili:OeREBKRM_V2_0.Amt.Amt', ns)) == 1
+
+
+def test_cli_batch_from_file_and_stdin(pyramid_oereb_server_config_path, oereblex_server, tmp_path):
+    import io
+    ids_file = tmp_path / 'ids.txt'
+    ids_file.write_text('# geolinks\n2\n\n3\n1\n')
+    outfile = tmp_path / 'transfer.xtf'
+    with patch.object(sys, 'stdin', io.StringIO('4\n2\n')):
+        run_cli(
+            '-l', '1',
+            '-f', str(ids_file),
+            '-t', 'ch.Planungszonen',
+            '-p', pyramid_oereb_server_config_path,
+            '-o', str(outfile),
+            '--workers', '3'
+        )
+    transfer = etree.parse(str(outfile)).getroot()
+    ns = {'ili': 'http://www.interlis.ch/INTERLIS2.3'}
+    numbers = [
+        text.text for text in transfer.findall(
+            './/ili:OeREBKRM_V2_0.Dokumente.Dokument/ili:OffizielleNr//ili:Text', ns
+        )
+    ]
+    assert numbers[::2] == ['1.de', '2.de', '3.de']
+    # all geolinks share the same office
+    assert len(transfer.findall('.//ili:OeREBKRM_V2_0.Amt.Amt', ns)) == 1
+    assert len(oereblex_server.requests) == 6
+
+    with patch.object(sys, 'stdin', io.StringIO('4\n2\n')):
+        run_cli(
+            '-f', '-',
+            '-t', 'ch.Planungszonen',
+            '-p', pyramid_oereb_server_config_path,
+            '-o', str(outfile)
+        )
+    transfer = etree.parse(str(outfile)).getroot()
+    assert len(transfer.findall('.//ili:OeREBKRM_V2_0.Dokumente.Dokument', ns)) == 2
+
+
+def test_cli_pipeline_writes_same_transfer(pyramid_oereb_server_config_path, oereblex_server, tmp_path):
+    outputs = []
+    for mode in ([], ['--transform-workers', '1', '--queue-size', '2']):
+        outfile = tmp_path / 'transfer{}.xtf'.format(len(outputs))
+        run_cli(
+            '-l', '1', '-l', '2', '-l', '3',
+            '-t', 'ch.Planungszonen',
+            '-p', pyramid_oereb_server_config_path,
+            '-o', str(outfile),
+            '--workers', '2',
+            '--uuid-namespace', '6ba7b811-9dad-11d1-80b4-00c04fd430c8',
+            *mode
+        )
+        outputs.append(outfile.read_text())
+    assert outputs[0] == outputs[1]
+
+
+def test_cli_incremental(pyramid_oereb_server_config_path, oereblex_server, tmp_path):
+    outputs = []
+    for _ in range(2):
+        outfile = tmp_path / 'transfer{}.xtf'.format(len(outputs))
+        run_cli(
+            '-l', '1', '-l', '2',
+            '-t', 'ch.Planungszonen',
+            '-p', pyramid_oereb_server_config_path,
+            '-o', str(outfile),
+            '--incremental',
+            '--state-file', str(tmp_path / 'state.sqlite'),
+            '--uuid-namespace', '6ba7b811-9dad-11d1-80b4-00c04fd430c8'
+        )
+        outputs.append(outfile.read_text())
+    assert outputs[0] == outputs[1]
+
+
+def test_cli_failed_id_keeps_outfile(pyramid_oereb_server_config_path, oereblex_server, tmp_path):
+    from conftest import FAILING_GEOLINK_ID
+    outfile = tmp_path / 'transfer.xtf'
+    outfile.write_text('previous transfer')
+    with pytest.raises(SystemExit) as excinfo:
+        run_cli(
+            '-l', '1', '-l', str(FAILING_GEOLINK_ID), '-l', '2',
+            '-t', 'ch.Planungszonen',
+            '-p', pyramid_oereb_server_config_path,
+            '-o', str(outfile)
+        )
+    assert excinfo.value.code == 1
+    assert outfile.read_text() == 'previous transfer'
+    assert [path.name for path in tmp_path.iterdir() if path.name.startswith('.transfer')] == []
+
+
+def test_cli_skip_failed(pyramid_oereb_server_config_path, oereblex_server, tmp_path):
+    from conftest import FAILING_GEOLINK_ID
+    outfile = tmp_path / 'transfer.xtf'
+    with pytest.raises(SystemExit) as excinfo:
+        run_cli(
+            '-l', '1', '-l', str(FAILING_GEOLINK_ID), '-l', '2',
+            '-t', 'ch.Planungszonen',
+            '-p', pyramid_oereb_server_config_path,
+            '-o', str(outfile),
+            '--skip-failed'
+        )
+    assert excinfo.value.code == 1
+    transfer = etree.parse(str(outfile)).getroot()
+    ns = {'ili': 'http://www.interlis.ch/INTERLIS2.3'}
+    assert len(transfer.findall('.//ili:OeREBKRM_V2_0.Dokumente.Dokument', ns)) == 2